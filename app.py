@@ -2,6 +2,8 @@
 
 import streamlit as st
 from utils.page_config import PAGE_CONFIG
+from utils.warmup import start_cache_warmup
+from utils.search_index import show_search_box
 
 # ---- Page Configuration and Sidebar Logo ----
 st.set_page_config(page_title="James Bond Visualizations", layout="wide", initial_sidebar_state="expanded")
@@ -13,8 +15,15 @@ st.sidebar.title("Page Navigation")
 
 page_select = st.sidebar.radio(
     "What would you like to explore?",
-    list(PAGE_CONFIG.keys()))
+    list(PAGE_CONFIG.keys()),
+    key="page_select")
+
+# ---- Global search over all entities ----
+show_search_box()
 
 # ---- Page routing ----
 if page_select in PAGE_CONFIG:
     PAGE_CONFIG[page_select]()
+
+# ---- Fill the caches of all pages in the background (once per server process, after the first page is rendered) ----
+start_cache_warmup()
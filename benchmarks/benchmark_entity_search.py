@@ -0,0 +1,52 @@
+# benchmark_entity_search.py
+
+import os
+import sys
+import time
+from pathlib import Path
+import pandas as pd
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+from utils.knowledge_store import read_knowledge_store
+from utils.search_index import SearchIndex, store_entities, normalize
+
+"""
+This file compares the global search index (utils/search_index.py) with filtering a DataFrame of all entity names
+with str.contains, as the pages do today. The entities of the knowledge store are replicated (with a numbered
+suffix) to simulate a growing dataset.
+    -> Output: build time and mean time per query of both variants per dataset size on stdout
+Usage: python benchmarks/benchmark_entity_search.py
+"""
+
+QUERIES = ["sky", "goldfinger", "goldfingr", "im angesicht", "connery", "aston martin", "jaws", "istanbul", "q"]
+COPIES = [1, 10, 100]
+REPEAT = 20
+
+
+def time_per_query(search):
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        for query in QUERIES:
+            search(query)
+    return (time.perf_counter() - start) / (REPEAT * len(QUERIES)) * 1000
+
+
+if __name__ == "__main__":
+    os.chdir(project_root)
+    entities = list(store_entities(read_knowledge_store(project_root)))
+
+    for copies in COPIES:
+        scaled = [(kind, name if i == 0 else f"{name} {i}", aliases, detail)
+                  for i in range(copies) for kind, name, aliases, detail in entities]
+
+        start = time.perf_counter()
+        index = SearchIndex(scaled)
+        build = time.perf_counter() - start
+
+        names = pd.Series([normalize(" ".join([name, *aliases])) for _, name, aliases, _ in scaled])
+        dataframe_ms = time_per_query(lambda q: names[names.str.contains(normalize(q), regex=False)])
+        index_ms = time_per_query(index.search)
+
+        print(f"{len(scaled):>7} entities: index build {build:.2f}s | "
+              f"index {index_ms:.3f} ms/query | str.contains {dataframe_ms:.3f} ms/query")
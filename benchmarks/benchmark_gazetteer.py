@@ -0,0 +1,76 @@
+# benchmark_gazetteer.py
+
+import random
+import string
+import sys
+import tempfile
+import time
+from pathlib import Path
+import pandas as pd
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+from utils.gazetteer import Gazetteer, GEONAMES_COLUMNS
+from utils.geocoding import NOMINATIM_INTERVAL
+
+"""
+This file measures the offline gazetteer geocoder (utils/gazetteer.py): load time of a GeoNames file, forward
+lookups of the film location names and reverse lookups (the KD-tree they need is built first and timed separately).
+Without an argument a synthetic GeoNames file is written (the places of all_movies_geocoded.csv plus random filler
+places), so the benchmark runs without downloads.
+    -> Input: optional path of a GeoNames dump (e.g. data/gazetteer/cities15000.txt)
+    -> Output: load time and lookups per second on stdout, compared with Nominatim's 1 request/s
+Usage: python benchmarks/benchmark_gazetteer.py [path/to/geonames.txt]
+"""
+
+FILLER_PLACES = 200_000
+REPEAT = 20
+
+
+def write_synthetic_gazetteer(path, locations):
+    rng = random.Random(0)
+    rows = [(name, lat, lon) for name, lat, lon in locations[['name', 'lat', 'lon']].drop_duplicates('name').itertuples(index=False)]
+    rows += [("".join(rng.choices(string.ascii_lowercase, k=8)).title(), rng.uniform(-80, 80), rng.uniform(-180, 180))
+             for _ in range(FILLER_PLACES)]
+    gazetteer = pd.DataFrame({column: "" for column in GEONAMES_COLUMNS}, index=range(len(rows)))
+    gazetteer["geonameid"] = range(len(rows))
+    gazetteer["name"] = gazetteer["asciiname"] = [" ".join(str(name).split()) for name, _, _ in rows]
+    gazetteer["latitude"] = [lat for _, lat, _ in rows]
+    gazetteer["longitude"] = [lon for _, _, lon in rows]
+    gazetteer["feature_class"] = "P"
+    gazetteer["population"] = [rng.randint(0, 10**6) for _ in rows]
+    gazetteer.to_csv(path, sep="\t", header=False, index=False)
+
+
+if __name__ == "__main__":
+    locations = pd.read_csv(project_root / "extract_knowledge/geocoded_locations/all_movies_geocoded.csv")
+    names = list(locations['name'])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if len(sys.argv) > 1:
+            path = Path(sys.argv[1])
+        else:
+            path = Path(tmp) / "synthetic_geonames.txt"
+            write_synthetic_gazetteer(path, locations)
+
+        start = time.perf_counter()
+        gazetteer = Gazetteer.from_file(path)
+        load = time.perf_counter() - start
+
+    start = time.perf_counter()
+    found = sum(gazetteer.geocode(name) is not None for name in names * REPEAT) // REPEAT
+    forward = len(names) * REPEAT / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    gazetteer.tree  # built on the first reverse lookup
+    tree = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for lat, lon in zip(locations['lat'], locations['lon']):
+        gazetteer.reverse(lat, lon)
+    reverse = len(locations) / (time.perf_counter() - start)
+
+    print(f"{len(gazetteer)} places, {len(gazetteer.keys)} names, loaded in {load:.1f}s")
+    print(f"forward: {forward:,.0f} names/s ({found} of {len(names)} film location names found)")
+    print(f"reverse: {reverse:,.0f} points/s (KD-tree built in {tree:.2f}s)")
+    print(f"Nominatim: {1 / NOMINATIM_INTERVAL:.0f} name/s, {len(names) * NOMINATIM_INTERVAL:.0f}s for all names")
@@ -0,0 +1,48 @@
+# benchmark_geocode_cache.py
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+import pandas as pd
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+from utils.geocoding import CachedGeocoder, LocalGeocoder, NOMINATIM_INTERVAL
+
+"""
+This file measures the geocoding of stage d (data_pipeline/d_extract_locations_all_movies.py) with the persistent
+cache of utils/geocoding.py against the previous approach (one Nominatim request per place and movie).
+A LocalGeocoder with the places of all_movies_geocoded.csv stands in for Nominatim, so no network is needed;
+the rate limit is set to 0 for the measurement and the time Nominatim's 1 request/s policy would add is projected.
+    -> Input: extract_knowledge/geocoded_locations/all_movies_geocoded.csv
+    -> Output: provider requests and projected wall time per variant on stdout
+Usage: python benchmarks/benchmark_geocode_cache.py
+"""
+
+ROUND_TRIP = 0.002  # simulated provider latency in seconds
+
+
+def run(geocoder, places_by_movie):
+    start = time.perf_counter()
+    geocoder.geocode_all([name for names in places_by_movie.values() for name in names])
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    df = pd.read_csv(project_root / "extract_knowledge/geocoded_locations/all_movies_geocoded.csv")
+    places = dict(zip(df["name"], zip(df["lat"], df["lon"])))
+    places_by_movie = df.groupby("movie", sort=False)["name"].apply(list).to_dict()
+    rows = sum(len(names) for names in places_by_movie.values())
+
+    print(f"{rows} places in {len(places_by_movie)} movies, {len(places)} distinct names")
+    print(f"without cache:  {rows} requests, ~{rows * NOMINATIM_INTERVAL:.0f}s at 1 request/s")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        provider = LocalGeocoder(places, delay=ROUND_TRIP)
+        for label in ["first run", "re-run"]:
+            geocoder = CachedGeocoder(provider, "stand-in", path=Path(tmp) / "geocodes.sqlite", min_interval=0)
+            seconds = run(geocoder, places_by_movie)
+            calls = geocoder.stats["provider_calls"]
+            print(f"{label + ':':<15} {calls} requests, ~{calls * NOMINATIM_INTERVAL + seconds:.1f}s at 1 request/s "
+                  f"({seconds:.3f}s measured)")
@@ -0,0 +1,79 @@
+# benchmark_image_cache.py
+
+import sys
+import tempfile
+import threading
+import time
+from functools import partial
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+from pathlib import Path
+import numpy as np
+import requests
+from PIL import Image
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+from utils.image_cache import cached_image_path, CARD_WIDTH
+
+"""
+This file measures the local image proxy (utils/image_cache.py) against a local file server standing in for Fandom.
+It writes full-resolution test images (noise, similar in size to the piprop=original profile images) to a temp
+directory, serves them with http.server and requests every image three times through the cache:
+    1. cold: download + resize + write to the content-addressed cache
+    2. warm: served from the disk cache
+    3. direct download of the original (what every browser did before)
+    -> Output: bytes per card and time per image of each variant on stdout
+Usage: python benchmarks/benchmark_image_cache.py [number_of_images]
+"""
+
+ORIGINAL_SIZE = (1200, 1600)
+
+
+# ---- Test images and local file server ----
+def write_test_images(directory, count):
+    rng = np.random.default_rng(0)
+    for i in range(count):
+        # Smooth gradient plus noise, compresses like a photo rather than like a flat colour
+        gradient = np.linspace(0, 255, ORIGINAL_SIZE[0] * ORIGINAL_SIZE[1] * 3).reshape(ORIGINAL_SIZE[1], ORIGINAL_SIZE[0], 3)
+        pixels = (gradient + rng.normal(0, 20, gradient.shape)).clip(0, 255).astype(np.uint8)
+        Image.fromarray(pixels).save(Path(directory) / f"image_{i}.png")
+
+
+def start_file_server(directory):
+    class QuietHandler(SimpleHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), partial(QuietHandler, directory=directory))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+    with tempfile.TemporaryDirectory() as source_dir, tempfile.TemporaryDirectory() as cache_dir:
+        write_test_images(source_dir, count)
+        server = start_file_server(source_dir)
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+        urls = [f"{base_url}/image_{i}.png" for i in range(count)]
+
+        start = time.perf_counter()
+        original_bytes = sum(len(requests.get(url, timeout=10).content) for url in urls)
+        direct_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        paths = [cached_image_path(url, CARD_WIDTH, cache_dir=cache_dir) for url in urls]
+        cold_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        paths = [cached_image_path(url, CARD_WIDTH, cache_dir=cache_dir) for url in urls]
+        warm_time = time.perf_counter() - start
+        server.shutdown()
+
+        cached_bytes = sum(path.stat().st_size for path in paths)
+        print(f"{count} images of {ORIGINAL_SIZE[0]}x{ORIGINAL_SIZE[1]} px, card width {CARD_WIDTH} px")
+        print(f"Original:  {original_bytes / count / 1024:8.1f} KiB per card, {direct_time / count * 1000:6.1f} ms per download")
+        print(f"Cached:    {cached_bytes / count / 1024:8.1f} KiB per card ({original_bytes / cached_bytes:.0f}x smaller)")
+        print(f"Cold fill: {cold_time / count * 1000:6.1f} ms per image (download + resize + write)")
+        print(f"Warm hit:  {warm_time / count * 1000:6.1f} ms per image")
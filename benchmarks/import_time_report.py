@@ -0,0 +1,77 @@
+# import_time_report.py
+
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+"""
+This file compares the import cost of the app start with eager and lazy page loading, based on python -X importtime.
+    - eager: all six page modules imported up front (previous utils/page_config.py)
+    - lazy: what app.py imports for the first paint: utils/page_config.py, the intro page, the background warm-up
+      (utils/warmup.py) and the global search box (utils/search_index.py)
+Both runs import streamlit, utils/warmup.py and utils/search_index.py, which app.py needs in any case.
+    -> Output: total import time of both runs and the heaviest modules only imported by the eager run
+Usage: python benchmarks/import_time_report.py [top_n]
+"""
+
+PAGE_MODULES = [
+    "pages.intro_page",
+    "pages.movie_page",
+    "pages.rdf_page",
+    "pages.characters_page",
+    "pages.image_gallery_page",
+    "pages.map_page",
+]
+
+RUNS = {
+    "eager": ["streamlit", "utils.warmup", "utils.search_index"] + PAGE_MODULES,
+    "lazy": ["streamlit", "utils.page_config", "utils.warmup", "utils.search_index", "pages.intro_page"],
+}
+
+# import time:       self [us] |  cumulative | imported package
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|\s*(\S+)")
+
+
+# ---- Run one interpreter with -X importtime ----
+def import_times(modules, base_dir):
+    """Return ({module: cumulative microseconds}, total self time in microseconds) of one interpreter run."""
+    code = "; ".join(f"import {module}" for module in modules)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=base_dir, capture_output=True, text=True, check=True,
+    )
+    cumulative = {}
+    total = 0
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, module = match.groups()
+        total += int(self_us)
+        cumulative[module] = int(cumulative_us)
+    return cumulative, total
+
+
+if __name__ == "__main__":
+    base_dir = Path(__file__).resolve().parent.parent
+    top_n = int(sys.argv[1]) if len(sys.argv) > 1 else 15
+
+    results = {name: import_times(modules, base_dir) for name, modules in RUNS.items()}
+    for name, (_, total) in results.items():
+        print(f"{name:>5}: {total / 1000:8.1f} ms  ({', '.join(RUNS[name])})")
+
+    eager_total = results["eager"][1]
+    lazy_total = results["lazy"][1]
+    print(f"Saving at first paint: {(eager_total - lazy_total) / 1000:.1f} ms "
+          f"({100 * (eager_total - lazy_total) / eager_total:.0f}%)")
+
+    # Heaviest modules that are no longer imported at app start
+    eager_modules, lazy_modules = results["eager"][0], results["lazy"][0]
+    deferred = sorted(
+        ((us, module) for module, us in eager_modules.items() if module not in lazy_modules),
+        reverse=True,
+    )
+    print("\nHeaviest deferred imports (cumulative):")
+    for us, module in deferred[:top_n]:
+        print(f"  {us / 1000:8.1f} ms  {module}")
@@ -1,8 +1,12 @@
 # a_data_preparation.py
 import pandas as pd
-import requests
 import time
 from pathlib import Path
+import sys
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+from utils.http_cache import cached_get
 
 """
 This file takes the raw James Bond dataset and performs data cleaning and enrichment in two steps:
@@ -93,7 +97,9 @@ def retrieve_wikidata_movie_id(title):
     LIMIT 1
     """
     url = "https://query.wikidata.org/sparql"
-    r = requests.get(url, params={"query": query, "format": "json"})
+    r = cached_get(url, params={"query": query, "format": "json"})
+    if not r.from_cache:
+        time.sleep(2)  # Wikidata rate limit, only for requests that went to the network
 
     if r.status_code != 200:
         print(f"HTTP {r.status_code} für Titel: {title}")
@@ -109,7 +115,7 @@ def retrieve_wikidata_movie_id(title):
 
 def add_wikidata_ids_to_dataframe(input_file: str, output_file: str):
     df = pd.read_csv(input_file, sep=";")
-    df["wikidata_id"] = df["Movie"].apply(lambda x: (time.sleep(2), retrieve_wikidata_movie_id(x))[1])
+    df["wikidata_id"] = df["Movie"].apply(retrieve_wikidata_movie_id)
     df.to_csv(output_file, index=False, sep=";")
 
 def create_bond_films_list(input_file: str, output_file: str):
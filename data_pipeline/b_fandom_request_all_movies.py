@@ -1,6 +1,5 @@
 # b_fandom_request_all_movies.py
 
-import requests
 import wikitextparser as wtp
 import json
 from pathlib import Path
@@ -9,31 +8,59 @@ import sys
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 from utils.bond_films import BOND_FILMS
+from utils.http_fetcher import polite_get, fetch_all
+from utils.fandom_images import FANDOM_API, BATCH_SIZE, resolve_alias
 
 """
 This file retrieves unstructured text data from the James Bond Fandom Wiki for all movies in the BOND_FILMS list.
 It extracts sections and infoboxes from each movie's wiki page and saves the data in JSON format.
+The Wikitext of all pages is requested in bulk (action=query&prop=revisions, 50 pages per request), each batch
+is split into the per-film JSON files as soon as it arrives.
     -> Input: BOND_FILMS list from utils/bond_films.py
     -> Output: JSON files in extract_knowledge/fandom_wiki_pages/ directory
 """
 
-def get_fandom_page_text(movie_title):
-    """Retrieve Wikitext and parse Sections and Infoboxes"""
-    url = "https://jamesbond.fandom.com/api.php"
+# ---- Bulk wikitext of up to 50 pages per request ----
+def get_fandom_pages_wikitext(titles):
+    """
+    Retrieve the current Wikitext of up to BATCH_SIZE pages in one revisions query (redirects are followed)
+    Returns {requested title: wikitext or None}
+    """
     params = {
-        "action": "parse",
-        "page": movie_title,
+        "action": "query",
+        "prop": "revisions",
+        "rvprop": "content",
+        "rvslots": "main",
+        "titles": "|".join(titles),
+        "redirects": 1,
         "format": "json",
-        "prop": "wikitext"
+        "formatversion": 2
     }
-    try:
-        response = requests.get(url, params=params)
-        data = response.json()
+    wikitexts, aliases = {}, {}
+    while True:
+        data = polite_get(FANDOM_API, params=params).json()
         if 'error' in data:
-            print(f"Error retrieving {movie_title}: {data['error']['info']}")
-            return None
+            raise RuntimeError(data['error']['info'])
+
+        query = data.get('query', {})
+        for entry in query.get('normalized', []) + query.get('redirects', []):
+            aliases[entry['from']] = entry['to']
+        for page in query.get('pages', []):
+            revisions = page.get('revisions')
+            if revisions:
+                wikitexts[page['title']] = revisions[0]['slots']['main']['content']
+
+        # Large batches are split by the API, the remaining pages follow with the continue parameters
+        if 'continue' not in data:
+            break
+        params = {**params, **data['continue']}
 
-        wikitext = data['parse']['wikitext']['*']
+    return {title: wikitexts.get(resolve_alias(title, aliases)) for title in titles}
+
+
+def get_fandom_page_text(movie_title, wikitext):
+    """Parse Sections and Infoboxes of the Wikitext of a movie page"""
+    try:
         parsed = wtp.parse(wikitext)
 
         # Extract sections
@@ -55,11 +82,25 @@ def get_fandom_page_text(movie_title):
         return {"title": movie_title,
                 "sections": sections,
                 "infobox": infobox}
-    
+
     except Exception as e:
         print(f"Error processing {movie_title}: {e}")
         return None
 
+
+def save_pages_batch(titles):
+    """Fetch one batch of pages and write a JSON file per page right away; returns the titles that failed"""
+    failed = []
+    for film, wikitext in get_fandom_pages_wikitext(titles).items():
+        movie_data = get_fandom_page_text(film, wikitext) if wikitext is not None else None
+        if movie_data:
+            filename = film.replace(" ", "_").replace("(", "").replace(")", "") + ".json"
+            save_data_to_json(movie_data, filename)
+        else:
+            print(f"Error retrieving {film}: page not found")
+            failed.append(film)
+    return failed
+
 def save_data_to_json(data, filename):
     """Save extracted movie-data to a JSON file"""
     base_dir = Path(__file__).resolve().parent.parent
@@ -74,20 +115,9 @@ def save_data_to_json(data, filename):
 
 
 if __name__ == "__main__":
-    successful = 0
-    failed = 0
-    
-    for i, film in enumerate(BOND_FILMS, start=1):
-        print(f"Processing ({i}/{len(BOND_FILMS)}): {film}")
-
-        movie_data = get_fandom_page_text(film)
-
-        if movie_data:
-            filename = film.replace(" ", "_").replace("(", "").replace(")", "") + ".json"
-            save_data_to_json(movie_data, filename)
-            successful += 1
-        else:
-            failed += 1
+    # 50 pages per request, the batches are fetched concurrently (utils/http_fetcher.py)
+    batches = [BOND_FILMS[i:i + BATCH_SIZE] for i in range(0, len(BOND_FILMS), BATCH_SIZE)]
+    failed = sum(fetch_all(save_pages_batch, batches, describe=lambda batch: f"{len(batch)} pages from '{batch[0]}'"), [])
 
-    print(f"Successfully processed: {successful}")
-    print(f"Failed to process: {failed}")
\ No newline at end of file
+    print(f"Successfully processed: {len(BOND_FILMS) - len(failed)}")
+    print(f"Failed to process: {len(failed)}")
@@ -1,12 +1,12 @@
 # c_fandom_request_movie_posters.py
 
-import requests
 from pathlib import Path
 import sys
 
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 from utils.bond_films import BOND_FILMS
+from utils.http_fetcher import polite_get, fetch_all
 
 """
 This file retrieves movie poster URLs from the James Bond Fandom Wiki for all movies in the BOND_FILMS list.
@@ -28,7 +28,7 @@ def get_movie_poster_url(movie_title):
         "format": "json",
     }
     try:
-        response = requests.get(url, params=params)
+        response = polite_get(url, params=params)
         data = response.json()
 
         if 'error' in data:
@@ -58,29 +58,22 @@ def get_movie_poster_url(movie_title):
     
 
 def save_poster_url(movie_list):
-    results = []
+    # get poster URLs concurrently (utils/http_fetcher.py)
+    poster_urls = fetch_all(get_movie_poster_url, movie_list)
+    results = [{'title': film, 'poster_url': poster_url if poster_url else ''}
+               for film, poster_url in zip(movie_list, poster_urls)]
 
-    for i, film in enumerate(movie_list, start=1):
-        print(f"[{i}/{len(movie_list)}] {film}")
+    # save to CSV
+    output_dir = project_root / "extract_knowledge/movie_posters"
+    output_dir.mkdir(exist_ok=True)
+    output_file = output_dir / "movie_poster_url.csv"
 
-        # get poster URL
-        poster_url = get_movie_poster_url(film)
-        results.append({
-            'title': film,
-            'poster_url': poster_url if poster_url else ''
-        })
+    with open (output_file, 'w', newline='', encoding='utf-8') as f:
+        f.write("title,poster_url\n")
+        for item in results:
+            f.write(f"{item['title']},{item['poster_url']}\n")
 
-        # save to CSV
-        output_dir = project_root / "extract_knowledge/movie_posters"
-        output_dir.mkdir(exist_ok=True)
-        output_file = output_dir / "movie_poster_url.csv"
-
-        with open (output_file, 'w', newline='', encoding='utf-8') as f:
-            f.write("title,poster_url\n")
-            for item in results:
-                f.write(f"{item['title']},{item['poster_url']}\n")
-        
-        print(f"Poster URLs saved to {output_file}")
+    print(f"Poster URLs saved to {output_file}")
 
 if __name__ == "__main__":
     save_poster_url(BOND_FILMS)
\ No newline at end of file
@@ -4,14 +4,23 @@ import json
 import re
 import spacy
 from geopy.geocoders import Nominatim
-import time
 import pandas as pd
 from pathlib import Path
+import sys
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+from utils.geocoding import CachedGeocoder
+from utils.gazetteer import Gazetteer
 
 """
 This file extracts location names from the JSON files generated by the fandom_request_all_movies.py script.
 It uses spaCy's Named Entity Recognition to identify places and then geocodes them using Nominatim.
-    -> Input: JSON files in extract_knowledge/fandom_wiki_pages/ directory
+Each distinct place name is geocoded once for all movies; results are kept in a persistent cache
+(utils/geocoding.py), so re-runs only send new names to Nominatim.
+If the GeoNames gazetteer file GAZETTEER_FILE exists (data/gazetteer/cities15000.txt), the places are geocoded
+offline with utils/gazetteer.py first; only the names it does not know (e.g. landmarks) are sent to Nominatim.
+    -> Input: JSON files in extract_knowledge/fandom_wiki_pages/ directory, optionally GAZETTEER_FILE
     -> Output: CSV files in extract_knowledge/geocoded_locations/ directory
 Step 1: Extract location names from relevant sections of the JSON files.
 Step 2: Geocode the extracted location names to get latitude and longitude.
@@ -20,6 +29,7 @@ Step 3: Data cleaning: removes duplicates or empty geocoordinates and cleans tex
 
 nlp = spacy.load("en_core_web_lg")
 PLACE_LABELS = {"GPE", "LOC", "FAC"}
+GAZETTEER_FILE = "data/gazetteer/cities15000.txt"  # also declared as optional input of stage d in run_pipeline.py
 
 # ------------ Places Extraction ------------
 def extract_places(input_text, movie_name):
@@ -52,21 +62,44 @@ def extract_places(input_text, movie_name):
 # ------------ Geocoding ------------
 geolocator = Nominatim(user_agent="James_Bond_Universe_Geocoder")
 
-def geocode_locations(locations, movie_name):
+def create_geocoders(base_dir):
+    """
+    Geocoders in order of use: the offline gazetteer if GAZETTEER_FILE is available, then Nominatim behind the
+    persistent cache for the names the gazetteer does not know
+    """
+    geocoders = []
+    gazetteer_file = base_dir / GAZETTEER_FILE
+    if gazetteer_file.exists():
+        print(f"Loading gazetteer {gazetteer_file.name} ...")
+        gazetteer = Gazetteer.from_file(gazetteer_file)
+        # Lookups are local, the in-memory cache only deduplicates the names of this run
+        geocoders.append(CachedGeocoder(gazetteer, f"gazetteer:{gazetteer_file.name}", path=":memory:", min_interval=0))
+    geocoders.append(CachedGeocoder(geolocator, "nominatim"))
+    return geocoders
+
+def geocode_locations(places_by_movie, geocoders):
+    """Geocode the distinct place names of all movies once, then build one row per movie and place"""
+    all_places = [loc for locations in places_by_movie.values() for loc in locations]
+    coordinates = {}
+    for geocoder in geocoders:
+        # Each geocoder only gets the names the previous ones did not find
+        missing = [loc for loc in all_places if not coordinates.get(loc)]
+        coordinates.update(geocoder.geocode_all(missing))
+
     coords = []
-    for loc in locations:
-        try:
-            geo = geolocator.geocode(loc)
-            if geo:
+    for movie_name, locations in places_by_movie.items():
+        geocoded = 0
+        for loc in locations:
+            if coordinates.get(loc):
+                lat, lon = coordinates[loc]
                 coords.append({
                     "name": loc,
-                    "lat": geo.latitude,
-                    "lon": geo.longitude,
+                    "lat": lat,
+                    "lon": lon,
                     "movie": movie_name
                 })
-            time.sleep(1)
-        except:
-            pass
+                geocoded += 1
+        print(f"{movie_name}: geocoded {geocoded} of {len(locations)} places")
 
     return coords
 
@@ -95,7 +128,7 @@ if __name__ == "__main__":
     output_folder = base_dir / "extract_knowledge/geocoded_locations"
     output_folder.mkdir(exist_ok=True)
 
-    all_geocoded = []
+    places_by_movie = {}
     json_files = list(input_folder.glob("*_film.json"))
     print(f"Found {len(json_files)} JSON files\n")
     
@@ -107,17 +140,15 @@ if __name__ == "__main__":
         
         # Extract places
         raw_places = extract_places(input_text=json_file, movie_name=movie_name)
-        print(f"Found {len(raw_places)} unique places")
-        
-        # Geocode places
+        print(f"Found {len(raw_places)} unique places\n")
         if raw_places:
-            geo_locations = geocode_locations(locations=raw_places,
+            places_by_movie[movie_name] = raw_places
 
-                                              movie_name=movie_name)
-            all_geocoded.extend(geo_locations)
-            print(f"Geocoded {len(geo_locations)} locations\n")
-        else:
-            print(f"No places to geocode\n")
+    # Geocode places, each distinct name once (offline gazetteer first, cached so only new names are sent to Nominatim)
+    geocoders = create_geocoders(base_dir)
+    all_geocoded = geocode_locations(places_by_movie, geocoders)
+    for geocoder in geocoders:
+        print(geocoder.report())
     
     # Save all results to a CSV
     output_file = output_folder / "all_movies_geocoded.csv"
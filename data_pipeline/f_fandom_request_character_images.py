@@ -1,8 +1,12 @@
 # f_fandom_request_character_images.py
 
-import requests
 import pandas as pd
 from pathlib import Path
+import sys
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+from utils.fandom_images import resolve_images, first_image
 
 """
 This file retrieves character image URLs from the James Bond Fandom Wiki for all characters in the provided CSV file.
@@ -11,65 +15,28 @@ It saves the character names along with their corresponding image URLs in a new
     -> Output: CSV file in extract_knowledge/characters/ directory (with image URLs)
 """
 
-# ---- Retrieve character image URL from Fandom API ----
-def get_character_image_url(character_name, movie_name, actor_name):
-    """    
-    Tries to find character-specific image for a movie, with actor info as fallback
+# ---- Candidate Fandom page titles of a character ----
+def character_search_titles(character_name, movie_name, actor_name):
+    """
+    Page titles for a character-specific image of a movie, with actor info as fallback (in order of preference)
     """
-    url = "https://jamesbond.fandom.com/api.php"
-    
-    # Build search titles in order of preference
     search_titles = []
-    
+
     # Try 1: For James Bond, try with actor first
     if character_name == "James Bond" and actor_name and actor_name != "Unknown":
         search_titles.append(f"James Bond ({actor_name})")
-    
+
     # Try 2: Character (Movie)
     search_titles.append(f"{character_name} ({movie_name})")
-    
+
     # Try 3: Character (Actor)
     if actor_name and actor_name != "Unknown":
         search_titles.append(f"{character_name} ({actor_name})")
-    
+
     # Try 4: Just character name
     search_titles.append(character_name)
-    
-    for title in search_titles:
-        params = {
-            "action": "query",
-            "titles": title,
-            "prop": "pageimages",
-            "piprop": "original",
-            "format": "json",
-        }
-        try:
-            response = requests.get(url, params=params, timeout=5)
-            data = response.json()
-
-            if 'error' in data:
-                continue
-            
-            # Parse response to find image URL
-            pages = data.get('query', {}).get('pages', {})
-
-            for page_id, page_data in pages.items():
-                if page_id == '-1':  # Page doesn't exist
-                    continue
-                
-                # Try to get the original image URL
-                original = page_data.get('original', {})
-                if original and 'source' in original:
-                    img_url = original['source']
-                    # Clean up URL - remove revision parameters
-                    img_url = img_url.split('/revision/')[0] if '/revision/' in img_url else img_url
-                    img_url = img_url.split('?')[0]  # Remove query parameters
-                    return img_url, title
-            
-        except Exception as e:
-            continue
-    
-    return None, None
+
+    return search_titles
 
 # ---- Fetch images for all character-movie combinations and save to CSV ----
 def save_character_images(csv_file, limit=None):
@@ -84,15 +51,16 @@ def save_character_images(csv_file, limit=None):
 
     results = []
 
-    for idx, row in df.iterrows():
+    # Resolve the candidate titles of all character-movie combinations in batches (utils/fandom_images.py)
+    rows = df[['character', 'actor', 'movie']].to_dict('records')
+    candidates = [character_search_titles(row['character'], row['movie'], row['actor']) for row in rows]
+    images = resolve_images(title for titles in candidates for title in titles)
+
+    for row, search_titles in zip(rows, candidates):
         character = row['character']
         actor = row['actor']
         movie = row['movie']
-
-        print(f"[{idx+1}/{len(df)}] {character} - {actor} ({movie})")
-
-        # Get image URL for this specific character-movie combination
-        img_url, found_title = get_character_image_url(character, movie, actor)
+        img_url, found_title = first_image(search_titles, images)
 
         if img_url:
             print(f"Found: {found_title}")
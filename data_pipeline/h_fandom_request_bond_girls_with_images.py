@@ -1,10 +1,15 @@
 # h_fandom_request_bond_girls_with_images.py
 
-import requests
 import wikitextparser as wtp
 import pandas as pd
 import re
 from pathlib import Path
+import sys
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+from utils.http_fetcher import polite_get
+from utils.fandom_images import resolve_images, first_image
 
 """
 This file retrieves the "Eon series James Bond girls" table from the Bond girl page on the James Bond fandom wiki.
@@ -28,7 +33,7 @@ def get_bond_girls_table(page_name):
         "prop": "wikitext"
     }
     try:
-        response = requests.get(url, params=params)
+        response = polite_get(url, params=params)
         data = response.json()
         if 'error' in data:
             print(f"Error retrieving {page_name}: {data['error']['info']}")
@@ -103,15 +108,12 @@ def clean_film_name(film_name):
     return film_name.strip()
 
 
-# ---- Step 2: Retrieve character image URL from Fandom API ----
-def get_bond_girl_image_url(character_name, actress_name=''):
+# ---- Step 2: Candidate Fandom page titles of a Bond girl ----
+def bond_girl_search_titles(character_name, actress_name=''):
     """
-    Tries to find Bond girl image from Fandom wiki
+    Page titles for a Bond girl image on the Fandom wiki (in order of preference)
     Tries both "Character (Actress)" and just "Character"
     """
-    url = "https://jamesbond.fandom.com/api.php"
-
-    # Build search titles in order of preference
     search_titles = []
 
     # Try 1: Character (Actress) - most common format on Fandom
@@ -121,41 +123,7 @@ def get_bond_girl_image_url(character_name, actress_name=''):
     # Try 2: Just character name
     search_titles.append(character_name)
 
-    for title in search_titles:
-        params = {
-            "action": "query",
-            "titles": title,
-            "prop": "pageimages",
-            "piprop": "original",
-            "format": "json",
-        }
-        try:
-            response = requests.get(url, params=params, timeout=5)
-            data = response.json()
-
-            if 'error' in data:
-                continue
-
-            # Parse response to find image URL
-            pages = data.get('query', {}).get('pages', {})
-
-            for page_id, page_data in pages.items():
-                if page_id == '-1':  # Page doesn't exist
-                    continue
-
-                # Try to get the original image URL
-                original = page_data.get('original', {})
-                if original and 'source' in original:
-                    img_url = original['source']
-                    # Clean up URL - remove revision parameters
-                    img_url = img_url.split('/revision/')[0] if '/revision/' in img_url else img_url
-                    img_url = img_url.split('?')[0]  # Remove query parameters
-                    return img_url, title
-
-        except Exception as e:
-            continue
-
-    return None, None
+    return search_titles
 
 
 # ---- Helper function to extract main actress ----
@@ -187,21 +155,23 @@ def extract_main_bond_girls_with_images():
     print(f"Found {len(bond_girls_data)} movies with Bond girls\n")
 
     # Extract ONLY main Bond girls
-    results = []
-
-    for idx, movie_data in enumerate(bond_girls_data):
+    main_bond_girls = []
+    for movie_data in bond_girls_data:
         film = clean_film_name(movie_data.get('Film', ''))
         main_bond_girl = movie_data.get('Main Bond girl', '')
         all_actresses = movie_data.get('Actress', '')
 
         # Extract the main actress (last one in the list)
         main_actress = extract_main_actress(all_actresses)
+        main_bond_girls.append((film, main_bond_girl, main_actress))
 
-        print(f"[{idx+1}/{len(bond_girls_data)}] {film}: {main_bond_girl} ({main_actress})")
-
-        # Get image URL for this Bond girl - try with actress name first
-        img_url, found_title = get_bond_girl_image_url(main_bond_girl, main_actress)
+    # Get image URL for each Bond girl - try with actress name first (batched, utils/fandom_images.py)
+    candidates = [bond_girl_search_titles(main_bond_girl, main_actress) for _, main_bond_girl, main_actress in main_bond_girls]
+    images = resolve_images(title for titles in candidates for title in titles)
 
+    results = []
+    for (film, main_bond_girl, main_actress), search_titles in zip(main_bond_girls, candidates):
+        img_url, found_title = first_image(search_titles, images)
         if img_url:
             print(f"Image found")
         else:
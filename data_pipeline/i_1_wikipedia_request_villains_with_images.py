@@ -1,9 +1,14 @@
 # i_1_wikipedia_request_villains_with_images.py
 
-import requests
 import pandas as pd
 import re
 from pathlib import Path
+import sys
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+from utils.http_fetcher import polite_get
+from utils.fandom_images import resolve_images, first_image
 
 """
 This file retrieves the villain table from Wikipedia's "List of James Bond villains" page (https://en.wikipedia.org/wiki/List_of_James_Bond_villains#Eon_Productions).
@@ -32,7 +37,7 @@ def get_villains_from_wikipedia():
         }
 
         # Fetch the page content with headers
-        response = requests.get(url, headers=headers)
+        response = polite_get(url, headers=headers)
         response.raise_for_status()
 
         # Parse tables from the HTML content
@@ -101,15 +106,12 @@ def clean_text(text):
     return text.strip()
 
 
-# ---- Step 2: Retrieve character image URL from Fandom API ----
-def get_villain_image_url(villain_name, actor_name=''):
+# ---- Step 2: Candidate Fandom page titles of a villain ----
+def villain_search_titles(villain_name, actor_name=''):
     """
-    Tries to find villain image from Fandom wiki
+    Page titles for a villain image on the Fandom wiki (in order of preference)
     Tries both "Villain (Actor)" and just "Villain"
     """
-    url = "https://jamesbond.fandom.com/api.php"
-
-    # Build search titles in order of preference
     search_titles = []
 
     # Try 1: Villain (Actor) - most common format on Fandom
@@ -122,41 +124,7 @@ def get_villain_image_url(villain_name, actor_name=''):
     # Try 2: Just villain name
     search_titles.append(villain_name)
 
-    for title in search_titles:
-        params = {
-            "action": "query",
-            "titles": title,
-            "prop": "pageimages",
-            "piprop": "original",
-            "format": "json",
-        }
-        try:
-            response = requests.get(url, params=params, timeout=5)
-            data = response.json()
-
-            if 'error' in data:
-                continue
-
-            # Parse response to find image URL
-            pages = data.get('query', {}).get('pages', {})
-
-            for page_id, page_data in pages.items():
-                if page_id == '-1':  # Page doesn't exist
-                    continue
-
-                # Try to get the original image URL
-                original = page_data.get('original', {})
-                if original and 'source' in original:
-                    img_url = original['source']
-                    # Clean up URL - remove revision parameters
-                    img_url = img_url.split('/revision/')[0] if '/revision/' in img_url else img_url
-                    img_url = img_url.split('?')[0]  # Remove query parameters
-                    return img_url, title
-
-        except Exception as e:
-            continue
-
-    return None, None
+    return search_titles
 
 
 # ---- Main function to extract villains with images ----
@@ -175,18 +143,18 @@ def extract_villains_with_images():
     # Extract villains and fetch images
     results = []
 
-    for idx, villain_data in enumerate(villains_data):
+    # Get image URL for each villain (batched, utils/fandom_images.py)
+    candidates = [villain_search_titles(data.get('Villain', ''), data.get('Portrayed by', '')) for data in villains_data]
+    images = resolve_images(title for titles in candidates for title in titles)
+
+    for villain_data, search_titles in zip(villains_data, candidates):
         film = villain_data.get('Film', '')
         villain = villain_data.get('Villain', '')
         actor = villain_data.get('Portrayed by', '')
         objective = villain_data.get('Objective', '')
         outcome = villain_data.get('Outcome', '')
         status = villain_data.get('Status', '')
-
-        print(f"[{idx+1}/{len(villains_data)}] {film}: {villain} ({actor})")
-
-        # Get image URL for this villain
-        img_url, found_title = get_villain_image_url(villain, actor)
+        img_url, found_title = first_image(search_titles, images)
 
         if img_url:
             print(f"Image found")
@@ -1,8 +1,12 @@
 # k_fandom_request_vehicle_images.py
 
-import requests
 import pandas as pd
 from pathlib import Path
+import sys
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+from utils.fandom_images import resolve_images, first_image
 
 """
 This file retrieves vehicle image URLs from the James Bond Fandom API based on a CSV file containing vehicle data.
@@ -11,76 +15,25 @@ It saves the results to a new CSV file including the retrieved image URLs.
     -> Output CSV: extract_knowledge/vehicles/all_movie_vehicles_with_image.csv
 """
 
-# ---- Retrieve vehicle image URL from Fandom API ----
-def get_vehicle_image_url(vehicle_name, image_filename):
+# ---- Candidate Fandom titles of a vehicle ----
+def vehicle_file_title(image_filename):
+    """File page of the vehicle image, if the vehicle has a usable image filename"""
+    if image_filename and image_filename != "Unknown - Infobox.png" and image_filename != "No image":
+        return f"File:{image_filename}"
+    return None
+
+
+def get_vehicle_image_url(vehicle_name, image_filename, file_urls, page_images):
     """
-    Tries to find vehicle image URL using the image filename or vehicle name
+    Finds the vehicle image URL using the image filename or vehicle name (in the batched lookups of utils/fandom_images.py)
     """
-    url = "https://jamesbond.fandom.com/api.php"
-
     # Method 1: Try to get the image info directly using the filename
-    if image_filename and image_filename != "Unknown - Infobox.png" and image_filename != "No image":
-        params = {
-            "action": "query",
-            "titles": f"File:{image_filename}",
-            "prop": "imageinfo",
-            "iiprop": "url",
-            "format": "json",
-        }
-        try:
-            response = requests.get(url, params=params, timeout=5)
-            data = response.json()
-
-            pages = data.get('query', {}).get('pages', {})
-            for page_id, page_data in pages.items():
-                if page_id == '-1':
-                    break
-
-                imageinfo = page_data.get('imageinfo', [])
-                if imageinfo and 'url' in imageinfo[0]:
-                    img_url = imageinfo[0]['url']
-                    # Clean up URL - remove revision parameters
-                    img_url = img_url.split('/revision/')[0] if '/revision/' in img_url else img_url
-                    img_url = img_url.split('?')[0]
-                    return img_url, f"File:{image_filename}"
-        except Exception as e:
-            pass
+    file_title = vehicle_file_title(image_filename)
+    if file_title and file_urls.get(file_title):
+        return file_urls[file_title], file_title
 
     # Method 2: Try to get the image from the vehicle page
-    search_titles = [vehicle_name]
-
-    for title in search_titles:
-        params = {
-            "action": "query",
-            "titles": title,
-            "prop": "pageimages",
-            "piprop": "original",
-            "format": "json",
-        }
-        try:
-            response = requests.get(url, params=params, timeout=5)
-            data = response.json()
-
-            if 'error' in data:
-                continue
-
-            pages = data.get('query', {}).get('pages', {})
-
-            for page_id, page_data in pages.items():
-                if page_id == '-1':
-                    continue
-
-                original = page_data.get('original', {})
-                if original and 'source' in original:
-                    img_url = original['source']
-                    img_url = img_url.split('/revision/')[0] if '/revision/' in img_url else img_url
-                    img_url = img_url.split('?')[0]
-                    return img_url, title
-
-        except Exception as e:
-            continue
-
-    return None, None
+    return first_image([vehicle_name], page_images)
 
 # ---- Fetch images for all vehicles and save to CSV ----
 def save_vehicle_images(csv_file, output_file):
@@ -90,16 +43,19 @@ def save_vehicle_images(csv_file, output_file):
 
     results = []
 
-    for idx, row in df.iterrows():
+    # Resolve the file pages and vehicle pages of all vehicles in batches (utils/fandom_images.py)
+    rows = df[['vehicle', 'image', 'sequence', 'movie']].to_dict('records')
+    file_urls = resolve_images((vehicle_file_title(row['image']) for row in rows), kind="imageinfo")
+    page_images = resolve_images(row['vehicle'] for row in rows)
+
+    for row in rows:
         vehicle = row['vehicle']
         image = row['image']
         sequence = row['sequence']
         movie = row['movie']
 
-        print(f"[{idx+1}/{len(df)}] {vehicle} ({movie})")
-
         # Get image URL for this vehicle
-        img_url, found_title = get_vehicle_image_url(vehicle, image)
+        img_url, found_title = get_vehicle_image_url(vehicle, image, file_urls, page_images)
 
         if img_url:
             print(f"Found: {found_title}")
@@ -2,9 +2,13 @@
 # with timeout=60, otherwise: ReadTimeoutError
 
 import pandas as pd
-import requests
 import time
 from pathlib import Path
+import sys
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+from utils.http_cache import cached_get
 
 """
 This file queries Wikidata SPARQL endpoint to retrieve Wikidata IDs for Bond actors
@@ -25,7 +29,7 @@ def load_unique_bond_actors(csv_path: str):
     return sorted(actors)
 
 
-def retrieve_wikidata_actor_uri(name: str) -> str | None:
+def retrieve_wikidata_actor_uri(name: str, delay_seconds: float = 2.0) -> str | None:
     """
     Retrieve Wikidata URI for bond actor name. Search for resources
     with occupation film actor or television actor.
@@ -59,9 +63,11 @@ LIMIT 1
 
     url = "https://query.wikidata.org/sparql"
 
-    response = requests.get(
+    response = cached_get(
         url, params={"query": query, "format": "json"}, timeout=60
     )
+    if not response.from_cache:
+        time.sleep(delay_seconds)  # Wikidata rate limit, only for requests that went to the network
 
     if response.status_code != 200:
         print(f"HTTP {response.status_code} for actor: {name}")
@@ -86,8 +92,7 @@ def build_actor_id_csv(input_file: str, output_file: str, delay_seconds: float =
     rows = []
     for name in actors:
         print(f"Querying Wikidata for actor: {name} ...")
-        time.sleep(delay_seconds)
-        uri = retrieve_wikidata_actor_uri(name)
+        uri = retrieve_wikidata_actor_uri(name, delay_seconds)
 
         if uri:
             qid = uri.rsplit("/", 1)[-1]
@@ -1,9 +1,13 @@
 # n_extract_bond_info_sparql.py
 
 import pandas as pd
-import requests
 import json
 from pathlib import Path
+import sys
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+from utils.http_cache import cached_get
 
 """
 This file queries Wikidata SPARQL endpoint to extract detailed information
@@ -65,7 +69,7 @@ ORDER BY ?actor_label ?country_label
 
 def fetch_bindings(query: str):
     url = "https://query.wikidata.org/sparql"
-    r = requests.get(url, params={"query": query, "format": "json"}, timeout=30)
+    r = cached_get(url, params={"query": query, "format": "json"}, timeout=30)
     r.raise_for_status()
     return r.json()["results"]["bindings"]
 
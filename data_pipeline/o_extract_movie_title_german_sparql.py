@@ -1,8 +1,12 @@
 # o_extract_movie_title_german.py
 
 import pandas as pd
-import requests
 from pathlib import Path
+import sys
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+from utils.http_cache import cached_get
 
 """
 This file extracts the German movie titles from Wikidata using SPARQL queries.
@@ -41,7 +45,7 @@ def fetch_german_titles(qids):
     """
 
     url = "https://query.wikidata.org/sparql"
-    r = requests.get(url, params={"query": query, "format": "json"})
+    r = cached_get(url, params={"query": query, "format": "json"})
     data = r.json()
 
     # json to dataframe
@@ -3,12 +3,19 @@
 import json
 import os
 import re
+import sys
 from pathlib import Path
 from rdflib import Graph, Namespace, Literal, URIRef
 from rdflib.namespace import RDF, RDFS, XSD, OWL
 
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+from utils.kg_snapshot import save_kg_snapshot
+
 """
 This script converts JSON data into a knowledge graph in TTL-format.
+In addition, a dictionary-encoded binary snapshot (term table + integer triples) is written,
+which the Streamlit app loads instead of parsing the TTL file.
 
 It defines:
 - OWL classes for the ontology (Movie, Actor, Character, BondGirl, Villain, Vehicle, Location, Song)
@@ -51,9 +58,9 @@ def sanitize_uri_part(text):
     return text
 
 
-def create_knowledge_graph(json_file, output_file_ttl, output_file_owl):
+def create_knowledge_graph(json_file, output_file_ttl, output_file_owl, output_file_snapshot=None):
     """
-    Create a knowledge graph from JSON data and serialize to TTL and OWL.
+    Create a knowledge graph from JSON data and serialize to TTL, OWL and (optionally) the binary snapshot.
     """
 
     # Define namespaces
@@ -609,6 +616,12 @@ def create_knowledge_graph(json_file, output_file_ttl, output_file_owl):
     g.serialize(destination=str(output_file_owl), format="xml")
     print(f"OWL file created: {output_file_owl}")
 
+    # Serialize binary snapshot (term table + integer triples)
+    if output_file_snapshot:
+        print(f"Serializing {len(g)} triples to binary snapshot...")
+        save_kg_snapshot(g, output_file_snapshot)
+        print(f"Snapshot file created: {output_file_snapshot}")
+
     print(f"Total triples: {len(g)}")
 
     return g
@@ -620,11 +633,13 @@ if __name__ == "__main__":
     json_input = base_dir / "data/triple_store/james_bond_knowledge.json"
     ttl_output = base_dir / "data/triple_store/james_bond_knowledge.ttl"
     owl_output = base_dir / "data/triple_store/james_bond_knowledge.owl"
+    snapshot_output = base_dir / "data/triple_store/james_bond_knowledge.npz"
 
-    graph = create_knowledge_graph(json_input, ttl_output, owl_output)
+    graph = create_knowledge_graph(json_input, ttl_output, owl_output, snapshot_output)
 
     print("\n--- Summary ---")
     print(f"JSON input:  {json_input}")
     print(f"TTL output:  {ttl_output}")
     print(f"OWL output:  {owl_output}")
+    print(f"Snapshot:    {snapshot_output}")
     print(f"Triples:     {len(graph)}")
\ No newline at end of file
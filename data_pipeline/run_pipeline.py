@@ -0,0 +1,352 @@
+# run_pipeline.py
+
+import argparse
+import contextlib
+import hashlib
+import json
+import os
+import runpy
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from pathlib import Path
+
+"""
+This file runs the data pipeline stages (a_ ... t_) as a DAG instead of one after the other by hand.
+Each stage declares the files and directories it reads and writes (STAGES). A stage depends on the stages
+that last wrote one of its inputs before it (in the order of STAGES), stages without a path between them run
+in parallel in a process pool. After a successful run the content hashes of the stage script, its inputs and
+its outputs are stored in data_pipeline/pipeline_state.json; a stage whose hashes are unchanged is skipped.
+    -> Input: the stage scripts in data_pipeline/ and the files declared in STAGES
+    -> Output: the outputs of the stages that were out of date, state file, logs in data_pipeline/logs/
+Usage:
+    python data_pipeline/run_pipeline.py                 run all out-of-date stages
+    python data_pipeline/run_pipeline.py --dry-run       only show which stages would run
+    python data_pipeline/run_pipeline.py --force d e     rerun stages d and e (and whatever becomes outdated)
+    python data_pipeline/run_pipeline.py --only s t      consider only stages s and t
+    python data_pipeline/run_pipeline.py --record        store the current hashes without running anything
+    python data_pipeline/run_pipeline.py --jobs 4        run up to 4 stages at a time (default: 2)
+Stages that query Fandom, Wikipedia, Wikidata or the Groq API are only rerun if their inputs change or with --force.
+"""
+
+STATE_FILE = "data_pipeline/pipeline_state.json"
+LOG_DIR = "data_pipeline/logs"
+# Parallel stages by default: the rate limits of utils/http_fetcher.py and the geocoder hold per process, so
+# every additional worker running a network stage adds its own request rate against Fandom, Wikipedia or Nominatim
+DEFAULT_JOBS = 2
+
+KNOWLEDGE_CSVS = [
+    "data/jamesbond_with_id.csv",
+    "extract_knowledge/bond_info/bond_info.json",
+    "extract_knowledge/bond_girls/bond_girls_with_images.csv",
+    "extract_knowledge/characters/all_movie_characters_with_image.csv",
+    "extract_knowledge/geocoded_locations/all_movies_geocoded.csv",
+    "extract_knowledge/movie_title_german/movie_title_en_de.csv",
+    "extract_knowledge/songs/all_movie_songs.csv",
+    "extract_knowledge/vehicles/all_movie_vehicles_with_image.csv",
+    "extract_knowledge/villains/all_villains_with_images.csv",
+]
+APP_CSVS = [
+    "data/jamesbond_with_id.csv",
+    "extract_knowledge/movie_title_german/movie_title_en_de.csv",
+    "extract_knowledge/movie_posters/movie_poster_url.csv",
+    "extract_knowledge/geocoded_locations/all_movies_geocoded.csv",
+    "extract_knowledge/characters/all_movie_characters_with_image.csv",
+    "extract_knowledge/vehicles/all_movie_vehicles_with_image.csv",
+    "extract_knowledge/bond_girls/bond_girls_with_images.csv",
+    "extract_knowledge/songs/all_movie_songs.csv",
+    "extract_knowledge/villains/all_villains_with_images.csv",
+]
+FANDOM_PAGES = "extract_knowledge/fandom_wiki_pages/"
+GAZETTEER_FILE = "data/gazetteer/cities15000.txt"  # optional, downloaded separately (see stage d)
+# Inputs a stage can run without; a missing one is hashed as MISSING, so its absence does not make the stage outdated
+OPTIONAL_INPUTS = {GAZETTEER_FILE}
+MISSING = "missing"
+
+# Shared modules the network stages run through (with the modules they import), declared as inputs so that a
+# change to the cache, the fetcher, the image resolver or the geocoder reruns the stages that use them
+HTTP_CACHE = ["utils/http_cache.py"]
+HTTP_FETCHER = ["utils/http_fetcher.py"] + HTTP_CACHE
+FANDOM_IMAGES = ["utils/fandom_images.py"] + HTTP_FETCHER
+GEOCODING = ["utils/geocoding.py", "utils/gazetteer.py"] + HTTP_CACHE
+
+# ---- Stage registry: script -> inputs and outputs (paths relative to the project root, "/" = directory) ----
+STAGES = {
+    "a_data_preparation": {
+        "inputs": ["data/jamesbond_raw.csv"] + HTTP_CACHE,
+        "outputs": ["data/jamesbond_clean.csv", "data/jamesbond_with_id.csv", "utils/bond_films.py"],
+    },
+    "b_fandom_request_all_movies": {
+        "inputs": ["utils/bond_films.py"] + FANDOM_IMAGES,
+        "outputs": [FANDOM_PAGES],
+    },
+    "c_fandom_request_movie_posters": {
+        "inputs": ["utils/bond_films.py"] + HTTP_FETCHER,
+        "outputs": ["extract_knowledge/movie_posters/movie_poster_url.csv"],
+    },
+    "d_extract_locations_all_movies": {
+        "inputs": [FANDOM_PAGES, GAZETTEER_FILE] + GEOCODING,
+        "outputs": ["extract_knowledge/geocoded_locations/all_movies_geocoded.csv"],
+    },
+    "e_extract_characters_all_movies": {
+        "inputs": [FANDOM_PAGES],
+        "outputs": ["extract_knowledge/characters/all_movie_characters.csv"],
+    },
+    "f_fandom_request_character_images": {
+        "inputs": ["extract_knowledge/characters/all_movie_characters.csv"] + FANDOM_IMAGES,
+        "outputs": ["extract_knowledge/characters/all_movie_characters_with_image.csv"],
+    },
+    "g_character_image_url_completion": {
+        "inputs": ["extract_knowledge/characters/all_movie_characters_with_image.csv"],
+        "outputs": ["extract_knowledge/characters/all_movie_characters_with_image.csv"],
+    },
+    "h_fandom_request_bond_girls_with_images": {
+        "inputs": ["extract_knowledge/characters/all_movie_characters_with_image.csv"] + FANDOM_IMAGES,
+        "outputs": ["extract_knowledge/bond_girls/bond_girls_with_images.csv"],
+    },
+    "i_1_wikipedia_request_villains_with_images": {
+        "inputs": ["extract_knowledge/characters/all_movie_characters_with_image.csv"] + FANDOM_IMAGES,
+        "outputs": ["extract_knowledge/villains/villains_with_images.csv"],
+    },
+    "i_2_extract_additional_villains_with_LLM": {
+        "inputs": ["extract_knowledge/characters/all_movie_characters_with_image.csv",
+                   "extract_knowledge/villains/villains_with_images.csv"],
+        "outputs": ["extract_knowledge/villains/villains_with_LLM.csv"],
+    },
+    "i_3_merge_all_villains": {
+        "inputs": ["extract_knowledge/villains/villains_with_images.csv",
+                   "extract_knowledge/villains/villains_with_LLM.csv"],
+        "outputs": ["extract_knowledge/villains/all_villains_with_images.csv"],
+    },
+    "i_4_enrich_villains_data_with_LLM": {
+        "inputs": ["extract_knowledge/villains/all_villains_with_images.csv"],
+        "outputs": ["extract_knowledge/villains/all_villains_with_images.csv"],
+    },
+    "j_extract_vehicles_all_movies": {
+        "inputs": [FANDOM_PAGES],
+        "outputs": ["extract_knowledge/vehicles/all_movie_vehicles.csv"],
+    },
+    "k_fandom_request_vehicle_images": {
+        "inputs": ["extract_knowledge/vehicles/all_movie_vehicles.csv"] + FANDOM_IMAGES,
+        "outputs": ["extract_knowledge/vehicles/all_movie_vehicles_with_image.csv"],
+    },
+    "l_extract_songs_all_movies": {
+        "inputs": [FANDOM_PAGES],
+        "outputs": ["extract_knowledge/songs/all_movie_songs.csv"],
+    },
+    "m_extract_bond_wikidata_id_sparql": {
+        "inputs": ["data/jamesbond_with_id.csv"] + HTTP_CACHE,
+        "outputs": ["extract_knowledge/bond_info/bond_with_ids.csv"],
+    },
+    "n_extract_bond_info_sparql": {
+        "inputs": ["extract_knowledge/bond_info/bond_with_ids.csv"] + HTTP_CACHE,
+        "outputs": ["extract_knowledge/bond_info/bond_info.json"],
+    },
+    "o_extract_movie_title_german_sparql": {
+        "inputs": ["data/jamesbond_with_id.csv"] + HTTP_CACHE,
+        "outputs": ["extract_knowledge/movie_title_german/movie_title_en_de.csv"],
+    },
+    "p_merge_all_data_to_json": {
+        "inputs": KNOWLEDGE_CSVS,
+        "outputs": ["data/triple_store/james_bond_knowledge.json"],
+    },
+    "q_merge_json_to_knowledge_graph": {
+        "inputs": ["data/triple_store/james_bond_knowledge.json", "utils/kg_snapshot.py"],
+        "outputs": ["data/triple_store/james_bond_knowledge.ttl", "data/triple_store/james_bond_knowledge.owl",
+                    "data/triple_store/james_bond_knowledge.npz"],
+    },
+    "r_run_reasoner": {
+        "inputs": ["data/triple_store/james_bond_knowledge.owl"],
+        "outputs": ["data/triple_store/james_bond_knowledge_inferred.owl"],
+    },
+    "s_build_columnar_snapshots": {
+        "inputs": APP_CSVS + ["utils/snapshots.py"],
+        "outputs": ["data/snapshots/"],
+    },
+    "t_build_page_views": {
+        "inputs": APP_CSVS + ["utils/snapshots.py", "utils/data_loader.py", "utils/knowledge_store.py",
+                              "utils/page_views.py"],
+        "outputs": ["data/views/"],
+    },
+}
+
+
+# ---- Dependencies ----
+def stage_dependencies(stages=STAGES):
+    """Stage -> set of stages it depends on: for each input, the last stage before it that writes this path."""
+    dependencies = {}
+    writers = {}
+    for name, spec in stages.items():
+        dependencies[name] = {writers[path] for path in spec["inputs"] if path in writers}
+        for path in spec["outputs"]:
+            writers[path] = name
+    return dependencies
+
+
+# ---- Content hashes ----
+def file_hash(path):
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def path_hash(base_dir, path):
+    """SHA-1 of a file, of all files below a directory (names and contents), or None if it does not exist."""
+    full_path = base_dir / path
+    if full_path.is_file():
+        return file_hash(full_path)
+    if not full_path.is_dir():
+        return None
+    digest = hashlib.sha1()
+    for file in sorted(p for p in full_path.rglob("*") if p.is_file()):
+        digest.update(f"{file.relative_to(full_path).as_posix()}:{file_hash(file)}\n".encode())
+    return digest.hexdigest()
+
+
+def overwritten_outputs(name):
+    """Outputs of the stage that a later stage rewrites in place (e.g. f's CSV, completed by g)."""
+    later = list(STAGES)[list(STAGES).index(name) + 1:]
+    return {path for stage in later for path in STAGES[stage]["outputs"]} & set(STAGES[name]["outputs"])
+
+
+def stage_hashes(base_dir, name):
+    """
+    Hashes of the stage script and of all its inputs and outputs. Outputs rewritten by a later stage are only
+    checked for existence, otherwise the earlier stage would look outdated after every run of the later one.
+    Missing optional inputs are hashed as MISSING; adding or removing one makes the stage outdated.
+    """
+    spec = STAGES[name]
+    paths = [f"data_pipeline/{name}.py"] + spec["inputs"] + spec["outputs"]
+    overwritten = overwritten_outputs(name) - set(spec["inputs"])
+    hashes = {}
+    for path in dict.fromkeys(paths):
+        if path in overwritten:
+            hashes[path] = "exists" if (base_dir / path).exists() else None
+        elif path in OPTIONAL_INPUTS and not (base_dir / path).exists():
+            hashes[path] = MISSING
+        else:
+            hashes[path] = path_hash(base_dir, path)
+    return hashes
+
+
+def is_up_to_date(base_dir, name, state):
+    hashes = stage_hashes(base_dir, name)
+    return None not in hashes.values() and state.get(name) == hashes
+
+
+def load_state(base_dir):
+    path = base_dir / STATE_FILE
+    return json.loads(path.read_text(encoding="utf-8")) if path.exists() else {}
+
+
+def save_state(base_dir, state):
+    path = base_dir / STATE_FILE
+    path.write_text(json.dumps(state, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+# ---- Run one stage (in a worker process) ----
+def run_stage(base_dir, name):
+    """Run the stage script as __main__ from the project root; stdout and stderr go to data_pipeline/logs/."""
+    os.chdir(base_dir)
+    log_file = Path(base_dir) / LOG_DIR / f"{name}.log"
+    log_file.parent.mkdir(parents=True, exist_ok=True)
+    start = time.perf_counter()
+    with open(log_file, "w", encoding="utf-8") as log, contextlib.redirect_stdout(log), contextlib.redirect_stderr(log):
+        try:
+            runpy.run_path(str(Path(base_dir) / "data_pipeline" / f"{name}.py"), run_name="__main__")
+        except SystemExit as e:
+            if e.code not in (None, 0):
+                raise RuntimeError(f"exited with status {e.code}") from None
+        finally:
+            # Pool workers exit without running atexit handlers, so the HTTP cache report is printed here
+            http_cache = sys.modules.get("utils.http_cache")
+            if http_cache is not None:
+                http_cache.print_http_cache_report()
+    return time.perf_counter() - start
+
+
+# ---- Scheduler ----
+def run_pipeline(base_dir, selected, forced, jobs, dry_run=False):
+    """
+    Run the selected stages in dependency order, up to jobs at a time. A stage is checked when all its
+    dependencies are finished, so it is skipped if an upstream rerun produced identical outputs.
+    Returns the names of the failed stages.
+    """
+    dependencies = {name: deps & selected for name, deps in stage_dependencies().items() if name in selected}
+    state = load_state(base_dir)
+    done, failed, running = set(), set(), {}
+    planned = set()  # dry run: stages that would run
+    start = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=jobs, max_tasks_per_child=1) as pool:
+        while len(done) + len(failed) < len(dependencies):
+            for name in [n for n in dependencies if n not in done | failed | set(running.values())]:
+                if dependencies[name] & failed:
+                    print(f"[blocked] {name} (failed dependency)")
+                    failed.add(name)
+                elif dependencies[name] <= done:
+                    if name not in forced and not dependencies[name] & planned and is_up_to_date(base_dir, name, state):
+                        print(f"[skip]    {name} (unchanged)")
+                        done.add(name)
+                    elif dry_run:
+                        print(f"[run]     {name}")
+                        planned.add(name)
+                        done.add(name)
+                    else:
+                        print(f"[start]   {name}")
+                        running[pool.submit(run_stage, base_dir, name)] = name
+            if not running:
+                continue
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                name = running.pop(future)
+                try:
+                    seconds = future.result()
+                except Exception as e:
+                    print(f"[failed]  {name}: {e} (see {LOG_DIR}/{name}.log)")
+                    failed.add(name)
+                    continue
+                state[name] = stage_hashes(base_dir, name)
+                save_state(base_dir, state)
+                print(f"[done]    {name} in {seconds:.1f}s")
+                done.add(name)
+
+    print(f"Pipeline finished in {time.perf_counter() - start:.1f}s ({len(failed)} failed)")
+    return failed
+
+
+if __name__ == "__main__":
+    base_dir = Path(__file__).resolve().parent.parent
+
+    parser = argparse.ArgumentParser(description="Run the out-of-date data pipeline stages in parallel.")
+    parser.add_argument("--only", nargs="+", metavar="STAGE", help="consider only these stages (prefixes like 'd' or 'i_2' are accepted)")
+    parser.add_argument("--force", nargs="*", metavar="STAGE", help="rerun these stages (all if no stage is given)")
+    parser.add_argument("--jobs", type=int, default=DEFAULT_JOBS,
+                        help=f"number of parallel worker processes (default: {DEFAULT_JOBS}, more workers multiply the request rate of network stages)")
+    parser.add_argument("--dry-run", action="store_true", help="only print which stages would run")
+    parser.add_argument("--record", action="store_true", help="store the current hashes as up to date without running")
+    args = parser.parse_args()
+
+    def resolve(names):
+        resolved = {stage for name in names for stage in STAGES if stage == name or stage.startswith(f"{name}_")}
+        unknown = [name for name in names if not any(s == name or s.startswith(f"{name}_") for s in STAGES)]
+        if unknown:
+            parser.error(f"unknown stage(s): {', '.join(unknown)}")
+        return resolved
+
+    selected = resolve(args.only) if args.only else set(STAGES)
+    forced = set(STAGES) if args.force == [] else resolve(args.force or [])
+
+    if args.record:
+        state = load_state(base_dir)
+        for name in sorted(selected):
+            state[name] = stage_hashes(base_dir, name)
+        save_state(base_dir, state)
+        print(f"Recorded the hashes of {len(selected)} stages in {STATE_FILE}")
+        sys.exit(0)
+
+    failed = run_pipeline(base_dir, selected, forced, max(1, args.jobs), dry_run=args.dry_run)
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,25 @@
+# s_build_columnar_snapshots.py
+
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+from utils.snapshots import DATASETS, build_snapshot
+
+"""
+This file converts all CSV datasets loaded by the Streamlit app into typed, columnar Arrow snapshots.
+Movie and actor columns are stored as categoricals and coordinates as float32, so the app can memory-map
+the files instead of re-parsing the CSVs on every cold start.
+    -> Input: CSV files registered in utils/snapshots.py (DATASETS)
+    -> Output: Arrow IPC files in data/snapshots/ directory
+"""
+
+if __name__ == "__main__":
+    base_dir = Path(__file__).resolve().parent.parent
+
+    for i, name in enumerate(DATASETS, start=1):
+        output_file = build_snapshot(name, base_dir)
+        print(f"[{i}/{len(DATASETS)}] {name}: {DATASETS[name]['csv']} -> {output_file.relative_to(base_dir)}")
+
+    print(f"Built {len(DATASETS)} snapshots in {base_dir / 'data/snapshots'}")
@@ -0,0 +1,27 @@
+# t_build_page_views.py
+
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+from utils.knowledge_store import read_knowledge_store
+from utils.page_views import write_page_views
+
+"""
+This file writes the materialized views of the Streamlit pages: one Arrow file per page table, already joined
+with years and German titles and in the column layout the page renders (see utils/page_views.py).
+The app loads these files and falls back to joining at runtime only if they are missing or outdated.
+    -> Input: CSV datasets registered in utils/snapshots.py (DATASETS)
+    -> Output: Arrow IPC files in data/views/ directory
+"""
+
+if __name__ == "__main__":
+    base_dir = Path(__file__).resolve().parent.parent
+
+    store = read_knowledge_store(base_dir)
+    paths = write_page_views(store, base_dir)
+    for i, path in enumerate(paths, start=1):
+        print(f"[{i}/{len(paths)}] {path.relative_to(base_dir)}")
+
+    print(f"Built {len(paths)} page views in {base_dir / 'data/views'}")
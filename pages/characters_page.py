@@ -1,15 +1,13 @@
 # characters_page.py
 
 import streamlit as st
-from utils.data_loader import load_character_actor_data, load_data, load_german_titles
+from utils.page_views import load_page_view
 from utils.character_analysis import (
-    prepare_character_data,
-    get_recurring_characters,
-    filter_by_characters,
-    filter_by_character_name,
-    create_scatterplot,
-    prepare_character_details
+    build_character_appearances,
+    scatterplot_spec,
+    character_details_html
 )
+from utils.card_grid import paginate
 
 """
 The below functions are displayed in the characters page.
@@ -20,10 +18,8 @@ def show_characters_page():
     st.header(":busts_in_silhouette: Recurring Character Analysis")
 
     # ---- Load and Prepare Data ----
-    df_char = load_character_actor_data()
-    df_years = load_data()
-    df_german_titles = load_german_titles()
-    df = prepare_character_data(df_char, df_years, df_german_titles)
+    df = load_page_view("characters")  # with year, German title and movie_year label
+    appearances = build_character_appearances(df)  # character x movie matrix, shared by all reruns
 
     # ---- Filter Controls ----
     col1, col2 = st.columns([2, 1])
@@ -37,7 +33,7 @@ def show_characters_page():
         )
 
     # Get recurring characters based on min_appearances
-    recurring_chars = get_recurring_characters(df, min_appearances)
+    recurring_chars = appearances.recurring(min_appearances)
 
     with col2:
         char_options = [""] + sorted(recurring_chars)
@@ -49,16 +45,13 @@ def show_characters_page():
         )
 
     # ---- Apply Filters ----
-    df_filtered = filter_by_characters(df, recurring_chars)
-
     if selected_character:
-        df_filtered = filter_by_character_name(df_filtered, selected_character)
-        display_chars = [selected_character]
+        display_chars = [c for c in recurring_chars if c == selected_character]
     else:
         display_chars = recurring_chars
 
     # ---- Validate Data ----
-    if len(df_filtered) == 0:
+    if len(display_chars) == 0:
         st.warning("No characters found with the current filters.")
         return
 
@@ -71,18 +64,19 @@ def show_characters_page():
     if view_mode:
         # Actor Details view
         st.subheader("Actor Details")
-        display_df = prepare_character_details(df, display_chars)
+        display_df = appearances.details(display_chars)
 
         if display_df is not None:
+            page_df = paginate(display_df, key="character_details_page", page_size=25)
             st.write(
-                display_df.to_html(escape=False, index=False),
+                character_details_html(page_df),
                 unsafe_allow_html=True
             )
         else:
             st.warning("No details found for the selected characters.")
     else:
         # Scatterplot view
-        fig = create_scatterplot(df_filtered)
+        fig = scatterplot_spec(appearances, min_appearances, selected_character or None)
 
         if fig:
             st.plotly_chart(fig, width="stretch")
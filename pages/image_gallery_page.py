@@ -1,7 +1,6 @@
 # image_gallery_page.py
 
 import streamlit as st
-from utils.data_loader import load_vehicle_data, load_bond_girls_data, load_data, load_german_titles, load_villains_data
 from utils.image_gallery import (generate_vehicle_image_overview,
                                 display_vehicle_image_overview_large,
                                 generate_bond_girls_image_overview,
@@ -16,18 +15,10 @@ The below functions are displayed in the image page.
 def show_image_gallery_page():
     st.sidebar.info("You are on the image gallery page.")
 
-    # ---- Load all necessary data ----
-    df_german_titles = load_german_titles()
-
-    df_vehicles = load_vehicle_data()
-    vehicles_overview = generate_vehicle_image_overview(df_vehicles, df_german_titles)
-
-    df_bond_girls = load_bond_girls_data()
-    df_movies = load_data()
-    bond_girls_overview = generate_bond_girls_image_overview(df_bond_girls, df_movies, df_german_titles)
-
-    df_villains = load_villains_data()
-    villains_overview = generate_villains_image_overview(df_villains, df_german_titles)
+    # ---- Load all necessary data (materialized views incl. combined movie column for filtering) ----
+    vehicles_overview = generate_vehicle_image_overview()
+    bond_girls_overview = generate_bond_girls_image_overview()
+    villains_overview = generate_villains_image_overview()
 
     st.header(":camera: Image Gallery Overview")
 
@@ -37,9 +28,6 @@ def show_image_gallery_page():
     with tab1:
         st.write("#### Vehicle Gallery")
 
-        # Create combined movie column for filtering
-        vehicles_overview['movie_combined'] = vehicles_overview['movie'] + ' (' + vehicles_overview['title_de'].fillna('') + ')'
-
         # Filter by movie with dropdown box
         search = st.selectbox(
         "Filter by movie:",
@@ -65,9 +53,6 @@ def show_image_gallery_page():
     with tab2:
         st.write("#### Bond Girls Gallery")
 
-        # Create combined movie column for filtering
-        bond_girls_overview['movie_combined'] = bond_girls_overview['movie'] + ' (' + bond_girls_overview['title_de'].fillna('') + ')'
-
         # Filter by movie with dropdown box
         search = st.selectbox(
         "Filter by movie:",
@@ -94,9 +79,6 @@ def show_image_gallery_page():
     with tab3:
         st.write("#### Villains Gallery")
 
-        # Create combined movie column for filtering
-        villains_overview['movie_combined'] = villains_overview['movie'] + ' (' + villains_overview['title_de'].fillna('') + ')'
-
         # Filter by movie with dropdown box
         search = st.selectbox(
         "Filter by movie:",
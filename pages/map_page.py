@@ -1,33 +1,34 @@
 # map_page.py
- 
+
 import streamlit as st
-import pandas as pd
-from utils.data_loader import load_geo_locations
+from utils.page_views import load_page_view
+from utils.location_index import build_location_index, ZOOM_LEVELS, PLACES
 
 
 def show_map_page():
     st.sidebar.info("You are on the interactive map page.")
     st.header(":earth_africa: Filming Locations")
-    geo_locations = load_geo_locations()
+    index = build_location_index(load_page_view("locations"))  # grid clusters per zoom level, shared by all reruns
 
     # ---- Search by movie title ----
-    filtered = geo_locations.copy()
-    filtered['movie_combined'] = filtered['movie'] + ' (' + filtered['Movie_de'] + ')'
-
-    movie_search = st.selectbox("Filter by movie title:", options=filtered['movie_combined'].unique(), index=None, placeholder="Select a movie to filter...")
-    name_search = st.selectbox("Filter by location name:", options=geo_locations['name'].unique(), index=None, placeholder="Select a location to filter...")
-
-    if movie_search:
-        filtered = filtered[filtered['movie_combined'] == movie_search]
-
-    if name_search:
-        filtered = filtered[filtered['name'] == name_search]
+    movie_search = st.selectbox("Filter by movie title:", options=index.movie_options, index=None, placeholder="Select a movie to filter...")
+    name_search = st.selectbox("Filter by location name:", options=index.name_options, index=None, placeholder="Select a location to filter...")
 
+    # ---- Zoom level: clusters for the overview, individual places when zoomed in or filtered ----
+    zoom = st.select_slider(
+        "Zoom level:",
+        options=list(ZOOM_LEVELS) + [PLACES],
+        value=PLACES if movie_search or name_search else "Region"
+    )
 
     # ---- Load data -----
-    df = pd.DataFrame(filtered[['movie_combined', 'name', 'lat', 'lon']])
-    df = df.rename(columns={'movie_combined': 'movie'})
+    df = index.view(zoom, movie_search, name_search)
 
     # ---- Show map and dataframe below ----
-    st.map(df)
-    st.dataframe(df)
\ No newline at end of file
+    if zoom == PLACES:
+        st.map(df)
+        st.dataframe(df, hide_index=True)
+    else:
+        st.map(df, size='size')
+        st.caption(f"{len(df)} clusters with {df['places'].sum()} places. Zoom in to see the individual places.")
+        st.dataframe(df.drop(columns=['size']), hide_index=True)
@@ -0,0 +1,64 @@
+# card_grid.py
+import math
+import pandas as pd
+import streamlit as st
+from utils.image_cache import local_image
+
+"""
+Reusable paginated card renderer for the gallery, movie and character pages.
+Only the rows of the current page are rendered, so the number of Streamlit elements per rerun is bounded by
+the page size and not by the size of the dataset. Images are served from the local thumbnail cache
+(utils/image_cache.py) and only requested for the cards of the current page.
+"""
+
+PAGE_SIZE = 10
+
+
+# ---- Select the rows of the current page ----
+def paginate(df, key, page_size=PAGE_SIZE):
+    """
+    Show a page selector (only if there is more than one page) and return the rows of the selected page.
+    The page is stored in st.session_state[key] and reset to 1 if the filtered frame has fewer pages.
+    """
+    pages = max(1, math.ceil(len(df) / page_size))
+    if st.session_state.get(key, 1) > pages:
+        st.session_state[key] = 1
+
+    page = 1
+    if pages > 1:
+        col1, col2 = st.columns([1, 3])
+        with col1:
+            page = st.number_input(f"Page (of {pages})", min_value=1, max_value=pages, step=1, key=key)
+        with col2:
+            first = (page - 1) * page_size + 1
+            st.caption(f"Showing {first}–{min(page * page_size, len(df))} of {len(df)}")
+
+    start = (page - 1) * page_size
+    return df.iloc[start:start + page_size]
+
+
+# ---- Cards: image left, details right ----
+def display_card_grid(df, image_column, render_details, key, missing_text="No image", page_size=PAGE_SIZE):
+    """
+    Render the rows of the current page as cards.
+        - image_column: column with the image URL (shown from the thumbnail cache)
+        - render_details: function(row) writing the text of a card
+    """
+    for _, row in paginate(df, key, page_size).iterrows():
+        col1, col2 = st.columns([1, 3])
+
+        with col1:
+            url = row[image_column]
+            if pd.notna(url) and url and str(url).strip():
+                try:
+                    st.image(local_image(url), width='content')
+                except Exception as e:
+                    st.error(f"Error loading image: {e}")
+                    st.write(missing_text)
+            else:
+                st.write(missing_text)
+
+        with col2:
+            render_details(row)
+
+        st.divider()
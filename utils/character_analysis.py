@@ -1,152 +1,162 @@
 # character_analysis.py
 
+import numpy as np
 import pandas as pd
 import streamlit as st
-import plotly.express as px
+import plotly.graph_objects as go
+from utils.image_cache import image_data_uri, THUMBNAIL_WIDTH
 
 """
 Helper functions for the characters page.
 """
 
-# ---- Prepare character data with movie years and german titles ----
-@st.cache_data
-def prepare_character_data(df_char, df_years, df_german_titles):
-    """Merge character data with movie years and German titles, create combined labels."""
-    # Merge with years
-    df = df_char.merge(
-        df_years[['Year', 'Movie']],
-        left_on='movie',
-        right_on='Movie',
-        how='left'
-    )
-    df = df.drop(columns=['Movie'])
-
-    # Merge with German titles
-    df = df.merge(
-        df_german_titles[['Movie', 'Movie_de']],
-        left_on='movie',
-        right_on='Movie',
-        how='left'
-    )
-    df = df.drop(columns=['Movie'])
-
-    df = df.sort_values(by=['Year', 'movie'])
-    df['movie_year'] = df.apply(lambda row: f"{row['Year']} - {row['movie']}", axis=1)
-    return df
-
-
-# ---- Get recurring characters ----
-@st.cache_data
-def get_recurring_characters(df, min_appearances):
-    """Return list of characters with at least min_appearances."""
-    char_counts = df['character'].value_counts()
-    return char_counts[char_counts >= min_appearances].index.tolist()
-
-
-# ---- Filter dataframe by character list ----
-def filter_by_characters(df, characters):
-    """Filter dataframe to only include specified characters."""
-    return df[df['character'].isin(characters)]
-
-
-# ---- Filter by exact character name ----
-def filter_by_character_name(df, character_name):
-    """Filter dataframe to exact character name match."""
-    if character_name:
-        return df[df['character'] == character_name]
-    return df
+# ---- Character x movie appearance engine ----
+class CharacterAppearances:
+    """
+    Precomputed appearances of all characters, so the slider, the selectbox and both views are answered
+    by NumPy slicing instead of a pandas pipeline per rerun.
+        - characters: character names (sorted), movies: movie_year labels (sorted)
+        - matrix: bool (n_characters, n_movies), True if the character appears in the movie
+        - actors / movies_de: per cell / per movie lookups for the hover info
+        - counts: number of rows (appearances) per character
+        - detail_rows: rows for the Actor Details view, grouped by character and ordered by year; the rows of
+          character i are detail_rows.iloc[starts[i]:starts[i + 1]]
+    """
+
+    def __init__(self, df):
+        # Content hash, used as cache key of create_scatterplot
+        self.key = str(pd.util.hash_pandas_object(df[['character', 'actor', 'movie_year', 'Movie_de']], index=False).sum())
+        character_codes, self.characters = pd.factorize(df['character'], sort=True)
+        movie_codes, self.movies = pd.factorize(df['movie_year'], sort=True)
+        self.index = {character: i for i, character in enumerate(self.characters)}
+
+        shape = (len(self.characters), len(self.movies))
+        self.matrix = np.zeros(shape, dtype=bool)
+        self.matrix[character_codes, movie_codes] = True
+        self.counts = np.bincount(character_codes, minlength=shape[0])
+
+        # First actor per cell (as pivot_table(aggfunc='first')): first row of each (character, movie) pair
+        _, first = np.unique(character_codes * shape[1] + movie_codes, return_index=True)
+        self.actors = np.full(shape, "", dtype=object)
+        self.actors[character_codes[first], movie_codes[first]] = df['actor'].astype(str).to_numpy()[first]
+        _, first_of_movie = np.unique(movie_codes, return_index=True)
+        self.movies_de = np.empty(shape[1], dtype=object)
+        self.movies_de[movie_codes[first_of_movie]] = df['Movie_de'].to_numpy()[first_of_movie]
+
+        # Details: English and German title in one column, grouped by character, stable by year
+        movie = df['movie'].astype(str)
+        movie_combined = np.where(df['Movie_de'].notna(), movie + "<br><i>" + df['Movie_de'].astype(str) + "</i>", movie)
+        details = pd.DataFrame({
+            'character': df['character'].to_numpy(),
+            'movie': movie_combined,
+            'actor': df['actor'].to_numpy(),
+            'Year': df['Year'].to_numpy(),
+            'image_url': df['image_url'].to_numpy(),
+        })
+        order = np.lexsort((df['Year'].to_numpy(), character_codes))
+        self.detail_rows = details.iloc[order].reset_index(drop=True)
+        self.starts = np.concatenate(([0], np.cumsum(self.counts)))
+
+    def recurring(self, min_appearances):
+        """Characters with at least min_appearances."""
+        return self.characters[self.counts >= min_appearances].tolist()
+
+    def rows(self, characters):
+        """Matrix row indexes of the given character names (unknown names are skipped)."""
+        return np.array(sorted(self.index[c] for c in characters if c in self.index), dtype=np.int64)
+
+    def points(self, characters):
+        """
+        Return (character, movie_year, Movie_de, actor) arrays of all appearances of the given characters,
+        ordered by movie, then character.
+        """
+        rows = self.rows(characters)
+        movie_idx, row_idx = np.nonzero(self.matrix[rows].T)
+        char_idx = rows[row_idx]
+        return (self.characters[char_idx], self.movies[movie_idx],
+                self.movies_de[movie_idx], self.actors[char_idx, movie_idx])
+
+    def details(self, characters):
+        """Rows of the Actor Details view for the given characters (sorted by name), or None."""
+        rows = self.rows(characters)
+        if len(rows) == 0:
+            return None
+        positions = np.concatenate([np.arange(self.starts[i], self.starts[i + 1]) for i in rows])
+        return self.detail_rows.iloc[positions].reset_index(drop=True)
+
+
+@st.cache_resource
+def build_character_appearances(df):
+    """Shared appearance engine for the characters table of the knowledge store."""
+    return CharacterAppearances(df)
 
 
 # ---- Create scatterplot ----
-@st.cache_data
-def create_scatterplot(df_filtered):
-    """Create a plotly scatterplot showing character appearances across movies."""
-    if len(df_filtered) == 0:
-        return None
-
-    # Create pivot table
-    pivot = df_filtered.pivot_table(
-        index='character',
-        columns='movie_year',
-        values='actor',
-        aggfunc='first',
-        fill_value=""
-    )
-    pivot_binary = pivot.map(lambda x: 1 if x else 0)
+SCATTER_CACHE_SIZE = 64  # cached figure specs (combinations of slider value and selected character)
 
-    # Create scatter data
-    scatter_df = pivot_binary.reset_index().melt(
-        id_vars='character',
-        var_name='movie_year',
-        value_name='appears'
-    )
-    scatter_df = scatter_df[scatter_df['appears'] == 1]
 
-    if len(scatter_df) == 0:
+def create_scatterplot(appearances, characters):
+    """
+    Create a WebGL scatterplot showing the appearances of the given characters across movies.
+    Characters and movies are sent as integer positions (compact typed arrays) with the names as tick labels;
+    the hover info (German title, character, actor) is one customdata array.
+    """
+    character, movie_year, movie_de, actor = appearances.points(characters)
+    if len(character) == 0:
         return None
 
-    # Merge to get german movie titles and actors for hover info
-    scatter_df = scatter_df.merge(
-            df_filtered[['character', 'movie_year', 'Movie_de', 'actor']],
-            on=['character', 'movie_year'],
-            how='left'
-        )
-
-    fig = px.scatter(
-        scatter_df,
-        x="character",
-        y="movie_year",
-        color="appears",
-        color_discrete_sequence=["blue"],
-        size=[2] * len(scatter_df),
-        custom_data=['Movie_de', 'actor']
-    )
+    # Characters in order of their first appearance, movies in chronological order
+    x, x_labels = pd.factorize(character)
+    y, y_labels = pd.factorize(movie_year)
 
-    fig.update_traces(
-        marker=dict(symbol="circle", opacity=0.9),
-        hovertemplate='<b>%{customdata[0]}</b><br>%{x}<br>%{customdata[1]}<extra></extra>'
-    )
+    fig = go.Figure(go.Scattergl(
+        x=x.astype(np.int16),
+        y=y.astype(np.int16),
+        mode="markers",
+        marker=dict(symbol="circle", size=20, color="blue", opacity=0.9),
+        customdata=np.column_stack([movie_de, character, actor]),
+        hovertemplate='<b>%{customdata[0]}</b><br>%{customdata[1]}<br>%{customdata[2]}<extra></extra>'
+    ))
 
-    num_movies = scatter_df['movie_year'].nunique()
-    dynamic_height = max(700, num_movies * 40)  # Adjust height based on number of movies: max 600px, 30px per movie
+    dynamic_height = max(700, len(y_labels) * 40)  # Adjust height based on number of movies: min 700px, 40px per movie
 
     fig.update_layout(
-        xaxis=dict(side="top"),
         height=dynamic_height,
-        xaxis_tickangle=-45,
         showlegend=False
     )
-    fig.update_coloraxes(showscale=False)
-    fig.update_yaxes(tickfont=dict(size=14), showgrid=False, dtick=1, title="")
-    fig.update_xaxes(tickfont=dict(size=14), showgrid=True, title="")
+    fig.update_xaxes(side="top", tickangle=-45, tickmode="array", tickvals=np.arange(len(x_labels)),
+                     ticktext=list(x_labels), range=[-0.5, len(x_labels) - 0.5],
+                     tickfont=dict(size=14), showgrid=True, zeroline=False, title="")
+    fig.update_yaxes(tickmode="array", tickvals=np.arange(len(y_labels)), ticktext=list(y_labels),
+                     range=[-0.5, len(y_labels) - 0.5],
+                     tickfont=dict(size=14), showgrid=False, zeroline=False, title="")
 
     return fig
 
 
-# ---- Prepare character details for display ----
-@st.cache_data
-def prepare_character_details(df, character_list):
-    """Get character details for all characters in the list and format for display."""
-    all_details = []
-
-    for character in sorted(character_list):
-        char_df = df[df['character'] == character].copy()
-        char_df = char_df.sort_values('Year')
-
-        if len(char_df) > 0:
-            char_df["image"] = char_df["image_url"].apply(
-                lambda url: f'<img src="{url}" width="100">' if pd.notna(url) else ""
-            )
-            # Combine English and German titles in one column
-            char_df["movie_combined"] = char_df.apply(
-                lambda row: f"{row['movie']}<br><i>{row['Movie_de']}</i>" if pd.notna(row['Movie_de']) else row['movie'],
-                axis=1
-            )
-            display_df = char_df[['character', 'movie_combined', 'actor', 'Year', 'image']]
-            display_df = display_df.rename(columns={'movie_combined': 'movie'})
-            all_details.append(display_df)
-
-    if all_details:
-        return pd.concat(all_details, ignore_index=True)
-
-    return None
+@st.cache_data(max_entries=SCATTER_CACHE_SIZE,
+               hash_funcs={CharacterAppearances: lambda appearances: appearances.key})
+def scatterplot_spec(appearances, min_appearances, selected_character=None):
+    """
+    Figure spec (plotly dict) of the scatterplot for the filters of the page, or None if nothing matches.
+    Cached per (min_appearances, selected_character); the oldest combinations are evicted first.
+    """
+    characters = appearances.recurring(min_appearances)
+    if selected_character:
+        characters = [c for c in characters if c == selected_character]
+    fig = create_scatterplot(appearances, characters)
+    return fig.to_dict() if fig is not None else None
+
+
+# ---- Render one page of character details as HTML table ----
+def character_details_html(page_df):
+    """
+    HTML table of the given rows. Thumbnails warmed by utils/warmup.py are embedded as data URIs; images not
+    cached yet are linked by their original URL (loaded lazily by the browser) and downloaded in the background.
+    """
+    page_df = page_df.copy()
+    page_df["image"] = page_df.pop("image_url").apply(
+        lambda url: (f'<img src="{image_data_uri(url, THUMBNAIL_WIDTH, wait=False)}" width="100" loading="lazy">'
+                     if pd.notna(url) else "")
+    )
+    return page_df.to_html(escape=False, index=False)
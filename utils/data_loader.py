@@ -1,52 +1,87 @@
 # data_loader.py
  
+import os
 import pandas as pd
 import streamlit as st
+from utils.snapshots import read_dataset
 
 """
 Helper function to load datasets with caching.
+The CSV datasets are read through utils/snapshots.py, which memory-maps the typed Arrow snapshots
+(built by data_pipeline/s_build_columnar_snapshots.py) and falls back to the CSV files.
 """
 
 # ---- Load main CSV-dataset with caching ----
 @st.cache_data
 def load_data():
-    df = pd.read_csv('data/jamesbond_with_id.csv', 
-                     sep=';', encoding='utf-8')
+    df = read_dataset('movies')
     return df
 
 # ---- Load german movie title ----
-@st.cache_data
-def load_german_titles():
-    """
-    Load German movie titles and align column names with the main dataset.
-    """
-    df_titles = pd.read_csv('extract_knowledge/movie_title_german/movie_title_en_de.csv', encoding='utf-8')
+def prepare_german_titles(df_titles):
+    """Align the column names of the German titles with the main dataset."""
     # Assuming columns: title_en, title_de
-    df_titles = df_titles.rename(columns={
+    return df_titles.rename(columns={
         "title_en": "Movie",
         "title_de": "Movie_de"
     })
-    return df_titles
 
-# ---- Load main TTL-dataset with caching ----
 @st.cache_data
-def load_ttl():
-    with open('data/triple_store/james_bond_knowledge.ttl', 'r', encoding='utf-8') as file:
-        ttl_data = file.read()
-    return ttl_data
+def load_german_titles():
+    """
+    Load German movie titles and align column names with the main dataset.
+    """
+    df_titles = read_dataset('german_titles')
+    return prepare_german_titles(df_titles)
+
+# ---- Load knowledge graph (binary snapshot, TTL as fallback) ----
+KNOWLEDGE_GRAPH_SNAPSHOT = 'data/triple_store/james_bond_knowledge.npz'
+KNOWLEDGE_GRAPH_TTL = 'data/triple_store/james_bond_knowledge.ttl'
+
+def knowledge_graph_key():
+    """
+    Return (path, mtime) of the file the knowledge graph is loaded from.
+    The binary snapshot written by q_merge_json_to_knowledge_graph.py is preferred over the TTL file, unless the
+    TTL file is newer (regenerated without rebuilding the snapshot).
+    """
+    if not os.path.exists(KNOWLEDGE_GRAPH_SNAPSHOT):
+        return KNOWLEDGE_GRAPH_TTL, os.path.getmtime(KNOWLEDGE_GRAPH_TTL)
+    snapshot_mtime = os.path.getmtime(KNOWLEDGE_GRAPH_SNAPSHOT)
+    if os.path.exists(KNOWLEDGE_GRAPH_TTL) and os.path.getmtime(KNOWLEDGE_GRAPH_TTL) > snapshot_mtime:
+        return KNOWLEDGE_GRAPH_TTL, os.path.getmtime(KNOWLEDGE_GRAPH_TTL)
+    return KNOWLEDGE_GRAPH_SNAPSHOT, snapshot_mtime
+
+@st.cache_resource(max_entries=1)
+def load_knowledge_graph(path, mtime):
+    """
+    Return the knowledge graph as rdflib Graph, shared by all sessions of the process.
+    The cache is keyed on path and mtime, so a rebuilt graph file is picked up without a restart;
+    only the latest graph is kept, the one of the previous file version is released.
+    """
+    from rdflib import Graph
+    from utils.kg_snapshot import load_kg_snapshot, snapshot_to_graph
+
+    if path.endswith('.npz'):
+        terms, triples = load_kg_snapshot(path)
+        return snapshot_to_graph(terms, triples)
+
+    g = Graph()
+    g.parse(path, format='ttl')
+    return g
 
 # ---- Load poster URLs with caching ----
+def prepare_poster_urls(df_posters):
+    # Remove '/revision/latest' parameter from URLs (it may cause issues with image loading)
+    df_posters['poster_url'] = df_posters['poster_url'].apply(
+        lambda x: x.split('/revision/latest')[0] if pd.notna(x) and '/revision/latest' in str(x) else x
+    )
+    return df_posters
+
 @st.cache_data
 def load_poster_urls():
     try:
-        df_posters = pd.read_csv('extract_knowledge/movie_posters/movie_poster_url.csv')
-        
-        # Remove '/revision/latest' parameter from URLs (it may cause issues with image loading)
-        df_posters['poster_url'] = df_posters['poster_url'].apply(
-            lambda x: x.split('/revision/latest')[0] if pd.notna(x) and '/revision/latest' in str(x) else x
-        )
-        
-        return df_posters
+        df_posters = read_dataset('posters')
+        return prepare_poster_urls(df_posters)
     except FileNotFoundError:
         st.warning("Poster File not found.")
         return pd.DataFrame(columns=['title', 'poster_url'])
@@ -55,27 +90,17 @@ def load_poster_urls():
 @st.cache_data
 def load_geo_locations():
     try:
-        df_locations = pd.read_csv('extract_knowledge/geocoded_locations/all_movies_geocoded.csv', sep=',', encoding='utf-8')
-
-        # Merge with German titles
-        df_titles = load_german_titles()
-        df_locations = df_locations.merge(
-            df_titles,
-            left_on='movie',
-            right_on='Movie',
-            how='left'
-        )
-        df_locations = df_locations.drop(columns=['Movie'])
+        df_locations = read_dataset('geo_locations')
         return df_locations
     except FileNotFoundError:
         st.warning("Geocoded Locations File not found.")
-        return pd.DataFrame(columns=['name', 'movie', 'Movie_de', 'lat', 'lon'])
+        return pd.DataFrame(columns=['name', 'movie', 'lat', 'lon'])
     
 # ---- Load character-actor pairs with caching ----
 @st.cache_data
 def load_character_actor_data():
     try:
-        df_characters = pd.read_csv('extract_knowledge/characters/all_movie_characters_with_image.csv', sep=';', encoding='utf-8')
+        df_characters = read_dataset('characters')
         return df_characters
     except FileNotFoundError:
         st.warning("Character-Actor File not found.")
@@ -85,7 +110,7 @@ def load_character_actor_data():
 @st.cache_data
 def load_vehicle_data():
     try:
-        df_vehicles = pd.read_csv('extract_knowledge/vehicles/all_movie_vehicles_with_image.csv', sep=';', encoding='utf-8')
+        df_vehicles = read_dataset('vehicles')
         return df_vehicles
     except FileNotFoundError:
         st.warning("Vehicle File not found.")
@@ -95,7 +120,7 @@ def load_vehicle_data():
 @st.cache_data
 def load_bond_girls_data():
     try:
-        df_bond_girls = pd.read_csv('extract_knowledge/bond_girls/bond_girls_with_images.csv', sep=';', encoding='utf-8')
+        df_bond_girls = read_dataset('bond_girls')
         return df_bond_girls
     except FileNotFoundError:
         st.warning("Bond Girls File not found.")
@@ -105,7 +130,7 @@ def load_bond_girls_data():
 @st.cache_data
 def load_song_data():
     try:
-        df_songs = pd.read_csv('extract_knowledge/songs/all_movie_songs.csv', sep=';', encoding='utf-8')
+        df_songs = read_dataset('songs')
         return df_songs
     except FileNotFoundError:
         st.warning("Song File not found.")
@@ -115,7 +140,7 @@ def load_song_data():
 @st.cache_data
 def load_villains_data():
     try:
-        df_villains = pd.read_csv('extract_knowledge/villains/all_villains_with_images.csv', sep=';', encoding='utf-8')
+        df_villains = read_dataset('villains')
         return df_villains
     except FileNotFoundError:
         st.warning("Villains File not found.")
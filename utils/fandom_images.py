@@ -0,0 +1,145 @@
+# fandom_images.py
+
+import time
+from utils import http_cache
+from utils.http_fetcher import polite_get, fetch_all
+
+"""
+Batched image lookups on the James Bond Fandom wiki for the image stages (f, h, i_1, k).
+Each stage builds its candidate page titles per row in order of preference (e.g. "Character (Movie)",
+"Character (Actor)", "Character") and hands all of them to one resolver call:
+    - titles are deduplicated, so recurring characters like "M", "Q" or "James Bond" are looked up once
+    - titles resolved by an earlier stage or run are read from the table fandom_images of the HTTP cache database
+      (data/http_cache.sqlite) and not requested again; each batch is stored as soon as it is resolved
+    - the remaining titles are sent 50 per request (the MediaWiki limit) with redirects=1, so a title that
+      redirects to the real character page gets that page's image
+first_image() then picks the first candidate of a row that has an image. A stage needs a few dozen requests
+instead of one request per candidate title and row.
+"""
+
+FANDOM_API = "https://jamesbond.fandom.com/api.php"
+BATCH_SIZE = 50  # titles per request, limit of the MediaWiki API for normal users
+
+# Query parameters per lookup kind: the main image of a page, or the URL of a File: page
+IMAGE_PROPS = {
+    "pageimages": {"prop": "pageimages", "piprop": "original", "pilimit": BATCH_SIZE},
+    "imageinfo": {"prop": "imageinfo", "iiprop": "url"},
+}
+
+
+def clean_image_url(img_url):
+    """Remove the revision path and query parameters of a Fandom image URL."""
+    img_url = img_url.split('/revision/')[0] if '/revision/' in img_url else img_url
+    return img_url.split('?')[0]
+
+
+def page_image(page, kind):
+    if kind == "pageimages":
+        return page.get('original', {}).get('source')
+    imageinfo = page.get('imageinfo', [])
+    return imageinfo[0].get('url') if imageinfo else None
+
+
+def resolve_alias(title, aliases):
+    """Follow normalizations and redirects (title -> target page)."""
+    seen = set()
+    while title in aliases and title not in seen:
+        seen.add(title)
+        title = aliases[title]
+    return title
+
+
+# ---- One batch request ----
+def query_batch(titles, kind):
+    """{title: image URL or None} for up to BATCH_SIZE titles in one request (plus continuations)."""
+    params = {"action": "query", "titles": "|".join(titles), "redirects": 1, "format": "json", **IMAGE_PROPS[kind]}
+    images, aliases = {}, {}
+    while True:
+        data = polite_get(FANDOM_API, params=params).json()
+        if 'error' in data:
+            raise RuntimeError(data['error'].get('info', 'Fandom API error'))
+
+        query = data.get('query', {})
+        for entry in query.get('normalized', []) + query.get('redirects', []):
+            aliases[entry['from']] = entry['to']
+        for page in query.get('pages', {}).values():
+            img_url = page_image(page, kind)
+            if img_url:
+                images[page['title']] = clean_image_url(img_url)
+
+        if 'continue' not in data:
+            break
+        params = {**params, **data['continue']}
+
+    return {title: images.get(resolve_alias(title, aliases)) for title in titles}
+
+
+# ---- Resolved titles shared by the stages ----
+def images_table():
+    cache = http_cache.get_http_cache()
+    with cache.lock:
+        cache.connection.execute(
+            "CREATE TABLE IF NOT EXISTS fandom_images "
+            "(kind TEXT, title TEXT, image_url TEXT, fetched_at REAL, PRIMARY KEY (kind, title))")
+    return cache
+
+
+def stored_images(titles, kind):
+    """Titles resolved within the TTL of Fandom, also by other stages."""
+    if http_cache.HTTP_CACHE_DISABLED:
+        return {}
+    cache = images_table()
+    oldest = time.time() - http_cache.source_ttl(FANDOM_API)
+    stored = {}
+    with cache.lock:
+        for i in range(0, len(titles), 500):
+            chunk = titles[i:i + 500]
+            rows = cache.connection.execute(
+                f"SELECT title, image_url FROM fandom_images WHERE kind = ? AND fetched_at >= ? "
+                f"AND title IN ({','.join('?' * len(chunk))})", (kind, oldest, *chunk))
+            stored.update(rows.fetchall())
+    return stored
+
+
+def store_images(images, kind):
+    if http_cache.HTTP_CACHE_DISABLED or not images:
+        return
+    cache = images_table()
+    now = time.time()
+    with cache.lock:
+        cache.connection.executemany(
+            "INSERT OR REPLACE INTO fandom_images VALUES (?, ?, ?, ?)",
+            [(kind, title, img_url, now) for title, img_url in images.items()])
+        cache.connection.commit()
+
+
+# ---- Resolver ----
+def resolve_images(titles, kind="pageimages"):
+    """
+    {title: image URL or None} for all titles (duplicates, empty titles and titles with '|' are dropped).
+    kind 'pageimages' returns the main image of a page, 'imageinfo' the file URL of 'File:...' titles.
+    """
+    titles = list(dict.fromkeys(t for t in titles if isinstance(t, str) and t.strip() and '|' not in t))
+    images = stored_images(titles, kind)
+    missing = [t for t in titles if t not in images]
+    batches = [missing[i:i + BATCH_SIZE] for i in range(0, len(missing), BATCH_SIZE)]
+
+    def resolve_batch(batch):
+        # Stored per batch, so the batches resolved before a failing one are kept for the next run
+        result = query_batch(batch, kind)
+        store_images(result, kind)
+        return result
+
+    print(f"Resolving {len(titles)} titles ({kind}): {len(images)} already resolved, "
+          f"{len(missing)} in {len(batches)} requests")
+    for result in fetch_all(resolve_batch, batches, describe=lambda batch: f"{len(batch)} titles from '{batch[0]}'"):
+        images.update(result)
+    return images
+
+
+def first_image(candidates, images):
+    """(image URL, title) of the first candidate title with an image, or (None, None)."""
+    for title in candidates:
+        if images.get(title):
+            return images[title], title
+    return None, None
@@ -0,0 +1,217 @@
+# gazetteer.py
+
+import bisect
+import csv
+import unicodedata
+from functools import cached_property
+import numpy as np
+import pandas as pd
+from utils.geocoding import Location, normalize_place
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:  # scipy is optional, without it reverse lookups scan all places
+    cKDTree = None
+
+"""
+Offline geocoder for stage d (data_pipeline/d_extract_locations_all_movies.py), backed by a GeoNames gazetteer
+(tab-separated dump such as cities15000.txt or allCountries.txt from https://download.geonames.org/export/dump/,
+placed in data/gazetteer/). The file is loaded once into a compact, array-backed store:
+    - lat / lon / population / feature class / country code: one numpy array each, indexed by place id
+    - keys / key_ids: sorted normalized names (name, ASCII name and alternate names) as one UTF-8 buffer with
+      an offset array (SortedKeys), and their place ids; exact and prefix lookups are a binary search
+    - tree: KD-tree over the places as 3D unit vectors, for reverse lookups (nearest places of a point); built
+      on the first reverse lookup, so forward geocoding (stage d) does not pay for it
+geocode("Istanbul, Turkey") looks up the name before the first comma; if several places share it, a context
+after the comma or a near=(lat, lon) point picks the closest one, otherwise administrative areas and populated
+places with the largest population come first. No network is needed, and a lookup takes microseconds instead
+of Nominatim's one request per second.
+"""
+
+GEONAMES_COLUMNS = [
+    "geonameid", "name", "asciiname", "alternatenames", "latitude", "longitude", "feature_class", "feature_code",
+    "country_code", "cc2", "admin1_code", "admin2_code", "admin3_code", "admin4_code", "population", "elevation",
+    "dem", "timezone", "modification_date",
+]
+EARTH_RADIUS_KM = 6371.0
+# Preferred feature classes for equally named places: A (countries, states), P (cities), then the rest
+FEATURE_CLASS_RANK = {"A": 0, "P": 1}
+PREFIX_MATCHES = 50  # candidates read from the prefix index for a name without exact match
+
+
+def normalize_name(name):
+    """normalize_place() without accents: 'São Paulo' -> 'sao paulo'."""
+    name = unicodedata.normalize("NFKD", normalize_place(name))
+    return "".join(c for c in name if not unicodedata.combining(c))
+
+
+def unit_vectors(lat, lon):
+    lat, lon = np.radians(lat), np.radians(lon)
+    return np.column_stack([np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)])
+
+
+def chord_to_km(chord):
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.clip(chord / 2, 0, 1))
+
+
+# ---- Sorted name keys ----
+class SortedKeys:
+    """
+    Sorted byte strings in one buffer: key i is buffer[offsets[i]:offsets[i + 1]]. Supports len() and indexing,
+    so the bisect module searches it like a list, at one pointer-free byte string for all keys.
+    """
+
+    def __init__(self, keys):
+        """keys: sorted sequence of bytes (UTF-8 byte order equals code point order)."""
+        lengths = np.fromiter(map(len, keys), dtype=np.int64, count=len(keys))
+        self.offsets = np.zeros(len(keys) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=self.offsets[1:])
+        self.bounds = memoryview(self.offsets)  # indexing a memoryview yields Python ints, faster than numpy scalars
+        self.buffer = b"".join(keys)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        return self.buffer[self.bounds[i]:self.bounds[i + 1]]
+
+
+# ---- Gazetteer ----
+class Gazetteer:
+    """
+    Array-backed place store with a prefix index and a KD-tree (built on demand).
+    geocode(name) has the interface of a geopy geocoder, so the gazetteer can stand in for Nominatim in
+    utils/geocoding.CachedGeocoder.
+    """
+
+    def __init__(self, places, alternate_names=True):
+        """places: DataFrame with the GeoNames columns name, asciiname, alternatenames, latitude, longitude,
+        feature_class, country_code and population."""
+        places = places.reset_index(drop=True)
+        self.names = places["name"].to_numpy(dtype=object)
+        self.lat = places["latitude"].to_numpy(dtype=np.float64)
+        self.lon = places["longitude"].to_numpy(dtype=np.float64)
+        self.population = places["population"].fillna(0).to_numpy(dtype=np.int64)
+        self.feature_class = places["feature_class"].fillna("").to_numpy(dtype="U1")
+        self.country_code = places["country_code"].fillna("").to_numpy(dtype="U2")
+
+        # Prefix index: every normalized name of a place once, sorted by UTF-8 bytes
+        columns = ["name", "asciiname"] + (["alternatenames"] if alternate_names else [])
+        names = places[columns].fillna("")
+        if alternate_names:
+            names["alternatenames"] = names["alternatenames"].str.split(",")
+        names = names.melt(ignore_index=False, value_name="names")["names"].explode()
+        keys = pd.DataFrame({"key": [normalize_name(name).encode("utf-8") for name in names],
+                             "place_id": np.asarray(names.index, dtype=np.int32)})
+        keys = keys[keys["key"] != b""].drop_duplicates().sort_values(["key", "place_id"], kind="stable")
+        self.keys = SortedKeys(keys["key"].tolist())
+        self.key_ids = keys["place_id"].to_numpy(dtype=np.int32)
+
+    @classmethod
+    def from_file(cls, path, alternate_names=True):
+        """Load a GeoNames dump (tab-separated, no header, no quoting)."""
+        places = pd.read_csv(
+            path, sep="\t", header=None, names=GEONAMES_COLUMNS, quoting=csv.QUOTE_NONE, keep_default_na=False,
+            na_values={"population": [""]}, encoding="utf-8",
+            usecols=["name", "asciiname", "alternatenames", "latitude", "longitude", "feature_class",
+                     "country_code", "population"],
+            dtype={"name": str, "asciiname": str, "alternatenames": str, "latitude": "float64", "longitude": "float64",
+                   "feature_class": str, "country_code": str, "population": "float64"})
+        return cls(places, alternate_names=alternate_names)
+
+    def __len__(self):
+        return len(self.names)
+
+    # ---- Prefix index (keys are UTF-8 bytes, b"\xff" sorts after every key with the same prefix) ----
+    def exact(self, key):
+        """Place ids whose normalized name is key."""
+        key = key.encode("utf-8")
+        start = bisect.bisect_left(self.keys, key)
+        end = bisect.bisect_right(self.keys, key, lo=start)
+        return np.unique(self.key_ids[start:end])
+
+    def prefix(self, key, limit=PREFIX_MATCHES):
+        """Place ids with a name that starts with the words of key (e.g. 'monte' -> 'monte carlo')."""
+        key = (key + " ").encode("utf-8")
+        start = bisect.bisect_left(self.keys, key)
+        end = bisect.bisect_left(self.keys, key + b"\xff", lo=start)
+        return np.unique(self.key_ids[start:min(end, start + limit)])
+
+    def search(self, text, limit=10):
+        """Names starting with text, largest population first (for autocompletion)."""
+        key = normalize_name(text).encode("utf-8")
+        start = bisect.bisect_left(self.keys, key)
+        end = bisect.bisect_left(self.keys, key + b"\xff", lo=start)
+        ids = np.unique(self.key_ids[start:end])
+        ids = ids[np.argsort(-self.population[ids], kind="stable")][:limit]
+        return [self.place(i) for i in ids]
+
+    # ---- KD-tree (reverse lookups only) ----
+    @cached_property
+    def vectors(self):
+        return unit_vectors(self.lat, self.lon)
+
+    @cached_property
+    def tree(self):
+        return cKDTree(self.vectors) if cKDTree is not None else None
+
+    def nearest(self, lat, lon, k=1):
+        """(place ids, distances in km) of the k places nearest to a point."""
+        point = unit_vectors(np.atleast_1d(lat), np.atleast_1d(lon))[0]
+        k = min(k, len(self))
+        if self.tree is not None:
+            chord, ids = self.tree.query(point, k=k)
+            return np.atleast_1d(ids), chord_to_km(np.atleast_1d(chord))
+        chord = np.linalg.norm(self.vectors - point, axis=1)
+        ids = np.argsort(chord, kind="stable")[:k]
+        return ids, chord_to_km(chord[ids])
+
+    def reverse(self, lat, lon, k=1):
+        """The k places nearest to a point, with their distance."""
+        ids, km = self.nearest(lat, lon, k)
+        return [{**self.place(i), "distance_km": float(d)} for i, d in zip(ids, km)]
+
+    # ---- Forward lookup ----
+    def place(self, place_id):
+        return {"name": self.names[place_id], "lat": float(self.lat[place_id]), "lon": float(self.lon[place_id]),
+                "country_code": str(self.country_code[place_id]), "population": int(self.population[place_id])}
+
+    def rank(self, ids):
+        """Administrative areas and populated places first, then by population."""
+        feature_rank = np.array([FEATURE_CLASS_RANK.get(c, 2) for c in self.feature_class[ids]])
+        return ids[np.lexsort((-self.population[ids], feature_rank))]
+
+    def candidates(self, name):
+        key = normalize_name(name)
+        ids = self.exact(key)
+        return ids if len(ids) else self.prefix(key)
+
+    def closest(self, ids, lat, lon):
+        """The candidate nearest to a point (used to disambiguate equally named places)."""
+        point = unit_vectors(np.atleast_1d(lat), np.atleast_1d(lon))[0]
+        return ids[np.argmin(np.linalg.norm(unit_vectors(self.lat[ids], self.lon[ids]) - point, axis=1))]
+
+    def lookup(self, query, near=None):
+        """Place id for 'name' or 'name, context' (or None); near=(lat, lon) prefers the closest candidate."""
+        name, _, context = str(query).partition(",")
+        ids = self.candidates(name)
+        if len(ids) == 0:
+            return None
+        if len(ids) == 1:
+            return ids[0]
+
+        if near is None and context.strip():
+            context_id = self.lookup(context)
+            if context_id is not None:
+                near = (self.lat[context_id], self.lon[context_id])
+        if near is not None:
+            return self.closest(ids, *near)
+        return self.rank(ids)[0]
+
+    def geocode(self, query, near=None):
+        """geopy-style result (latitude, longitude, address) or None."""
+        place_id = self.lookup(query, near)
+        if place_id is None:
+            return None
+        return Location(float(self.lat[place_id]), float(self.lon[place_id]),
+                        address=f"{self.names[place_id]}, {self.country_code[place_id]}")
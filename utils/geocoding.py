@@ -0,0 +1,148 @@
+# geocoding.py
+
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from pathlib import Path
+from utils.http_cache import HTTP_CACHE_PATH
+
+"""
+Persistent geocoding cache for the film locations (data_pipeline/d_extract_locations_all_movies.py).
+Stage d extracts the place names of all movies first and geocodes each distinct name once:
+    - names are keyed by normalize_place(), so "London", "london" and "[[London]]" are one lookup
+    - results (also "not found") are stored per provider in the table geocodes of data/http_cache.sqlite
+      and survive between runs
+    - only cache misses reach the provider, at most one request per min_interval seconds
+      (Nominatim allows one request per second)
+Any object with a geopy-style geocode(name) method can be the provider; LocalGeocoder is a stand-in backed by
+a dict, for runs without network and for benchmarks/benchmark_geocode_cache.py.
+"""
+
+NOMINATIM_INTERVAL = 1.0  # seconds between two requests to Nominatim (usage policy)
+GEOCODE_TTL = 180 * 24 * 60 * 60  # places hardly move; "not found" results are retried after the same time
+
+
+def normalize_place(name):
+    """'[[London]]', ' london ', 'LONDON' -> 'london' (the same characters as the data cleaning of stage d are removed)"""
+    name = unicodedata.normalize("NFKC", str(name)).casefold()
+    name = re.sub(r"[\[\]\(\)\"\'\|]", " ", name)
+    return " ".join(name.split())
+
+
+# ---- Stand-in provider ----
+class Location:
+    """Result of LocalGeocoder (and utils/gazetteer.py), with the attributes of a geopy Location that stage d uses."""
+
+    def __init__(self, latitude, longitude, address=None):
+        self.latitude = latitude
+        self.longitude = longitude
+        self.address = address
+
+
+class LocalGeocoder:
+    """Geocoder backed by a dict {place name: (lat, lon)}; delay simulates the round trip of a real provider."""
+
+    def __init__(self, places, delay=0.0):
+        self.places = {normalize_place(name): coords for name, coords in places.items()}
+        self.delay = delay
+        self.calls = 0
+
+    def geocode(self, name):
+        self.calls += 1
+        time.sleep(self.delay)
+        coords = self.places.get(normalize_place(name))
+        return Location(*coords) if coords else None
+
+
+# ---- Cache ----
+class CachedGeocoder:
+    """
+    Geocoder with a persistent cache in front of a rate-limited provider.
+        - provider: object with geocode(name) -> result with .latitude / .longitude, or None
+        - provider_name: part of the cache key, so results of different providers are kept apart
+        - stats: number of cache hits, provider calls and names not found, for the report of the stage
+    """
+
+    def __init__(self, provider, provider_name, path=HTTP_CACHE_PATH, min_interval=NOMINATIM_INTERVAL, ttl=GEOCODE_TTL):
+        self.provider = provider
+        self.provider_name = provider_name
+        self.min_interval = min_interval
+        self.ttl = ttl
+        self.last_call = 0.0
+        self.stats = {"hits": 0, "provider_calls": 0, "not_found": 0}
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS geocodes (
+                provider TEXT NOT NULL,
+                key TEXT NOT NULL,
+                query TEXT NOT NULL,
+                lat REAL,
+                lon REAL,
+                fetched_at REAL NOT NULL,
+                PRIMARY KEY (provider, key)
+            )""")
+        self.connection.commit()
+
+    def lookup(self, key):
+        with self.lock:
+            return self.connection.execute(
+                "SELECT lat, lon FROM geocodes WHERE provider = ? AND key = ? AND fetched_at >= ?",
+                (self.provider_name, key, time.time() - self.ttl)).fetchone()
+
+    def store(self, key, name, coords):
+        lat, lon = coords if coords else (None, None)
+        with self.lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO geocodes VALUES (?, ?, ?, ?, ?, ?)",
+                (self.provider_name, key, name, lat, lon, time.time()))
+            self.connection.commit()
+
+    def query_provider(self, name):
+        """One provider request, spaced at least min_interval seconds after the previous one."""
+        wait = self.last_call + self.min_interval - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        try:
+            result = self.provider.geocode(name)
+        finally:
+            self.last_call = time.monotonic()
+            self.stats["provider_calls"] += 1
+        return (result.latitude, result.longitude) if result else None
+
+    def geocode(self, name):
+        """(lat, lon) of a place name or None; raises if the provider fails (failures are not cached)."""
+        key = normalize_place(name)
+        row = self.lookup(key)
+        if row is not None:
+            self.stats["hits"] += 1
+            coords = None if row[0] is None else row
+        else:
+            coords = self.query_provider(name)
+            self.store(key, name, coords)
+        if coords is None:
+            self.stats["not_found"] += 1
+        return coords
+
+    def geocode_all(self, names):
+        """{name: (lat, lon) or None} for all names; each normalized name is geocoded once."""
+        coordinates = {}
+        by_key = {}
+        for name in names:
+            key = normalize_place(name)
+            if key not in by_key:
+                try:
+                    by_key[key] = self.geocode(name)
+                except Exception as e:
+                    print(f"Geocoding failed for {name}: {e}")
+                    by_key[key] = None
+            coordinates[name] = by_key[key]
+        return coordinates
+
+    def report(self):
+        return (f"Geocoding ({self.provider_name}): {self.stats['hits']} from cache, "
+                f"{self.stats['provider_calls']} provider requests, {self.stats['not_found']} not found")
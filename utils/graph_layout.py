@@ -0,0 +1,70 @@
+# graph_layout.py
+
+import numpy as np
+
+"""
+Vectorized force-directed layout (Fruchterman-Reingold) for the RDF graph page.
+The coordinates are computed server-side once per view and movie selection (see utils/rdf_views.py) and sent
+to streamlit_agraph with physics disabled, so the browser does not have to run its own force simulation.
+"""
+
+LAYOUT_ITERATIONS = 120
+LAYOUT_SEED = 42
+NODE_SPACING = 90  # approx. distance between neighbouring nodes in pixels
+
+
+# ---- Force-directed layout ----
+def force_layout(node_ids, edge_pairs, iterations=LAYOUT_ITERATIONS, seed=LAYOUT_SEED):
+    """
+    Return a dict node id -> (x, y) in pixels.
+        - node_ids: list of unique node ids
+        - edge_pairs: iterable of (source id, target id); pairs with unknown ids or self-loops are ignored
+    Repulsion between all node pairs is computed from one (n, n) distance matrix per iteration, attraction
+    along the edges with np.add.at. A weak gravity keeps disconnected components close to the centre.
+    The result is deterministic for the same input (fixed seed).
+    """
+    n = len(node_ids)
+    if n == 0:
+        return {}
+    if n == 1:
+        return {node_ids[0]: (0.0, 0.0)}
+
+    index = {node_id: i for i, node_id in enumerate(node_ids)}
+    pairs = [(index[s], index[t]) for s, t in edge_pairs if s in index and t in index and s != t]
+    edges = np.array(pairs, dtype=np.int64).reshape(-1, 2)
+
+    rng = np.random.default_rng(seed)
+    pos = rng.uniform(-1.0, 1.0, size=(n, 2)).astype(np.float32)
+    k = np.float32(np.sqrt(4.0 / n))  # ideal edge length in the [-1, 1] square
+    temperature = 0.1
+    cooling = temperature / (iterations + 1)
+
+    for _ in range(iterations):
+        # Repulsion: k^2 / d between all pairs, from the (n, n) matrix of squared distances
+        squared = (pos ** 2).sum(axis=1)
+        distance2 = squared[:, None] + squared[None, :] - 2 * (pos @ pos.T)
+        np.maximum(distance2, 1e-4, out=distance2)
+        weights = (k * k) / distance2
+        np.fill_diagonal(weights, 0)
+        displacement = pos * weights.sum(axis=1)[:, None] - weights @ pos
+
+        # Attraction: d^2 / k along the edges
+        if len(edges):
+            edge_delta = pos[edges[:, 0]] - pos[edges[:, 1]]
+            edge_distance = np.sqrt((edge_delta ** 2).sum(axis=-1, keepdims=True))
+            force = edge_delta * edge_distance / k
+            np.add.at(displacement, edges[:, 0], -force)
+            np.add.at(displacement, edges[:, 1], force)
+
+        # Gravity towards the centre
+        displacement -= pos * (0.1 * k)
+
+        # Move at most by the current temperature
+        length = np.sqrt((displacement ** 2).sum(axis=-1, keepdims=True))
+        np.maximum(length, 1e-9, out=length)
+        pos += displacement / length * np.minimum(length, temperature)
+        temperature -= cooling
+
+    # Scale to pixels: neighbouring nodes about NODE_SPACING apart
+    pos = (pos - pos.mean(axis=0)) * (NODE_SPACING / k)
+    return {node_id: (float(x), float(y)) for node_id, (x, y) in zip(node_ids, pos)}
@@ -0,0 +1,209 @@
+# http_cache.py
+
+import atexit
+import json
+import sqlite3
+import threading
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+from urllib.parse import urlencode, urlsplit
+import requests
+from requests.structures import CaseInsensitiveDict
+
+"""
+Shared HTTP response cache of the data pipeline (Fandom, Wikipedia and Wikidata stages).
+Every GET request of a stage goes through cached_get(), which stores the response in an SQLite database:
+    - data/http_cache.sqlite, one row per request (URL with sorted query parameters)
+    - a response younger than the TTL of its source (SOURCE_TTLS) is returned without a network call
+    - an older response is revalidated with If-None-Match / If-Modified-Since if the server sent an ETag or
+      Last-Modified header; a 304 answer renews the stored response (it still counts as a network request)
+    - only successful responses (status 200) are stored, errors are always fetched again
+At the end of a stage the number of hits, revalidations and misses per host is printed, so a re-run of an
+unchanged pipeline shows that (almost) no request went to the network.
+Set HTTP_CACHE_DISABLED = True (or pass use_cache=False) to bypass the cache.
+"""
+
+HTTP_CACHE_PATH = Path(__file__).resolve().parent.parent / "data" / "http_cache.sqlite"
+HTTP_CACHE_DISABLED = False
+DAY = 24 * 60 * 60
+
+# Time to live per host in seconds; wiki pages change rarely, Wikidata a bit more often
+SOURCE_TTLS = {
+    "jamesbond.fandom.com": 7 * DAY,
+    "en.wikipedia.org": 7 * DAY,
+    "query.wikidata.org": 30 * DAY,
+}
+DEFAULT_TTL = 1 * DAY
+
+
+def request_key(url, params=None):
+    """Cache key of a GET request: the URL with its query parameters in sorted order."""
+    if params:
+        url = f"{url}{'&' if '?' in url else '?'}{urlencode(sorted(params.items()))}"
+    return url
+
+
+def source_ttl(url):
+    return SOURCE_TTLS.get(urlsplit(url).hostname, DEFAULT_TTL)
+
+
+def cached_response(url, status_code, headers, content):
+    """requests.Response built from a stored row, so the stages can use .json(), .text and raise_for_status()."""
+    response = requests.Response()
+    response.url = url
+    response.status_code = status_code
+    response.headers = CaseInsensitiveDict(headers)
+    response._content = content
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    response.from_cache = True
+    return response
+
+
+# ---- SQLite response cache ----
+class HttpCache:
+    """
+    SQLite-backed response cache with per-source TTLs and conditional revalidation.
+        - stats[host]: Counter of 'hit', 'revalidated', 'miss' and 'error' for the report
+    One connection and the stats are shared by all threads of a process (guarded by a lock); several processes of
+    run_pipeline.py use the same database file in WAL mode.
+    """
+
+    def __init__(self, path=HTTP_CACHE_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                status INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                content BLOB NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                fetched_at REAL NOT NULL
+            )""")
+        self.connection.commit()
+        self.stats = defaultdict(Counter)
+
+    # ---- Rows ----
+    def lookup(self, key):
+        with self.lock:
+            return self.connection.execute(
+                "SELECT status, headers, content, etag, last_modified, fetched_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+    def store(self, key, response):
+        with self.lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, response.status_code, json.dumps(dict(response.headers)), response.content,
+                 response.headers.get("ETag"), response.headers.get("Last-Modified"), time.time()))
+            self.connection.commit()
+
+    def touch(self, key):
+        with self.lock:
+            self.connection.execute("UPDATE responses SET fetched_at = ? WHERE key = ?", (time.time(), key))
+            self.connection.commit()
+
+    def count(self, host, outcome):
+        """Count a request outcome; called from the worker threads of utils/http_fetcher.py, so under the lock."""
+        with self.lock:
+            self.stats[host][outcome] += 1
+
+    # ---- Requests ----
+    def get(self, url, params=None, headers=None, timeout=30, ttl=None, fetch=requests.get):
+        """
+        GET through the cache; the returned requests.Response has from_cache=True if no request reached the network
+        (a revalidated response has from_cache=False, so the callers keep their delay between requests).
+        fetch performs the network request (requests.get, or the rate-limited get of utils/http_fetcher.py).
+        """
+        key = request_key(url, params)
+        host = urlsplit(url).hostname
+        ttl = source_ttl(url) if ttl is None else ttl
+        row = self.lookup(key)
+
+        request_headers = dict(headers or {})
+        if row is not None:
+            status, stored_headers, content, etag, last_modified, fetched_at = row
+            if time.time() - fetched_at < ttl:
+                self.count(host, "hit")
+                return cached_response(key, status, json.loads(stored_headers), content)
+            if etag:
+                request_headers["If-None-Match"] = etag
+            if last_modified:
+                request_headers["If-Modified-Since"] = last_modified
+
+        try:
+            response = fetch(url, params=params, headers=request_headers, timeout=timeout)
+        except requests.RequestException:
+            self.count(host, "error")
+            raise
+
+        if response.status_code == 304 and row is not None:
+            self.touch(key)
+            self.count(host, "revalidated")
+            revalidated = cached_response(key, status, json.loads(stored_headers), content)
+            revalidated.from_cache = False
+            return revalidated
+
+        self.count(host, "miss" if response.ok else "error")
+        if response.status_code == 200:
+            self.store(key, response)
+        response.from_cache = False
+        return response
+
+    # ---- Report ----
+    def report(self, stats=None):
+        """One line per host: hits, revalidations, misses and errors of this process (or of the given stats)."""
+        if stats is None:
+            with self.lock:
+                stats = {host: Counter(counts) for host, counts in self.stats.items()}
+        lines = []
+        for host, counts in sorted(stats.items()):
+            total = sum(counts.values())
+            served = counts["hit"] + counts["revalidated"]
+            lines.append(f"{host}: {total} requests, {counts['hit']} hits, {counts['revalidated']} revalidated, "
+                         f"{counts['miss']} misses, {counts['error']} errors ({served / total:.0%} without download)")
+        return lines
+
+    def print_report(self):
+        """Print the report and reset the counters (the report is printed once per stage run)."""
+        with self.lock:
+            stats, self.stats = self.stats, defaultdict(Counter)
+        lines = self.report(stats)
+        if lines:
+            print(f"HTTP cache ({self.path.name}):")
+            for line in lines:
+                print(f"  {line}")
+
+
+# ---- Shared cache of the process ----
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_http_cache():
+    """The HttpCache of this process; its report is printed when the stage exits."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = HttpCache()
+            atexit.register(print_http_cache_report)
+        return _cache
+
+
+def print_http_cache_report():
+    if _cache is not None:
+        _cache.print_report()
+
+
+def cached_get(url, params=None, headers=None, timeout=30, ttl=None, use_cache=True, fetch=requests.get):
+    """Drop-in replacement for requests.get in the pipeline stages."""
+    if HTTP_CACHE_DISABLED or not use_cache:
+        response = fetch(url, params=params, headers=headers, timeout=timeout)
+        response.from_cache = False
+        return response
+    return get_http_cache().get(url, params=params, headers=headers, timeout=timeout, ttl=ttl, fetch=fetch)
@@ -0,0 +1,152 @@
+# http_fetcher.py
+
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+import requests
+from utils.http_cache import cached_get
+
+"""
+Concurrent, rate-limited fetching for the Fandom (and Wikipedia) stages of the data pipeline.
+The stages hand their per-item lookups to fetch_all(), which runs them in a thread pool and prints the progress;
+inside the lookups polite_get() replaces requests.get:
+    - responses come from the HTTP cache (utils/http_cache.py) when possible, only cache misses go to the network
+    - at most HOST_CONCURRENCY requests per host are in flight, with MIN_INTERVAL seconds between request starts
+    - every request has a timeout; connection errors, timeouts, 429 and 5xx answers are retried with
+      exponential backoff and jitter (Retry-After is respected)
+    - one requests.Session per thread, so connections to a host are reused
+The wall time of a stage is bounded by the concurrency limit of the host, not by the sum of all round trips.
+"""
+
+HOST_CONCURRENCY = {
+    "jamesbond.fandom.com": 4,
+    "en.wikipedia.org": 2,
+}
+DEFAULT_CONCURRENCY = 2
+MIN_INTERVAL = 0.05  # seconds between the starts of two requests to the same host
+MAX_WORKERS = 8
+REQUEST_TIMEOUT = 15
+RETRIES = 3
+BACKOFF_SECONDS = 1.0
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+HEADERS = {"User-Agent": "JamesBondKnowledgeGraph/1.0 (student project; data pipeline)"}
+
+
+# ---- Per-host limits ----
+class HostLimiter:
+    """Bounded concurrency and a minimum interval between request starts for one host."""
+
+    def __init__(self, concurrency, min_interval=MIN_INTERVAL):
+        self.slots = threading.BoundedSemaphore(concurrency)
+        self.min_interval = min_interval
+        self.lock = threading.Lock()
+        self.next_start = 0.0
+
+    def __enter__(self):
+        self.slots.acquire()
+        with self.lock:
+            now = time.monotonic()
+            start = max(now, self.next_start)
+            self.next_start = start + self.min_interval
+        time.sleep(start - now)
+        return self
+
+    def __exit__(self, *exc):
+        self.slots.release()
+
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+_local = threading.local()
+
+
+def host_limiter(url):
+    host = urlsplit(url).hostname
+    with _limiters_lock:
+        if host not in _limiters:
+            _limiters[host] = HostLimiter(HOST_CONCURRENCY.get(host, DEFAULT_CONCURRENCY))
+        return _limiters[host]
+
+
+def thread_session():
+    if not hasattr(_local, "session"):
+        _local.session = requests.Session()
+        _local.session.headers.update(HEADERS)
+    return _local.session
+
+
+def retry_after_seconds(value):
+    """Seconds of a Retry-After header, given as delay ('120') or HTTP date; None if missing or invalid."""
+    value = (value or "").strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if retry_at.tzinfo is None:  # '-0000' dates are UTC
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def retry_delay(attempt, response=None):
+    """Exponential backoff with full jitter, or the Retry-After of the server if it is longer."""
+    delay = BACKOFF_SECONDS * 2 ** attempt * random.uniform(0.5, 1.5)
+    retry_after = retry_after_seconds(response.headers.get("Retry-After")) if response is not None else None
+    return max(delay, retry_after) if retry_after is not None else delay
+
+
+# ---- Requests ----
+def network_get(url, params=None, headers=None, timeout=REQUEST_TIMEOUT):
+    """GET with the limits of the host, a timeout and retries; used for cache misses."""
+    limiter = host_limiter(url)
+    for attempt in range(RETRIES + 1):
+        response = None
+        try:
+            with limiter:
+                response = thread_session().get(url, params=params, headers=headers, timeout=timeout)
+        except (requests.ConnectionError, requests.Timeout):
+            if attempt == RETRIES:
+                raise
+        else:
+            if response.status_code not in RETRY_STATUS or attempt == RETRIES:
+                return response
+        time.sleep(retry_delay(attempt, response))
+
+
+def polite_get(url, params=None, headers=None, timeout=REQUEST_TIMEOUT):
+    """Drop-in replacement for requests.get in the Fandom stages: cached, rate-limited and retried."""
+    return cached_get(url, params=params, headers=headers, timeout=timeout, fetch=network_get)
+
+
+# ---- Thread pool ----
+def fetch_all(func, items, describe=str, max_workers=MAX_WORKERS):
+    """
+    func(item) for all items in a thread pool; returns the results in the order of items.
+    Prints one progress line per finished item; an exception of func is raised after the other items finished.
+    """
+    items = list(items)
+    results = [None] * len(items)
+    errors = []
+    start = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(func, item): i for i, item in enumerate(items)}
+        for done, future in enumerate(as_completed(futures), start=1):
+            i = futures[future]
+            try:
+                results[i] = future.result()
+            except Exception as e:
+                errors.append(e)
+                print(f"[{done}/{len(items)}] {describe(items[i])}: {e}")
+                continue
+            print(f"[{done}/{len(items)}] {describe(items[i])} ({time.perf_counter() - start:.1f}s)")
+
+    if errors:
+        raise errors[0]
+    return results
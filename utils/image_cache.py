@@ -0,0 +1,193 @@
+# image_cache.py
+
+import base64
+import hashlib
+import io
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import urlsplit
+import requests
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional, without it the original URLs are shown
+    Image = None
+
+"""
+Local image proxy for the gallery and movie pages.
+Each remote image (Fandom originals from piprop=original, poster URLs) is downloaded once, resized to the width
+the UI shows, re-encoded as WebP and stored in a content-addressed disk cache:
+    - data/image_cache/blobs/<sha1 of the encoded bytes>.webp   (identical thumbnails are stored once)
+    - data/image_cache/index/<sha1 of url and width>            (points to the blob)
+The pages pass the local blob path to st.image, so Streamlit serves the small file itself instead of every
+browser fetching the full-resolution original. If a download fails or Pillow is not installed, the original
+URL is returned and the page behaves as before.
+local_image() never downloads on the script thread: on a cache miss it returns the original URL and queues the
+download in a small background pool, so the next rerun shows the thumbnail. An unreachable host is skipped for
+a backoff time that doubles with each consecutive failure, and retried afterwards.
+benchmarks/benchmark_image_cache.py measures the saving against a local file server standing in for Fandom.
+"""
+
+IMAGE_CACHE_DIR = Path("data/image_cache")
+CARD_WIDTH = 300  # image column of the cards (st.columns([1, 3]))
+THUMBNAIL_WIDTH = 120  # ImageColumn of st.dataframe, images of the character details table
+WEBP_QUALITY = 80
+REQUEST_TIMEOUT = 15
+HOST_BACKOFF = 60  # seconds an unreachable host is skipped after its first failure, doubled per further failure
+MAX_HOST_BACKOFF = 15 * 60
+DOWNLOAD_WORKERS = 2  # background downloads of local_image() cache misses
+
+HEADERS = {"User-Agent": "JamesBondKnowledgeApp/1.0 (student project)"}
+
+# URLs that failed in this process (not retried until restart) and unreachable hosts {host: (failures, retry_at)}
+failed_urls = set()
+host_failures = {}
+host_lock = threading.Lock()
+
+download_pool = ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS, thread_name_prefix="image-cache")
+pending_downloads = set()
+pending_lock = threading.Lock()
+
+
+# ---- Cache paths ----
+def index_path(url, width, cache_dir=IMAGE_CACHE_DIR):
+    key = hashlib.sha1(f"{url}|{width}".encode("utf-8")).hexdigest()
+    return Path(cache_dir) / "index" / key
+
+
+def blob_path(digest, cache_dir=IMAGE_CACHE_DIR):
+    return Path(cache_dir) / "blobs" / f"{digest}.webp"
+
+
+def atomic_write(path, data):
+    """Write via a temporary file, so parallel warm-up threads never see half-written files."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+# ---- Resize and re-encode ----
+def resize_image(data, width):
+    """Return the image bytes scaled down to width (aspect ratio kept, never enlarged) as WebP."""
+    with Image.open(io.BytesIO(data)) as img:
+        img = img.convert("RGBA" if "A" in img.getbands() or img.mode == "P" else "RGB")
+        if img.width > width:
+            img = img.resize((width, max(1, round(img.height * width / img.width))), Image.LANCZOS)
+        out = io.BytesIO()
+        img.save(out, format="WEBP", quality=WEBP_QUALITY, method=4)
+        return out.getvalue()
+
+
+# ---- Unreachable hosts ----
+def host_available(host):
+    with host_lock:
+        failures = host_failures.get(host)
+    return failures is None or time.monotonic() >= failures[1]
+
+
+def host_failed(host):
+    """Skip the host for HOST_BACKOFF seconds, doubled with each consecutive failure (up to MAX_HOST_BACKOFF)."""
+    with host_lock:
+        count = host_failures.get(host, (0, 0.0))[0] + 1
+        backoff = min(HOST_BACKOFF * 2 ** (count - 1), MAX_HOST_BACKOFF)
+        host_failures[host] = (count, time.monotonic() + backoff)
+    return backoff
+
+
+def host_succeeded(host):
+    with host_lock:
+        host_failures.pop(host, None)
+
+
+# ---- Fetch once, serve locally ----
+def cached_thumbnail(url, width=CARD_WIDTH, cache_dir=IMAGE_CACHE_DIR):
+    """Path of the cached thumbnail of url, or None if it has not been downloaded yet (never downloads)."""
+    if Image is None or not isinstance(url, str) or not url.strip():
+        return None
+    index_file = index_path(url, width, cache_dir)
+    if index_file.exists():
+        path = blob_path(index_file.read_text().strip(), cache_dir)
+        if path.exists():
+            return path
+    return None
+
+
+def cached_image_path(url, width=CARD_WIDTH, cache_dir=IMAGE_CACHE_DIR, session=None):
+    """
+    Return the path of the cached thumbnail of url, downloading and resizing it on the first call.
+    Returns None if the image cannot be fetched or decoded (or Pillow is missing).
+    """
+    path = cached_thumbnail(url, width, cache_dir)
+    if path is not None or Image is None or not isinstance(url, str) or not url.strip():
+        return path
+
+    host = urlsplit(url).netloc
+    if url in failed_urls or not host_available(host):
+        return None
+    try:
+        response = (session or requests).get(url, headers=HEADERS, timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+        data = resize_image(response.content, width)
+    except (requests.ConnectionError, requests.Timeout) as e:
+        # Host unreachable (e.g. offline): fall back to the original URLs for its images until the backoff ends
+        backoff = host_failed(host)
+        print(f"Image cache: {host} not reachable, using original URLs for {backoff}s: {e}")
+        return None
+    except Exception as e:
+        print(f"Image cache: could not fetch {url}: {e}")
+        failed_urls.add(url)
+        return None
+    host_succeeded(host)
+
+    digest = hashlib.sha1(data).hexdigest()
+    path = blob_path(digest, cache_dir)
+    if not path.exists():
+        atomic_write(path, data)
+    atomic_write(index_file, digest.encode("ascii"))
+    return path
+
+
+def download_in_background(url, width=CARD_WIDTH):
+    """Queue cached_image_path(url, width) in the download pool (once per url and width at a time)."""
+    if Image is None or not isinstance(url, str) or not url.strip():
+        return
+    job = (url, width)
+    with pending_lock:
+        if job in pending_downloads:
+            return
+        pending_downloads.add(job)
+
+    def download():
+        try:
+            cached_image_path(url, width)
+        finally:
+            with pending_lock:
+                pending_downloads.discard(job)
+
+    download_pool.submit(download)
+
+
+def local_image(url, width=CARD_WIDTH):
+    """Source for st.image: the local thumbnail if cached, otherwise the original URL (thumbnail downloaded in the background)."""
+    path = cached_thumbnail(url, width)
+    if path is None:
+        download_in_background(url, width)
+        return url
+    return str(path)
+
+
+def image_data_uri(url, width=THUMBNAIL_WIDTH, wait=True):
+    """
+    Source for st.column_config.ImageColumn (which needs a URL): the thumbnail as data URI, or the original URL.
+    With wait=False a missing thumbnail is downloaded in the background instead of on the calling thread.
+    """
+    path = cached_image_path(url, width) if wait else cached_thumbnail(url, width)
+    if path is None:
+        if not wait:
+            download_in_background(url, width)
+        return url
+    return "data:image/webp;base64," + base64.b64encode(path.read_bytes()).decode("ascii")
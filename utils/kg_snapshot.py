@@ -0,0 +1,116 @@
+# kg_snapshot.py
+
+import numpy as np
+from rdflib import Graph, URIRef, Literal, BNode
+
+"""
+Helper functions to store the knowledge graph as a dictionary-encoded binary snapshot.
+The snapshot is written by data_pipeline/q_merge_json_to_knowledge_graph.py next to the TTL file and consists of
+    - a term table: every distinct URI, literal and blank node once (kind, UTF-8 text, datatype, language)
+    - an integer triple array of shape (n, 3) with indexes into the term table.
+Loading the snapshot only decodes the term table and rebuilds the graph, so the Turtle parser is skipped.
+"""
+
+KIND_URI = 0
+KIND_LITERAL = 1
+KIND_BNODE = 2
+
+
+# ---- Encode a graph into a term table and integer triples ----
+def encode_graph(g):
+    term_ids = {}
+    kinds, texts, datatypes, langs = [], [], [], []
+    lang_ids = {}
+
+    def term_id(term):
+        if term in term_ids:
+            return term_ids[term]
+        datatype = -1
+        lang = -1
+        if isinstance(term, Literal):
+            kind = KIND_LITERAL
+            if term.datatype is not None:
+                datatype = term_id(term.datatype)
+            if term.language:
+                lang = lang_ids.setdefault(term.language, len(lang_ids))
+        elif isinstance(term, BNode):
+            kind = KIND_BNODE
+        else:
+            kind = KIND_URI
+        idx = len(kinds)
+        term_ids[term] = idx
+        kinds.append(kind)
+        texts.append(str(term).encode("utf-8"))
+        datatypes.append(datatype)
+        langs.append(lang)
+        return idx
+
+    triples = np.array(
+        [(term_id(s), term_id(p), term_id(o)) for s, p, o in g],
+        dtype=np.int32,
+    ).reshape(-1, 3)
+
+    offsets = np.zeros(len(texts) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(t) for t in texts])
+
+    return {
+        "kinds": np.array(kinds, dtype=np.uint8),
+        "text": np.frombuffer(b"".join(texts), dtype=np.uint8),
+        "offsets": offsets,
+        "datatypes": np.array(datatypes, dtype=np.int32),
+        "langs": np.array(langs, dtype=np.int32),
+        "lang_table": np.frombuffer("\n".join(lang_ids).encode("utf-8"), dtype=np.uint8),
+        "triples": triples,
+    }
+
+
+# ---- Write snapshot ----
+def save_kg_snapshot(g, output_file):
+    """Serialize the graph as uncompressed .npz (no pickled objects)."""
+    with open(output_file, "wb") as f:
+        np.savez(f, **encode_graph(g))
+
+
+# ---- Read snapshot ----
+def load_kg_snapshot(input_file):
+    """
+    Return (terms, triples): a list of rdflib terms and the (n, 3) int32 triple array indexing into it.
+    """
+    with np.load(input_file, allow_pickle=False) as data:
+        kinds = data["kinds"]
+        text = data["text"].tobytes()
+        offsets = data["offsets"]
+        datatypes = data["datatypes"]
+        langs = data["langs"]
+        lang_table = data["lang_table"].tobytes().decode("utf-8").split("\n")
+        triples = data["triples"]
+
+    terms = [None] * len(kinds)
+
+    def decode(idx):
+        if terms[idx] is not None:
+            return terms[idx]
+        value = text[offsets[idx]:offsets[idx + 1]].decode("utf-8")
+        kind = kinds[idx]
+        if kind == KIND_LITERAL:
+            datatype = decode(datatypes[idx]) if datatypes[idx] >= 0 else None
+            lang = lang_table[langs[idx]] if langs[idx] >= 0 else None
+            term = Literal(value, lang=lang, datatype=datatype)
+        elif kind == KIND_BNODE:
+            term = BNode(value)
+        else:
+            term = URIRef(value)
+        terms[idx] = term
+        return term
+
+    for idx in range(len(kinds)):
+        decode(idx)
+
+    return terms, triples
+
+
+# ---- Rebuild an rdflib graph from a snapshot ----
+def snapshot_to_graph(terms, triples):
+    g = Graph()
+    g.addN((terms[s], terms[p], terms[o], g) for s, p, o in triples.tolist())
+    return g
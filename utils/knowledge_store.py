@@ -0,0 +1,127 @@
+# knowledge_store.py
+
+import streamlit as st
+from utils.data_loader import (load_data, load_german_titles, load_poster_urls, load_song_data,
+                               load_character_actor_data, load_vehicle_data, load_bond_girls_data,
+                               load_villains_data, load_geo_locations, prepare_german_titles,
+                               prepare_poster_urls)
+from utils.snapshots import read_dataset
+
+"""
+In-process knowledge store shared by all pages.
+The datasets are loaded once (through the cached loaders of utils/data_loader.py) and joined once against a
+movie dimension, one row per movie with year, German title, poster and theme song. The entity tables
+(characters, vehicles, bond girls, villains, locations) carry the year and German title of their movie, so the
+pages select from them instead of merging against load_data() and load_german_titles() on every call.
+Dictionary indexes map movies, actors, characters, vehicles and locations to the row positions of the entity
+tables.
+"""
+
+ENTITY_TABLES = ["characters", "vehicles", "bond_girls", "villains", "locations"]
+
+# Column with the actor / actress of each entity table (the movie dimension has the Bond actor)
+ACTOR_COLUMNS = {"movies": "Bond", "characters": "actor", "bond_girls": "actress", "villains": "Portrayed by"}
+
+
+# ---- Movie dimension ----
+def build_movie_dimension(df_movies, df_german_titles, df_posters, df_songs):
+    """One row per movie (index: English title) with the movie data, German title, poster URL and theme song."""
+    movies = df_movies[['Year', 'Movie', 'Bond', 'Director', 'Producer', 'Avg_User_IMDB', 'Avg_User_Rtn_Tom']].copy()
+    movies['Movie'] = movies['Movie'].astype(str)
+    movies = movies.set_index('Movie', drop=False)
+
+    titles = df_german_titles.assign(Movie=df_german_titles['Movie'].astype(str)).set_index('Movie')
+    posters = df_posters.assign(title=df_posters['title'].astype(str).str.replace(' (film)', '', regex=False))
+    posters = posters.set_index('title')
+    songs = df_songs.assign(movie=df_songs['movie'].astype(str)).set_index('movie')
+
+    movies['Movie_de'] = movies.index.map(titles['Movie_de'])
+    movies['poster_url'] = movies.index.map(posters['poster_url'])
+    for col in ['song', 'performer', 'composer', 'youtube_link']:
+        movies[col] = movies.index.map(songs[col])
+    movies['Theme Song'] = movies['song'] + " by " + movies['performer']
+    return movies
+
+
+# ---- Knowledge store ----
+class KnowledgeStore:
+    """
+    Pre-joined tables and indexes of the app.
+        - movies: movie dimension (see build_movie_dimension), indexed by English title
+        - characters, vehicles, bond_girls, villains, locations: entity tables with 'movie', 'Year' and 'Movie_de'
+        - by_movie[title][table], by_actor[name][table]: row positions of the entity tables (and of movies)
+        - by_character, by_vehicle, by_location: name -> row positions in characters / vehicles / locations
+    """
+
+    def __init__(self, movies, characters, vehicles, bond_girls, villains, locations):
+        self.movies = movies
+
+        # Entity tables: year and German title looked up in the movie dimension (same row order as a left merge)
+        self.characters = self.with_movie_columns(characters)
+        self.characters = self.characters.sort_values(by=['Year', 'movie'])
+        self.characters['movie_year'] = self.characters['Year'].astype(str) + " - " + self.characters['movie'].astype(str)
+        self.vehicles = self.with_movie_columns(vehicles)
+        self.bond_girls = self.with_movie_columns(bond_girls)
+        self.villains = self.with_movie_columns(villains.rename(columns={'Film': 'movie'}))
+        self.locations = self.with_movie_columns(locations)
+
+        self.by_movie = {}
+        for table in ENTITY_TABLES:
+            for title, positions in self.positions(table, 'movie').items():
+                self.by_movie.setdefault(title, {})[table] = positions
+        self.by_actor = {}
+        for table, col in ACTOR_COLUMNS.items():
+            for name, positions in self.positions(table, col).items():
+                self.by_actor.setdefault(name, {})[table] = positions
+        self.by_character = self.positions('characters', 'character')
+        self.by_vehicle = self.positions('vehicles', 'vehicle')
+        self.by_location = self.positions('locations', 'name')
+
+    def with_movie_columns(self, df, columns=('Year', 'Movie_de')):
+        df = df.copy()
+        titles = df['movie'].astype(object)
+        for col in columns:
+            df[col] = titles.map(self.movies[col])
+        return df
+
+    def positions(self, table, col):
+        """Dict value of col -> row positions in the table (empty values are skipped)."""
+        df = getattr(self, table)
+        keys = df[col].astype(object)
+        return {key: rows for key, rows in keys.groupby(keys).indices.items() if isinstance(key, str) and key}
+
+    # ---- Queries ----
+    def movie(self, title):
+        """Row of the movie dimension as dict, or None for an unknown title."""
+        if title not in self.movies.index:
+            return None
+        return self.movies.loc[title].to_dict()
+
+    def rows(self, table, positions):
+        return getattr(self, table).iloc[positions]
+
+    def for_movie(self, title, table):
+        """Rows of an entity table that belong to the movie."""
+        return self.rows(table, self.by_movie.get(title, {}).get(table, []))
+
+    def for_actor(self, name, table):
+        """Rows of a table (entity table or 'movies') in which the actor appears."""
+        return self.rows(table, self.by_actor.get(name, {}).get(table, []))
+
+
+def read_knowledge_store(base_dir=None):
+    """Build the store directly from the datasets (without the Streamlit caches), e.g. in the data pipeline."""
+    movies = build_movie_dimension(read_dataset('movies', base_dir),
+                                   prepare_german_titles(read_dataset('german_titles', base_dir)),
+                                   prepare_poster_urls(read_dataset('posters', base_dir)),
+                                   read_dataset('songs', base_dir))
+    return KnowledgeStore(movies, *(read_dataset(name, base_dir) for name in
+                                    ['characters', 'vehicles', 'bond_girls', 'villains', 'geo_locations']))
+
+
+@st.cache_resource
+def get_knowledge_store():
+    """Knowledge store of the process, built once from the cached datasets."""
+    movies = build_movie_dimension(load_data(), load_german_titles(), load_poster_urls(), load_song_data())
+    return KnowledgeStore(movies, load_character_actor_data(), load_vehicle_data(), load_bond_girls_data(),
+                          load_villains_data(), load_geo_locations())
@@ -0,0 +1,128 @@
+# location_index.py
+
+from functools import lru_cache
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+"""
+Spatial index for the Film Locations map.
+The geocoded locations are bucketed once into grid cells at several zoom levels (cell size halves per level,
+as map tiles do). The map page shows the cells of the chosen level as clusters with the number of locations and
+the films they belong to, and switches to the individual places at the finest level. Aggregating a level is
+a np.bincount over precomputed cell codes, so the cost per rerun grows with the number of cells, not with the
+number of raw locations.
+"""
+
+# Zoom levels of the map (label -> level z, cell size 360 / 2**z degrees); PLACES shows the individual places
+ZOOM_LEVELS = {"World": 3, "Region": 5, "Country": 7, "City": 10}
+PLACES = "Places"
+METERS_PER_DEGREE = 111_320
+NAMES_PER_CLUSTER = 3  # place names listed per cluster
+VIEW_CACHE_SIZE = 64  # cached (zoom level, movie, location) combinations per index
+COORDINATE_DECIMALS = 5  # shown coordinates (~1 m), hides float32 artifacts such as 51.41461563110352
+
+
+def cell_degrees(level):
+    return 360.0 / 2 ** level
+
+
+def join_unique(values):
+    return ", ".join(dict.fromkeys(values))
+
+
+# ---- Location index ----
+class LocationIndex:
+    """
+    Precomputed lookups over the geocoded locations (one row per location and movie).
+        - locations: the rows of the locations view (utils/page_views.py) with float64 coordinates
+        - movie_options / name_options: options of the two filters of the map page
+        - cells[label]: grid cell code of every row at that zoom level
+        - place_codes: one code per distinct place (name, lat, lon), so a place used in several films is one point
+        - view: memoized per instance (thread-safe LRU cache of VIEW_CACHE_SIZE entries, as in utils/rdf_views.py)
+    """
+
+    def __init__(self, df):
+        locations = df[['name', 'movie', 'Movie_de', 'lat', 'lon', 'movie_combined']].astype({'lat': 'float64', 'lon': 'float64'})
+        self.locations = locations.reset_index(drop=True)
+        self.movie_options = self.locations['movie_combined'].unique()
+        self.name_options = self.locations['name'].unique()
+
+        lat = self.locations['lat'].to_numpy()
+        lon = self.locations['lon'].to_numpy()
+        self.cells = {}
+        for label, level in ZOOM_LEVELS.items():
+            size = cell_degrees(level)
+            columns = int(np.ceil(360.0 / size))
+            row = np.floor((lat + 90.0) / size).astype(np.int64)
+            column = np.floor((lon + 180.0) / size).astype(np.int64) % columns
+            self.cells[label] = row * columns + column
+        self.place_codes = self.locations.groupby(['name', 'lat', 'lon'], sort=False).ngroup().to_numpy()
+        self.view = lru_cache(maxsize=VIEW_CACHE_SIZE)(self.compute_view)
+
+    def mask(self, movie=None, name=None):
+        """Boolean row mask for the filters of the page (None = no filter)."""
+        mask = np.ones(len(self.locations), dtype=bool)
+        if movie:
+            mask &= (self.locations['movie_combined'] == movie).to_numpy()
+        if name:
+            mask &= (self.locations['name'] == name).to_numpy()
+        return mask
+
+    def clusters(self, label, mask):
+        """
+        One row per grid cell of the zoom level that contains rows of mask: centroid (lat, lon), number of
+        distinct places, films, the first place names and a marker radius in meters (column 'size' for st.map).
+        """
+        rows = np.flatnonzero(mask)
+        if len(rows) == 0:
+            return pd.DataFrame(columns=['lat', 'lon', 'places', 'films', 'names', 'size'])
+
+        cell_codes, cells = pd.factorize(self.cells[label][rows], sort=True)
+
+        # Each place counts once per cell, even if it was used in several films
+        _, first = np.unique(self.place_codes[rows], return_index=True)
+        place_rows, place_cells = rows[first], cell_codes[first]
+        places = np.bincount(place_cells, minlength=len(cells))
+        lat = np.bincount(place_cells, weights=self.locations['lat'].to_numpy()[place_rows]) / places
+        lon = np.bincount(place_cells, weights=self.locations['lon'].to_numpy()[place_rows]) / places
+
+        films = self.locations['movie'].iloc[rows].groupby(cell_codes).agg(join_unique)
+        names = self.locations['name'].iloc[place_rows].groupby(place_cells).agg(
+            lambda values: join_unique(values.iloc[:NAMES_PER_CLUSTER]) + (", ..." if len(values) > NAMES_PER_CLUSTER else ""))
+
+        radius = cell_degrees(ZOOM_LEVELS[label]) * METERS_PER_DEGREE
+        return pd.DataFrame({
+            'lat': lat.round(COORDINATE_DECIMALS),
+            'lon': lon.round(COORDINATE_DECIMALS),
+            'places': places,
+            'films': films.to_numpy(),
+            'names': names.to_numpy(),
+            'size': radius * (0.05 + 0.2 * np.sqrt(places / places.max())),
+        })
+
+    def places(self, mask):
+        """The individual places of the rows in mask, one row per place with all its films."""
+        rows = np.flatnonzero(mask)
+        _, first, counts = np.unique(self.place_codes[rows], return_index=True, return_counts=True)
+        places = self.locations.iloc[rows[first]][['name', 'lat', 'lon', 'movie_combined']].reset_index(drop=True)
+        places = places.rename(columns={'movie_combined': 'films'})
+
+        # Only the places used in several films need their film labels joined
+        shared = counts > 1
+        if shared.any():
+            shared_rows = rows[np.isin(self.place_codes[rows], self.place_codes[rows[first[shared]]])]
+            films = self.locations['movie_combined'].iloc[shared_rows].groupby(self.place_codes[shared_rows]).agg(join_unique)
+            places.loc[shared, 'films'] = films.reindex(self.place_codes[rows[first[shared]]]).to_numpy()
+        return places.round({'lat': COORDINATE_DECIMALS, 'lon': COORDINATE_DECIMALS})
+
+    def compute_view(self, label, movie=None, name=None):
+        """Clusters of the zoom level (or the places for PLACES) for the filters of the page (use view())."""
+        mask = self.mask(movie, name)
+        return self.places(mask) if label == PLACES else self.clusters(label, mask)
+
+
+@st.cache_resource
+def build_location_index(df):
+    """Shared spatial index for the locations view (see utils/page_views.py)."""
+    return LocationIndex(df)
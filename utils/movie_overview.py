@@ -1,96 +1,48 @@
 # movie_overview.py
 
-import pandas as pd
 import streamlit as st
+from utils.card_grid import display_card_grid
+from utils.image_cache import image_data_uri
+from utils.page_views import load_page_view
 
 """
 The below functions are displayed in the movie page.
 """
 
 # ---- Get an overview of the James Bond Movies ----
-@st.cache_data
-def get_movie_overview(df, df_posters, df_german_titles, df_songs):
-    overview = df[['Year', 'Movie', 'Bond', 'Director', 'Producer', 'Avg_User_IMDB', 'Avg_User_Rtn_Tom']].copy()
-    df_posters = df_posters.copy()
-    df_posters['title'] = df_posters['title'].str.replace(' (film)', '', regex=False)
+def get_movie_overview():
+    """Movie table of the page (materialized view, see utils/page_views.py)."""
+    return load_page_view("movie_overview")
 
-    # Merge German titles based on the English movie title
-    overview = overview.merge(
-        df_german_titles[['Movie', 'Movie_de']],
-        on='Movie',
-        how='left'
-    )
 
-    # Merge poster URLs based on movie title
-    overview = overview.merge(
-        df_posters[['title', 'poster_url']], 
-        left_on='Movie', 
-        right_on='title', 
-        how='left'
+# ---- Display Movie Overview as Cards (medium-sized, paginated) ----
+def movie_card_details(row):
+    st.subheader(f"{row['Movie']} ({row['Year']})")
+    st.markdown(
+        f"<span style='font-size:18px; font-weight:bold;'>{row['Movie_de']}</span>",
+        unsafe_allow_html=True
     )
-
-    # Merge theme song data based on movie title
-    overview = overview.merge(
-        df_songs[['movie', 'song', 'performer', 'composer', 'youtube_link']],
-        left_on='Movie',
-        right_on='movie',
-        how='left'
+    st.write(f"**Bond:** {row['Bond']}")
+    st.write(f"**Director:** {row['Director']}")
+    st.write(f"**Producer:** {row['Producer']}")
+    st.write(f"**IMDB:** {row['Avg_User_IMDB']:.1f} ⭐ | **RT:** {row['Avg_User_Rtn_Tom']:.1f} 🍅")
+    st.write(f"**Theme Song:** {row['Theme Song']}")
+    st.link_button(
+        "Watch Opening Sequence",
+        row['Opening Sequence'],
+        icon="▶️"
     )
 
-    # Drop the duplicate title column
-    overview = overview.drop(columns=['title'])
-
-    # Add combined song and performer column
-    overview['Theme Song'] = overview['song'] + " by " + overview['performer']
-
-    # Reorder columns to have poster_url first, then sort by Year and rename Poster column
-    cols = ['poster_url', 'Year', 'Movie', 'Movie_de', 'Bond', 'Director', 'Producer', 'Avg_User_IMDB', 'Avg_User_Rtn_Tom', 'Theme Song', 'youtube_link']
-    overview = overview[cols].sort_values(by='Year').reset_index(drop=True)
-    overview = overview.rename(columns={'poster_url': 'Poster'})
-    overview = overview.rename(columns={'youtube_link': 'Opening Sequence'})
 
-    return overview
-
-
-# ---- Display Movie Overview as Cards (medium-sized) ----
-@st.cache_data
 def display_movie_overview_large(overview_df):
-    for idx, row in overview_df.iterrows():
-        col1, col2 = st.columns([1, 3])
-        
-        with col1:
-            if pd.notna(row['Poster']) and row['Poster'] and str(row['Poster']).strip():
-                try:
-                    st.image(row['Poster'],
-                             width='content')
-                except Exception as e:
-                    st.error(f"Error loading image: {e}")
-                    st.write("No poster")
-            else:
-                st.write("No poster")
-        
-        with col2:
-            st.subheader(f"{row['Movie']} ({row['Year']})")
-            st.markdown(
-                f"<span style='font-size:18px; font-weight:bold;'>{row['Movie_de']}</span>",
-                unsafe_allow_html=True
-            )
-            st.write(f"**Bond:** {row['Bond']}")
-            st.write(f"**Director:** {row['Director']}")
-            st.write(f"**Producer:** {row['Producer']}")
-            st.write(f"**IMDB:** {row['Avg_User_IMDB']:.1f} ⭐ | **RT:** {row['Avg_User_Rtn_Tom']:.1f} 🍅")
-            st.write(f"**Theme Song:** {row['Theme Song']}")
-            st.link_button(
-                "Watch Opening Sequence",
-                row['Opening Sequence'],
-                icon="▶️"
-            )
-        st.divider()
+    display_card_grid(overview_df, 'Poster', movie_card_details, key="movies_page", missing_text="No poster")
 
 
 # ---- Display DataFrame with image thumbnails ----
-@st.cache_data
 def display_movie_overview_thumbnails(overview_df):
+    # Small local thumbnails as data URIs instead of the full-size posters; posters not cached yet are shown by
+    # their original URL and downloaded in the background (not cached here, so the next rerun picks them up)
+    overview_df = overview_df.assign(Poster=overview_df["Poster"].map(lambda url: image_data_uri(url, wait=False)))
     st.dataframe(
         overview_df[["Poster", "Year", "Movie_de", "Theme Song", "Avg_User_IMDB", "Avg_User_Rtn_Tom","Opening Sequence"]],
         column_config={
@@ -1,16 +1,26 @@
 # page_config.py
-from pages.intro_page import show_intro_page
-from pages.movie_page import show_movie_page
-from pages.rdf_page import show_rdf_page
-from pages.characters_page import show_characters_page
-from pages.image_gallery_page import show_image_gallery_page
-from pages.map_page import show_map_page
+import importlib
+
+"""
+Page registry of the app. The page modules (and with them plotly, rdflib, streamlit_agraph, ...) are imported
+on first navigation to a page, not at app start; Python's module cache makes every later call cheap.
+Import cost can be compared with benchmarks/import_time_report.py.
+"""
+
+# ---- Import a page module on first call ----
+def lazy_page(module_name, function_name):
+    def show_page():
+        module = importlib.import_module(module_name)
+        return getattr(module, function_name)()
+    show_page.__name__ = function_name
+    return show_page
+
 
 PAGE_CONFIG = {
-    ":arrow_forward: Introduction": show_intro_page,
-    ":clapper: Movie Collection": show_movie_page,
-    ":link: RDF-Graph": show_rdf_page,
-    ":busts_in_silhouette: Recurring Characters": show_characters_page,
-    ":camera: Image Collection": show_image_gallery_page,
-    ":earth_africa: Film Locations": show_map_page
-}
\ No newline at end of file
+    ":arrow_forward: Introduction": lazy_page("pages.intro_page", "show_intro_page"),
+    ":clapper: Movie Collection": lazy_page("pages.movie_page", "show_movie_page"),
+    ":link: RDF-Graph": lazy_page("pages.rdf_page", "show_rdf_page"),
+    ":busts_in_silhouette: Recurring Characters": lazy_page("pages.characters_page", "show_characters_page"),
+    ":camera: Image Collection": lazy_page("pages.image_gallery_page", "show_image_gallery_page"),
+    ":earth_africa: Film Locations": lazy_page("pages.map_page", "show_map_page")
+}
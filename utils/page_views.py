@@ -0,0 +1,130 @@
+# page_views.py
+
+import hashlib
+from pathlib import Path
+import streamlit as st
+from utils.knowledge_store import get_knowledge_store
+from utils.snapshots import DATASETS, source_hash, table_to_pandas, feather, pa
+
+"""
+Materialized views of the app pages.
+Each view is the table a page renders, in exactly that shape (columns, order, combined filter labels). The views
+are written as Arrow files by data_pipeline/t_build_page_views.py, so the pages just load and display them.
+Each file stores a hash over the CSV sources of all datasets; if a view file is missing, outdated or pyarrow is
+not installed, the view is computed from the knowledge store (utils/knowledge_store.py) instead.
+"""
+
+VIEW_DIR = Path("data/views")
+
+
+def movie_label(df, movie_col, title_de_col):
+    """'Movie (German title)' label of the movie filters."""
+    return df[movie_col].astype(str) + ' (' + df[title_de_col].fillna('') + ')'
+
+
+# ---- Views, one per page table ----
+def movie_overview_view(store):
+    overview = store.movies
+
+    # Reorder columns to have poster_url first, then sort by Year and rename Poster column
+    cols = ['poster_url', 'Year', 'Movie', 'Movie_de', 'Bond', 'Director', 'Producer', 'Avg_User_IMDB', 'Avg_User_Rtn_Tom', 'Theme Song', 'youtube_link']
+    overview = overview[cols].sort_values(by='Year').reset_index(drop=True)
+    overview = overview.rename(columns={'poster_url': 'Poster', 'youtube_link': 'Opening Sequence'})
+
+    # Movie + Movie_de for the search of the movie page
+    overview['Movie_Combined'] = overview['Movie'].astype(str) + " - " + overview['Movie_de']
+    return overview
+
+
+def vehicles_view(store):
+    vehicles = store.vehicles[['image_url', 'vehicle', 'movie', 'sequence', 'Movie_de']]
+    vehicles = vehicles.rename(columns={'Movie_de': 'title_de'})
+    vehicles['movie_combined'] = movie_label(vehicles, 'movie', 'title_de')
+    return vehicles.reset_index(drop=True)
+
+
+def bond_girls_view(store):
+    bond_girls = store.bond_girls[['image_url', 'bond_girl', 'actress', 'movie', 'Year', 'Movie_de']]
+    bond_girls = bond_girls.rename(columns={'Movie_de': 'title_de'}).sort_values(by='Year')
+    bond_girls['movie_combined'] = movie_label(bond_girls, 'movie', 'title_de')
+    return bond_girls.reset_index(drop=True)
+
+
+def villains_view(store):
+    villains = store.villains[['movie', 'Villain', 'Portrayed by', 'Objective', 'Outcome', 'Status', 'image_url', 'Movie_de']]
+    villains = villains.rename(columns={'Movie_de': 'title_de'})
+    villains['movie_combined'] = movie_label(villains, 'movie', 'title_de')
+    return villains.reset_index(drop=True)
+
+
+def characters_view(store):
+    return store.characters.reset_index(drop=True)
+
+
+def locations_view(store):
+    locations = store.locations[['name', 'movie', 'Movie_de', 'lat', 'lon']].copy()
+    locations['movie_combined'] = movie_label(locations, 'movie', 'Movie_de')
+    return locations.reset_index(drop=True)
+
+
+PAGE_VIEWS = {
+    "movie_overview": movie_overview_view,
+    "vehicles": vehicles_view,
+    "bond_girls": bond_girls_view,
+    "villains": villains_view,
+    "characters": characters_view,
+    "locations": locations_view,
+}
+
+
+# ---- Write / read the view files ----
+def view_path(name, base_dir=None):
+    path = VIEW_DIR / f"{name}.arrow"
+    return Path(base_dir) / path if base_dir else path
+
+
+def sources_hash(base_dir=None):
+    """SHA-1 over the content of all CSV sources (missing files are skipped; unchanged files are not read again)."""
+    digest = hashlib.sha1()
+    for name, spec in DATASETS.items():
+        csv_path = Path(base_dir) / spec["csv"] if base_dir else Path(spec["csv"])
+        if csv_path.exists():
+            digest.update(f"{name}:{source_hash(csv_path)}".encode())
+    return digest.hexdigest()
+
+
+def write_page_views(store, base_dir=None):
+    """Write all views of the store as uncompressed Arrow files; returns the written paths."""
+    if feather is None:
+        raise ImportError("pyarrow is required to write the page views.")
+
+    built_from = sources_hash(base_dir).encode()
+    paths = []
+    for name, build_view in PAGE_VIEWS.items():
+        table = pa.Table.from_pandas(build_view(store), preserve_index=False)
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}), b"sources_sha1": built_from})
+        output_file = view_path(name, base_dir)
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        feather.write_feather(table, output_file, compression="uncompressed")
+        paths.append(output_file)
+    return paths
+
+
+def read_page_view(name, base_dir=None):
+    """The view from its Arrow file, or None if the file is missing or was built from other source data."""
+    path = view_path(name, base_dir)
+    if feather is None or not path.exists():
+        return None
+    table = feather.read_table(path, memory_map=True)
+    if (table.schema.metadata or {}).get(b"sources_sha1", b"").decode() != sources_hash(base_dir):
+        return None
+    return table_to_pandas(table)
+
+
+@st.cache_data
+def load_page_view(name):
+    """Table of a page: the materialized view if it is up to date, otherwise computed from the knowledge store."""
+    view = read_page_view(name)
+    if view is None:
+        view = PAGE_VIEWS[name](get_knowledge_store())
+    return view
@@ -1,16 +1,19 @@
 # rdf_graph.py
 
 import streamlit as st
-from rdflib import Graph, Namespace
+from rdflib import Namespace
 from rdflib.namespace import RDF, RDFS
 from streamlit_agraph import Node, Edge
+from utils.data_loader import load_knowledge_graph
 
 """
 The below functions are displayed in the rdf page.
+All helpers query the process-wide graph handle of load_knowledge_graph() and are cached per graph_key,
+i.e. the (path, mtime) tuple returned by knowledge_graph_key(). Results are shared resources and must not be mutated.
 """
 
-@st.cache_data
-def get_movies_with_titles(df_ttl):
+@st.cache_resource
+def get_movies_with_titles(graph_key):
     """
     Extract movies with both English and German titles from RDF graph.
     Returns a list of tuples: (movie_uri, english_title, german_title, combined_title)
@@ -19,8 +22,7 @@ def get_movies_with_titles(df_ttl):
 
     MOVIE = Namespace("https://triplydb.com/Triply/linkedmdb/vocab/")
 
-    g = Graph()
-    g.parse(data=df_ttl, format='ttl')
+    g = load_knowledge_graph(*graph_key)
 
     movie_query = '''
         PREFIX movie: <https://triplydb.com/Triply/linkedmdb/vocab/>
@@ -49,548 +51,289 @@ def get_movies_with_titles(df_ttl):
     return movies
 
 
-@st.cache_data
-def create_rdf_graph(df_ttl):
-    # ---- Define Namespaces ----
-    MOVIE = Namespace("https://triplydb.com/Triply/linkedmdb/vocab/")
-    FOAF = Namespace("http://xmlns.com/foaf/0.1/")
-    DBO = Namespace("http://dbpedia.org/ontology/")
-    TIME = Namespace("http://www.w3.org/2006/time#")
-    SCHEMA = Namespace("http://schema.org/")
-    BOND = Namespace("http://example.org/bond/")
-    GEO = Namespace("http://www.w3.org/2003/01/geo/wgs84_pos#")
-
-    # ---- Load RDF-graph ----
-    g = Graph()
-    g.parse(data=df_ttl, format='ttl')
-
-    # ---- Movies ----
-    movie_query = '''
-        PREFIX movie: <https://triplydb.com/Triply/linkedmdb/vocab/>
-        PREFIX schema: <http://schema.org/>
-        PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
-        PREFIX time: <http://www.w3.org/2006/time#>
-        PREFIX bond: <http://example.org/bond/>
-        SELECT DISTINCT ?movie ?label_en ?label_de ?year ?imdb ?rtm
-        WHERE {
-            ?movie a movie:Film .
-            ?movie schema:name ?label_en .
-            OPTIONAL {
-                ?movie rdfs:label ?label_de .
-                FILTER(lang(?label_de) = "de")
-            }
-            OPTIONAL { ?movie time:year ?year }
-            OPTIONAL { ?movie bond:imdbRating ?imdb }
-            OPTIONAL { ?movie bond:rtmRating ?rtm }
-        }
-    '''
+# ---- Node collections at both ends of each predicate (edge label) ----
+CHARACTER_COLLECTIONS = ("bondgirls", "villains", "characters")
+
+PREDICATE_COLLECTIONS = {
+    "germanTitle": (("movies",), ("movie_attributes",)),
+    "year": (("movies",), ("movie_attributes",)),
+    "imdbRating": (("movies",), ("movie_attributes",)),
+    "rtmRating": (("movies",), ("movie_attributes",)),
+    "hasDirector": (("movies",), ("directors",)),
+    "hasProducer": (("movies",), ("producers",)),
+    "hasJamesBond": (("movies",), ("actors",)),
+    "birthDate": (("actors",), ("bond_actor_attr_nodes",)),
+    "deathDate": (("actors",), ("bond_actor_attr_nodes",)),
+    "citizenship": (("actors",), ("bond_actor_attr_nodes",)),
+    "gender": (("actors",), ("bond_actor_attr_nodes",)),
+    "hasBondGirl": (("movies",), ("bondgirls",)),
+    "hasAntagonist": (("movies",), ("villains",)),
+    "hasCharacter": (("movies",), ("characters",)),
+    "portrayedBy": (CHARACTER_COLLECTIONS, ("actors",)),
+    "actedIn": (("actors",), ("movies",)),
+    "isCharacterIn": (CHARACTER_COLLECTIONS, ("movies",)),
+    "hasLocation": (("movies",), ("locations",)),
+    "hasVehicle": (("movies",), ("vehicles",)),
+    "hasThemeSong": (("movies",), ("songs",)),
+    "isPerformedBy": (("songs",), ("music_contributors",)),
+}
+
+class GraphIndex:
+    """
+    Indexed adjacency model of the node and edge collections built by create_rdf_graph.
+        - collections: the node and edge lists by name (also accessible via index["movies"])
+        - nodes: per node collection a dict node id -> Node (first occurrence wins)
+        - out_edges / in_edges: per predicate a dict source id / target id -> list of Edges
+    Lookups cost O(1) per node and O(degree) per neighbourhood instead of scanning all lists.
+    """
 
+    def __init__(self, collections):
+        self.collections = collections
+        self.nodes = {}
+        self.out_edges = {}
+        self.in_edges = {}
+
+        for name, items in collections.items():
+            if name.endswith("_edges"):
+                for edge in items:
+                    self.out_edges.setdefault(edge.label, {}).setdefault(edge.source, []).append(edge)
+                    self.in_edges.setdefault(edge.label, {}).setdefault(edge.to, []).append(edge)
+            else:
+                by_id = self.nodes.setdefault(name, {})
+                for node in items:
+                    by_id.setdefault(node.id, node)
+
+    def __getitem__(self, name):
+        return self.collections[name]
+
+    def node(self, node_id, collections):
+        """Return the node with the given id from the first collection containing it, or None."""
+        for name in collections:
+            node = self.nodes.get(name, {}).get(node_id)
+            if node is not None:
+                return node
+        return None
+
+    def collection_of(self, node_id, preferred=()):
+        """
+        Name of the node collection containing the node id, or None. A node can be in several collections
+        (e.g. villains are film characters too); the preferred collections are checked first, then all in order.
+        """
+        for name in list(preferred) + list(self.nodes):
+            if node_id in self.nodes.get(name, {}):
+                return name
+        return None
+
+    def out(self, predicate, source):
+        """Edges with the given predicate leaving the source node."""
+        return self.out_edges.get(predicate, {}).get(source, [])
+
+    def into(self, predicate, target):
+        """Edges with the given predicate pointing to the target node."""
+        return self.in_edges.get(predicate, {}).get(target, [])
+
+    def neighbourhood(self, movie_uris, predicates):
+        """
+        Return (nodes, edges) of the one-hop neighbourhood of the given start nodes (movies by default,
+        but any node ids work) for the given predicates. Edges are followed in both directions, e.g.
+        "hasDirector" yields the directors of a movie and "actedIn" the actors pointing to it.
+        Neighbour nodes are looked up in the collections of PREDICATE_COLLECTIONS; the start nodes are not included.
+        """
+        nodes, edges = [], []
+        for uri in movie_uris:
+            for predicate in predicates:
+                source_collections, target_collections = PREDICATE_COLLECTIONS[predicate]
+                for edge in self.out(predicate, uri):
+                    edges.append(edge)
+                    node = self.node(edge.to, target_collections)
+                    if node is not None:
+                        nodes.append(node)
+                for edge in self.into(predicate, uri):
+                    if edge.source == uri:
+                        continue  # self-loop, already added as outgoing edge
+                    edges.append(edge)
+                    node = self.node(edge.source, source_collections)
+                    if node is not None:
+                        nodes.append(node)
+        return nodes, edges
+
+
+# ---- Namespaces ----
+MOVIE = Namespace("https://triplydb.com/Triply/linkedmdb/vocab/")
+FOAF = Namespace("http://xmlns.com/foaf/0.1/")
+DBO = Namespace("http://dbpedia.org/ontology/")
+TIME = Namespace("http://www.w3.org/2006/time#")
+SCHEMA = Namespace("http://schema.org/")
+BOND = Namespace("http://example.org/bond/")
+
+# ---- Node collections: (collection, rdf:type, label predicate, node style) ----
+NODE_TYPES = [
+    ("directors", MOVIE.Director, FOAF.name, dict(color="#7CCCC7", shape='ellipse', size=20)),
+    ("producers", MOVIE.Producer, FOAF.name, dict(color='#7CCCC7', shape='ellipse', size=18)),
+    ("characters", MOVIE.FilmCharacter, FOAF.name, dict(color="#7CCCC7", shape='ellipse', size=20)),
+    ("bondgirls", BOND.BondGirl, FOAF.name, dict(color='#7CCCC7', shape='ellipse', size=20)),
+    ("villains", BOND.Villain, FOAF.name, dict(color="#7CCCC7", shape='ellipse', size=22)),
+    ("locations", MOVIE.FilmLocation, RDFS.label, dict(color='#90EE90', shape='dot', size=18)),
+    ("vehicles", BOND.Vehicle, RDFS.label, dict(color='#7CCCC7', shape='ellipse', size=18)),
+    ("songs", DBO.Song, RDFS.label, dict(color='#7CCCC7', shape='ellipse', size=18)),
+    ("music_contributors", MOVIE.MusicContributor, FOAF.name, dict(color='#7CCCC7', shape='ellipse', size=18)),
+]
+
+# ---- Edge collections: (collection, predicate) ----
+EDGE_TYPES = [
+    ("director_edges", BOND.hasDirector),
+    ("producer_edges", BOND.hasProducer),
+    ("bond_actor_edges", BOND.hasJamesBond),
+    ("bondgirl_edges", BOND.hasBondGirl),
+    ("villain_edges", BOND.hasAntagonist),
+    ("character_edges", BOND.hasCharacter),
+    ("portrayed_edges", BOND.portrayedBy),
+    ("acted_in_edges", BOND.actedIn),
+    ("character_in_edges", BOND.isCharacterIn),
+    ("location_edges", BOND.hasLocation),
+    ("vehicle_edges", BOND.hasVehicle),
+    ("song_edges", BOND.hasThemeSong),
+    ("performer_edges", BOND.isPerformedBy),
+]
+
+# ---- Movie attributes: (predicate, edge label, node id suffix, label format, node size) ----
+MOVIE_ATTRIBUTE_TYPES = [
+    (TIME.year, "year", "year", lambda value: str(value)[:4], 12),
+    (BOND.imdbRating, "imdbRating", "imdb", lambda value: f"IMDb: {float(value):.1f}", 12),
+    (BOND.rtmRating, "rtmRating", "rtm", lambda value: f"RT: {float(value):.1f}", 12),
+]
+
+# ---- Bond actor attributes: (predicate, edge label) ----
+BOND_ACTOR_ATTRIBUTE_TYPES = [
+    (DBO.birthDate, "birthDate"),
+    (DBO.deathDate, "deathDate"),
+    (DBO.citizenship, "citizenship"),
+    (FOAF.gender, "gender"),
+]
+
+
+# ---- Single pass over the triples ----
+def bucket_triples(g):
+    """
+    Walk all triples of the graph once and bucket them:
+        - subjects_by_type: rdf:type -> list of subjects
+        - objects: subject -> predicate -> list of objects
+        - triples_by_predicate: predicate -> list of (subject, object)
+    """
+    subjects_by_type = {}
+    objects = {}
+    triples_by_predicate = {}
+    for s, p, o in g:
+        if p == RDF.type:
+            subjects_by_type.setdefault(o, []).append(s)
+        objects.setdefault(s, {}).setdefault(p, []).append(o)
+        triples_by_predicate.setdefault(p, []).append((s, o))
+    return subjects_by_type, objects, triples_by_predicate
+
+
+def extract_graph_collections(g):
+    """
+    Build all node and edge collections of the RDF page from one pass over the triples of the graph.
+    Returns a dict collection name -> list of Nodes / Edges.
+    """
+    subjects_by_type, objects, triples_by_predicate = bucket_triples(g)
+
+    def values(subject, predicate):
+        return objects.get(subject, {}).get(predicate, [])
+
+    def label_of(term):
+        labels = values(term, RDFS.label)
+        return str(labels[0]) if labels else str(term).split("/")[-1]
+
+    collections = {}
+
+    # ---- Movies and their attribute nodes (German title, year, ratings) ----
     movies = []
     movie_attributes = []  # Store attribute nodes separately
     movie_attribute_edges = []  # Store edges to attributes
-
-    for row in g.query(movie_query):
-        movie_uri = str(row[0])
-        label_en = str(row[1])
-        label_de = str(row[2]) if row[2] else None
-        year = str(row[3])[:4] if row[3] else None
-        imdb = f"{float(row[4]):.1f}" if row[4] else None
-        rtm = f"{float(row[5]):.1f}" if row[5] else None
-
-        # Create movie node with simple label (English title only)
-        movies.append(
-            Node(id=movie_uri,
-                 label=label_en,
-                 color="#797DCF",
-                 shape='ellipse',
-                 size=25)
-        )
-
-        # Create attribute nodes for year, German title, and ratings
-        # German title node (if different)
-        if label_de and label_de != label_en:
-            de_node_id = f"{movie_uri}_de_title"
-            movie_attributes.append(
-                Node(id=de_node_id,
-                     label=f"DE: {label_de}",
-                     color='#FFCCCC',
-                     shape='box',
-                     size=15)
-            )
-            movie_attribute_edges.append(
-                Edge(source=movie_uri,
-                     label='germanTitle',
-                     target=de_node_id)
-            )
-
-        # Year node
-        if year:
-            year_node_id = f"{movie_uri}_year"
-            movie_attributes.append(
-                Node(id=year_node_id,
-                     label=year,
-                     color='#FFCCCC',
-                     shape='box',
-                     size=12)
-            )
-            movie_attribute_edges.append(
-                Edge(source=movie_uri,
-                     label='year',
-                     target=year_node_id)
-            )
-
-        # IMDb rating node
-        if imdb:
-            imdb_node_id = f"{movie_uri}_imdb"
-            movie_attributes.append(
-                Node(id=imdb_node_id,
-                     label=f"IMDb: {imdb}",
-                     color='#FFCCCC',
-                     shape='box',
-                     size=12)
-            )
-            movie_attribute_edges.append(
-                Edge(source=movie_uri,
-                     label='imdbRating',
-                     target=imdb_node_id)
-            )
-
-        # Rotten Tomatoes rating node
-        if rtm:
-            rtm_node_id = f"{movie_uri}_rtm"
-            movie_attributes.append(
-                Node(id=rtm_node_id,
-                     label=f"RT: {rtm}",
-                     color='#FFCCCC',
-                     shape='box',
-                     size=12)
-            )
-            movie_attribute_edges.append(
-                Edge(source=movie_uri,
-                     label='rtmRating',
-                     target=rtm_node_id)
-            )
-
-    # ---- Directors ----
-    director_query = '''
-        PREFIX movie: <https://triplydb.com/Triply/linkedmdb/vocab/>
-        PREFIX bond: <http://example.org/bond/>
-        PREFIX foaf: <http://xmlns.com/foaf/0.1/>
-        SELECT DISTINCT ?director ?name
-        WHERE {
-            ?director a movie:Director .
-            ?director foaf:name ?name .
-        }
-    '''
-    directors = [
-        Node(id=str(row[0]),
-                label=str(row[1]),
-                color="#7CCCC7",
-                shape='ellipse',
-                size=20)
-        for row in g.query(director_query)
+    for movie in subjects_by_type.get(MOVIE.Film, []):
+        movie_uri = str(movie)
+        label_de = next((str(label) for label in values(movie, RDFS.label) if label.language == "de"), None)
+        for name in values(movie, SCHEMA.name):
+            label_en = str(name)
+            # Create movie node with simple label (English title only)
+            movies.append(Node(id=movie_uri, label=label_en, color="#797DCF", shape='ellipse', size=25))
+
+            # German title node (if different)
+            if label_de and label_de != label_en:
+                de_node_id = f"{movie_uri}_de_title"
+                movie_attributes.append(
+                    Node(id=de_node_id, label=f"DE: {label_de}", color='#FFCCCC', shape='box', size=15))
+                movie_attribute_edges.append(Edge(source=movie_uri, label='germanTitle', target=de_node_id))
+
+            # Year and rating nodes
+            for predicate, edge_label, suffix, label_format, size in MOVIE_ATTRIBUTE_TYPES:
+                attribute_values = values(movie, predicate)
+                if attribute_values:
+                    node_id = f"{movie_uri}_{suffix}"
+                    movie_attributes.append(
+                        Node(id=node_id, label=label_format(attribute_values[0]), color='#FFCCCC', shape='box', size=size))
+                    movie_attribute_edges.append(Edge(source=movie_uri, label=edge_label, target=node_id))
+
+    collections["movies"] = movies
+    collections["movie_attributes"] = movie_attributes
+    collections["movie_attribute_edges"] = movie_attribute_edges
+
+    # ---- Actors (one node per image, star shape without image) ----
+    collections["actors"] = [
+        Node(id=str(actor),
+             label=str(name),
+             color='#FFD93D',
+             shape='circularImage' if image else 'star',
+             size=22,
+             image=str(image) if image else None)
+        for actor in subjects_by_type.get(MOVIE.Actor, [])
+        for name in values(actor, FOAF.name)
+        for image in values(actor, SCHEMA.image) or [None]
     ]
 
-    # ---- Producers ----
-    producer_query = '''
-        PREFIX movie: <https://triplydb.com/Triply/linkedmdb/vocab/>
-        PREFIX foaf: <http://xmlns.com/foaf/0.1/>
-        SELECT DISTINCT ?producer ?name
-        WHERE {
-            ?producer a movie:Producer .
-            ?producer foaf:name ?name .
-        }
-    '''
-    producers = [
-        Node(id=str(row[0]),
-                label=str(row[1]),
-                color='#7CCCC7',
-                shape='ellipse',
-                size=18)
-        for row in g.query(producer_query)
-    ]
-
-    # ---- Actors ----
-    actor_query = '''
-        PREFIX movie: <https://triplydb.com/Triply/linkedmdb/vocab/>
-        PREFIX foaf: <http://xmlns.com/foaf/0.1/>
-        PREFIX schema: <http://schema.org/>
-        SELECT DISTINCT ?actor ?name ?image
-        WHERE {
-            ?actor a movie:Actor .
-            ?actor foaf:name ?name .
-            OPTIONAL { ?actor schema:image ?image }
-        }
-    '''
-    actors = [
-        Node(id=str(row[0]),
-                label=str(row[1]),
-                color='#FFD93D',
-                shape='circularImage' if row[2] else 'star',
-                size=22,
-                image=str(row[2]) if row[2] else None)
-        for row in g.query(actor_query)
-    ]
+    # ---- Named node collections ----
+    for collection, rdf_type, label_predicate, style in NODE_TYPES:
+        collections[collection] = [
+            Node(id=str(subject), label=str(label), **style)
+            for subject in subjects_by_type.get(rdf_type, [])
+            for label in values(subject, label_predicate)
+        ]
 
-    # ---- Bond Actors: Attribute + hasJamesBond ----
+    # ---- Bond actor attributes (dates as boxes, citizenship and gender as shared nodes) ----
     bond_actor_attr_nodes = []
     bond_actor_attr_edges = []
-    bond_actor_edges = []
-
-    # Attribute for BondActors
-    for actor in g.subjects(RDF.type, BOND.BondActor):
+    for actor in subjects_by_type.get(BOND.BondActor, []):
         actor_uri = str(actor)
-
-        # birthDate
-        for dob in g.objects(actor, DBO.birthDate):
-            node_id = f"{actor_uri}_birthDate"
-            bond_actor_attr_nodes.append(
-                Node(
-                    id=node_id,
-                    label=str(dob),
-                    color='#FFCCCC',
-                    shape="box",
-                    size=16,
-                )
-            )
-            bond_actor_attr_edges.append(
-                Edge(
-                    source=actor_uri,
-                    label="birthDate",
-                    target=node_id,
-                )
-            )
-
-        # deathDate
-        for dod in g.objects(actor, DBO.deathDate):
-            node_id = f"{actor_uri}_deathDate"
-            bond_actor_attr_nodes.append(
-                Node(
-                    id=node_id,
-                    label=str(dod),
-                    color='#FFCCCC',
-                    shape="box",
-                    size=16,
-                )
-            )
-            bond_actor_attr_edges.append(
-                Edge(
-                    source=actor_uri,
-                    label="deathDate",
-                    target=node_id,
-                )
-            )
-
-        # citizenship
-        for country in g.objects(actor, DBO.citizenship):
-            country_uri = str(country)
-            country_label = g.value(country, RDFS.label) or country_uri.split("/")[-1]
-            bond_actor_attr_nodes.append(
-                Node(
-                    id=country_uri,
-                    label=str(country_label),
-                    color='#7CCCC7',
-                    shape="ellipse",
-                    size=20,
-                )
-            )
-            bond_actor_attr_edges.append(
-                Edge(
-                    source=actor_uri,
-                    label="citizenship",
-                    target=country_uri,
-                )
-            )
-
-        # gender
-        for gender in g.objects(actor, FOAF.gender):
-            gender_uri = str(gender)
-            gender_label = g.value(gender, RDFS.label) or gender_uri.split("/")[-1]
-            bond_actor_attr_nodes.append(
-                Node(
-                    id=gender_uri,
-                    label=str(gender_label),
-                    color='#7CCCC7',
-                    shape='ellipse',
-                    size=20,
-                )
-            )
-            bond_actor_attr_edges.append(
-                Edge(
-                    source=actor_uri,
-                    label="gender",
-                    target=gender_uri,
-                )
-            )
-
-    # Edges Film -> BondActor (hasJamesBond)
-    for movie, _, actor in g.triples((None, BOND.hasJamesBond, None)):
-        bond_actor_edges.append(
-            Edge(
-                source=str(movie),
-                label="hasJamesBond",
-                target=str(actor),
-            )
-        )
-
-    # ---- Film Characters (other characters - not bond girls or villains) ----
-    character_query = '''
-        PREFIX movie: <https://triplydb.com/Triply/linkedmdb/vocab/>
-        PREFIX foaf: <http://xmlns.com/foaf/0.1/>
-        SELECT DISTINCT ?character ?name
-        WHERE {
-            ?character a movie:FilmCharacter .
-            ?character foaf:name ?name .
-        }
-    '''
-    characters = [
-        Node(id=str(row[0]),
-                label=str(row[1]),
-                color="#7CCCC7",
-                shape='ellipse',
-                size=20)
-        for row in g.query(character_query)
-    ]
-
-    # ---- Bond Girls ----
-    bondgirl_query = '''
-        PREFIX bond: <http://example.org/bond/>
-        PREFIX foaf: <http://xmlns.com/foaf/0.1/>
-        SELECT DISTINCT ?bondgirl ?name
-        WHERE {
-            ?bondgirl a bond:BondGirl .
-            ?bondgirl foaf:name ?name .
-        }
-    '''
-    bondgirls = [
-        Node(id=str(row[0]),
-                label=str(row[1]),
-                color='#7CCCC7',
-                shape='ellipse',
-                size=20)
-        for row in g.query(bondgirl_query)
-    ]
-
-    # ---- Villains ----
-    villain_query = '''
-        PREFIX bond: <http://example.org/bond/>
-        PREFIX foaf: <http://xmlns.com/foaf/0.1/>
-        SELECT DISTINCT ?villain ?name
-        WHERE {
-            ?villain a bond:Villain .
-            ?villain foaf:name ?name .
-        }
-    '''
-    villains = [
-        Node(id=str(row[0]),
-                label=str(row[1]),
-                color="#7CCCC7",
-                shape='ellipse',
-                size=22)
-        for row in g.query(villain_query)
-    ]
-
-    # ---- Locations ----
-    location_query = '''
-        PREFIX movie: <https://triplydb.com/Triply/linkedmdb/vocab/>
-        PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
-        SELECT DISTINCT ?location ?label
-        WHERE {
-            ?location a movie:FilmLocation .
-            ?location rdfs:label ?label .
-        }
-    '''
-    locations = [
-        Node(id=str(row[0]),
-                label=str(row[1]),
-                color='#90EE90',
-                shape='dot',
-                size=18)
-        for row in g.query(location_query)
-    ]
-
-    # ---- Vehicles ----
-    vehicle_query = '''
-        PREFIX bond: <http://example.org/bond/>
-        PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
-        PREFIX schema: <http://schema.org/>
-        SELECT DISTINCT ?vehicle ?label ?image
-        WHERE {
-            ?vehicle a bond:Vehicle .
-            ?vehicle rdfs:label ?label .
-            OPTIONAL { ?vehicle schema:image ?image }
-        }
-    '''
-    vehicles = [
-        Node(id=str(row[0]),
-                label=str(row[1]),
-                color='#7CCCC7',
-                shape='ellipse',
-                size=18)
-        for row in g.query(vehicle_query)
-    ]
-
-    # ---- Theme Songs ----
-    song_query = '''
-        PREFIX dbo: <http://dbpedia.org/ontology/>
-        PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
-        SELECT DISTINCT ?song ?label
-        WHERE {
-            ?song a dbo:Song .
-            ?song rdfs:label ?label .
-        }
-    '''
-    songs = [
-        Node(id=str(row[0]),
-                label=str(row[1]),
-                color='#7CCCC7',
-                shape='ellipse',
-                size=18)
-        for row in g.query(song_query)
-    ]
-
-    # ---- Music Contributors ----
-    music_contributor_query = '''
-        PREFIX movie: <https://triplydb.com/Triply/linkedmdb/vocab/>
-        PREFIX foaf: <http://xmlns.com/foaf/0.1/>
-        SELECT DISTINCT ?contributor ?name
-        WHERE {
-            ?contributor a movie:MusicContributor .
-            ?contributor foaf:name ?name .
-        }
-    '''
-    music_contributors = [
-        Node(id=str(row[0]),
-                label=str(row[1]),
-                color='#7CCCC7',
-                shape='ellipse',
-                size=18)
-        for row in g.query(music_contributor_query)
-    ]
-
-    # ---- Edges: Movie -> Director ----
-    director_edges = [
-        Edge(source=str(movie),
-                label='hasDirector',
-                target=str(director))
-        for movie, _, director in g.triples((None, BOND.hasDirector, None))
-    ]
-
-    # ---- Edges: Movie -> Producer ----
-    producer_edges = [
-        Edge(source=str(movie),
-                label='hasProducer',
-                target=str(producer))
-        for movie, _, producer in g.triples((None, BOND.hasProducer, None))
-    ]
-
-    # ---- Edges: Movie -> BondGirl (hasBondGirl) ----
-    bondgirl_edges = [
-        Edge(source=str(movie),
-                label='hasBondGirl',
-                target=str(bondgirl))
-        for movie, _, bondgirl in g.triples((None, BOND.hasBondGirl, None))
-    ]
-
-    # ---- Edges: Movie -> Villain (hasAntagonist) ----
-    villain_edges = [
-        Edge(source=str(movie),
-                label='hasAntagonist',
-                target=str(villain))
-        for movie, _, villain in g.triples((None, BOND.hasAntagonist, None))
-    ]
-
-    # ---- Edges: Movie -> Character (hasCharacter) ----
-    character_edges = [
-        Edge(source=str(movie),
-                label='hasCharacter',
-                target=str(character))
-        for movie, _, character in g.triples((None, BOND.hasCharacter, None))
-    ]
-
-    # ---- Edges: Character -> Actor (portrayedBy) ----
-    portrayed_edges = [
-        Edge(source=str(character),
-                label='portrayedBy',
-                target=str(actor))
-        for character, _, actor in g.triples((None, BOND.portrayedBy, None))
-    ]
-
-    # ---- Edges: Actor -> Movie (actedIn) ----
-    acted_in_edges = [
-        Edge(source=str(actor),
-                label='actedIn',
-                target=str(movie))
-        for actor, _, movie in g.triples((None, BOND.actedIn, None))
-    ]
-
-    # ---- Edges: Character -> Movie (isCharacterIn) ----
-    character_in_edges = [
-        Edge(source=str(character),
-                label='isCharacterIn',
-                target=str(movie))
-        for character, _, movie in g.triples((None, BOND.isCharacterIn, None))
-    ]
-
-    # ---- Edges: Movie -> Location ----
-    location_edges = [
-        Edge(source=str(movie),
-                label='hasLocation',
-                target=str(location))
-        for movie, _, location in g.triples((None, BOND.hasLocation, None))
-    ]
-
-    # ---- Edges: Movie -> Vehicle ----
-    vehicle_edges = [
-        Edge(source=str(movie),
-                label='hasVehicle',
-                target=str(vehicle))
-        for movie, _, vehicle in g.triples((None, BOND.hasVehicle, None))
-    ]
-
-    # ---- Edges: Movie -> ThemeSong ----
-    song_edges = [
-        Edge(source=str(movie),
-                label='hasThemeSong',
-                target=str(song))
-        for movie, _, song in g.triples((None, BOND.hasThemeSong, None))
-    ]
-
-    # ---- Edges: Song -> MusicContributor ----
-    performer_edges = [
-        Edge(source=str(song),
-                label='isPerformedBy',
-                target=str(contributor))
-        for song, _, contributor in g.triples((None, BOND.isPerformedBy, None))
-    ]
-
-    return {
-        "movies": movies,
-        "movie_attributes": movie_attributes,
-        "directors": directors,
-        "producers": producers,
-        "actors": actors,
-        "characters": characters,
-        "bondgirls": bondgirls,
-        "villains": villains,
-        "locations": locations,
-        "vehicles": vehicles,
-        "songs": songs,
-        "music_contributors": music_contributors,
-        "director_edges": director_edges,
-        "producer_edges": producer_edges,
-        "bondgirl_edges": bondgirl_edges,
-        "villain_edges": villain_edges,
-        "character_edges": character_edges,
-        "movie_attribute_edges": movie_attribute_edges,
-        "portrayed_edges": portrayed_edges,
-        "acted_in_edges": acted_in_edges,
-        "character_in_edges": character_in_edges,
-        "location_edges": location_edges,
-        "vehicle_edges": vehicle_edges,
-        "song_edges": song_edges,
-        "performer_edges": performer_edges,
-        "bond_actor_attr_nodes": bond_actor_attr_nodes,
-        "bond_actor_attr_edges": bond_actor_attr_edges,
-        "bond_actor_edges": bond_actor_edges,
-    }
+        for predicate, edge_label in BOND_ACTOR_ATTRIBUTE_TYPES:
+            for value in values(actor, predicate):
+                if edge_label in ("birthDate", "deathDate"):
+                    node_id = f"{actor_uri}_{edge_label}"
+                    node = Node(id=node_id, label=str(value), color='#FFCCCC', shape="box", size=16)
+                else:
+                    node_id = str(value)
+                    node = Node(id=node_id, label=label_of(value), color='#7CCCC7', shape="ellipse", size=20)
+                bond_actor_attr_nodes.append(node)
+                bond_actor_attr_edges.append(Edge(source=actor_uri, label=edge_label, target=node_id))
+
+    collections["bond_actor_attr_nodes"] = bond_actor_attr_nodes
+    collections["bond_actor_attr_edges"] = bond_actor_attr_edges
+
+    # ---- Edges ----
+    for collection, predicate in EDGE_TYPES:
+        collections[collection] = [
+            Edge(source=str(s), label=predicate.split("/")[-1], target=str(o))
+            for s, o in triples_by_predicate.get(predicate, [])
+        ]
+
+    return collections
+
+
+@st.cache_resource
+def create_rdf_graph(graph_key):
+    """
+    Build all node and edge collections of the RDF page from the knowledge graph
+    and return them as GraphIndex.
+    """
+    g = load_knowledge_graph(*graph_key)
+    return GraphIndex(extract_graph_collections(g))
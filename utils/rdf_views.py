@@ -0,0 +1,380 @@
+# rdf_views.py
+
+import copy
+from functools import lru_cache
+from streamlit_agraph import Node, Edge
+from utils.graph_layout import force_layout
+from utils.rdf_graph import create_rdf_graph, PREDICATE_COLLECTIONS
+
+"""
+Declarative view engine for the RDF graph page.
+Every view is a small traversal spec (VIEW_SPECS) with two step lists:
+    - "selected": steps run for each selected movie (one-hop neighbourhoods of the GraphIndex)
+    - "all": steps run when no movie is selected (whole node/edge collections)
+The specs are compiled once into step functions (VIEWS). The resulting node and edge sets are memoized in a
+bounded LRU keyed by (graph key, view, frozenset of movie URIs), so switching back and forth between views or
+movie selections only costs a dictionary lookup after the first hit.
+The cached nodes carry precomputed x/y coordinates (utils/graph_layout.py), so the page renders with physics off.
+Unfiltered views above NODE_BUDGET nodes are rendered in level-of-detail mode: every entity type except the movies
+is collapsed into one cluster node with its count ("142 characters") and only expanded on demand.
+"""
+
+VIEW_CACHE_SIZE = 64
+NODE_BUDGET = 150  # max. number of entity nodes in level-of-detail mode (cluster nodes not counted)
+CLUSTER_PREFIX = "cluster:"
+
+# Display names of the clustered node collections
+CLUSTER_LABELS = {
+    "movie_attributes": "movie attributes",
+    "directors": "directors",
+    "producers": "producers",
+    "actors": "actors",
+    "characters": "characters",
+    "bondgirls": "Bond girls",
+    "villains": "villains",
+    "locations": "locations",
+    "vehicles": "vehicles",
+    "songs": "songs",
+    "music_contributors": "music contributors",
+    "bond_actor_attr_nodes": "Bond actor attributes",
+}
+
+MOVIE_ATTRIBUTES = ["germanTitle", "year", "imdbRating", "rtmRating"]
+BOND_ACTOR_ATTRIBUTES = ["birthDate", "deathDate", "citizenship", "gender"]
+ALL_CHARACTERS = ["hasBondGirl", "hasAntagonist", "hasCharacter"]
+
+
+# ---- Traversal specs of the eight views ----
+VIEW_SPECS = {
+    # Movies, attributes, directors, producers, Bond actor, characters with actors, songs and performers
+    "Movie overview": {
+        "selected": [
+            ("neighbours", MOVIE_ATTRIBUTES + ["hasDirector", "hasProducer"]),
+            ("bond_actor",),
+            ("characters", ALL_CHARACTERS, True),
+            ("songs",),
+        ],
+        "all": [
+            ("collections",
+             ["movies", "movie_attributes", "directors", "producers", "bondgirls", "villains", "characters",
+              "songs", "music_contributors", "bond_actor_attr_nodes"],
+             ["movie_attribute_edges", "director_edges", "producer_edges", "bondgirl_edges", "villain_edges",
+              "character_edges", "song_edges", "performer_edges", "bond_actor_edges", "bond_actor_attr_edges"]),
+            ("portrayed_by", ["bondgirls", "villains", "characters"]),
+        ],
+    },
+    # Movies, Bond actors and their Wikidata-based attributes
+    "James Bond": {
+        "selected": [("bond_actor",)],
+        "all": [
+            ("collections", ["movies", "bond_actor_attr_nodes"], ["bond_actor_edges", "bond_actor_attr_edges"]),
+            ("bond_actors",),
+        ],
+    },
+    # Movies, characters and the actors who portray them
+    "Bond girls": {
+        "selected": [("characters", ["hasBondGirl"], False)],
+        "all": [("collections", ["movies", "bondgirls"], ["bondgirl_edges"]), ("portrayed_by", ["bondgirls"])],
+    },
+    "Villains": {
+        "selected": [("characters", ["hasAntagonist"], False)],
+        "all": [("collections", ["movies", "villains"], ["villain_edges"]), ("portrayed_by", ["villains"])],
+    },
+    "Characters": {
+        "selected": [("characters", ALL_CHARACTERS, False)],
+        "all": [
+            ("collections",
+             ["movies", "bondgirls", "villains", "characters"],
+             ["bondgirl_edges", "villain_edges", "character_edges"]),
+            ("portrayed_by", ["bondgirls", "villains", "characters"]),
+        ],
+    },
+    # Movies, songs and performers
+    "Theme songs": {
+        "selected": [("songs",)],
+        "all": [("collections", ["movies", "songs", "music_contributors"], ["song_edges", "performer_edges"])],
+    },
+    # Movies and their locations/vehicles
+    "Locations": {
+        "selected": [("neighbours", ["hasLocation"])],
+        "all": [("collections", ["movies", "locations"], ["location_edges"])],
+    },
+    "Vehicles": {
+        "selected": [("neighbours", ["hasVehicle"])],
+        "all": [("collections", ["movies", "vehicles"], ["vehicle_edges"])],
+    },
+}
+
+
+# ---- Steps for selected movies: (graph_data, movie_uri) -> (nodes, edges) ----
+def neighbours_step(predicates):
+    def step(graph_data, movie_uri):
+        return graph_data.neighbourhood([movie_uri], predicates)
+    return step
+
+
+def bond_actor_step():
+    """Bond actor of a movie (hasJamesBond) with its attributes (birthDate, deathDate, citizenship, gender)."""
+    def step(graph_data, movie_uri):
+        nodes, edges = graph_data.neighbourhood([movie_uri], ["hasJamesBond"])
+        bond_actor_ids = [edge.to for edge in edges]
+        attr_nodes, attr_edges = graph_data.neighbourhood(bond_actor_ids, BOND_ACTOR_ATTRIBUTES)
+        return nodes + attr_nodes, edges + attr_edges
+    return step
+
+
+def characters_step(character_predicates, all_actors):
+    """
+    Characters of a movie for the given predicates (hasBondGirl, hasAntagonist, hasCharacter) and the
+    portrayedBy edges to actors of the same movie. Characters reached by hasCharacter are skipped if they
+    are already a Bond girl or villain of the movie. With all_actors, every actor of the movie is added,
+    otherwise only the actors portraying one of the characters.
+    """
+    def step(graph_data, movie_uri):
+        nodes, edges = [], []
+        character_ids = set()
+        for predicate in character_predicates:
+            collections = PREDICATE_COLLECTIONS[predicate][1]
+            for edge in graph_data.out(predicate, movie_uri):
+                # Only add if it's not a bond girl or villain (they have their own specific edges)
+                if predicate == "hasCharacter" and edge.to in character_ids:
+                    continue
+                edges.append(edge)
+                character = graph_data.node(edge.to, collections)
+                if character is not None:
+                    nodes.append(character)
+                    character_ids.add(character.id)
+
+        # Get actors who acted in this movie
+        actors_in_movie = {edge.source for edge in graph_data.into("actedIn", movie_uri)}
+        if all_actors:
+            actor_nodes, _ = graph_data.neighbourhood([movie_uri], ["actedIn"])
+            nodes += actor_nodes
+
+        # Add portrayedBy edges for characters in this movie (and the actor nodes)
+        for character_id in character_ids:
+            for edge in graph_data.out("portrayedBy", character_id):
+                if edge.to in actors_in_movie:
+                    edges.append(edge)
+                    if not all_actors:
+                        actor = graph_data.node(edge.to, ("actors",))
+                        if actor is not None:
+                            nodes.append(actor)
+        return nodes, edges
+    return step
+
+
+def songs_step():
+    """Theme song of a movie and its performers."""
+    def step(graph_data, movie_uri):
+        nodes, edges = graph_data.neighbourhood([movie_uri], ["hasThemeSong"])
+        # Song ids from the edges: a song can share its URI with the movie (e.g. "Diamonds Are Forever")
+        song_ids = [edge.to for edge in edges]
+        performer_nodes, performer_edges = graph_data.neighbourhood(song_ids, ["isPerformedBy"])
+        return nodes + performer_nodes, edges + performer_edges
+    return step
+
+
+# ---- Steps without movie filter: graph_data -> (nodes, edges) ----
+def collections_step(node_collections, edge_collections):
+    def step(graph_data):
+        nodes = [node for name in node_collections for node in graph_data[name]]
+        edges = [edge for name in edge_collections for edge in graph_data[name]]
+        return nodes, edges
+    return step
+
+
+def portrayed_by_step(character_collections):
+    """Only the actors who portray a character of the given collections, with their portrayedBy edges."""
+    def step(graph_data):
+        character_ids = {c.id for name in character_collections for c in graph_data[name]}
+        edges = [e for e in graph_data["portrayed_edges"] if e.source in character_ids]
+        actor_ids = {edge.to for edge in edges}
+        nodes = [actor for actor in graph_data["actors"] if actor.id in actor_ids]
+        return nodes, edges
+    return step
+
+
+def bond_actors_step():
+    """BondActor nodes (subset of the actors) reached by hasJamesBond."""
+    def step(graph_data):
+        bond_actor_ids = {e.to for e in graph_data["bond_actor_edges"]}
+        return [actor for actor in graph_data["actors"] if actor.id in bond_actor_ids], []
+    return step
+
+
+STEP_BUILDERS = {
+    "neighbours": neighbours_step,
+    "bond_actor": bond_actor_step,
+    "characters": characters_step,
+    "songs": songs_step,
+    "collections": collections_step,
+    "portrayed_by": portrayed_by_step,
+    "bond_actors": bond_actors_step,
+}
+
+
+# ---- Compile specs ----
+def compile_view(spec):
+    """Turn a view spec into {"selected": [step functions], "all": [step functions]}."""
+    return {
+        mode: [STEP_BUILDERS[name](*args) for name, *args in spec[mode]]
+        for mode in ("selected", "all")
+    }
+
+
+VIEWS = {view: compile_view(spec) for view, spec in VIEW_SPECS.items()}
+
+
+# ---- Run a compiled view ----
+def run_view(graph_data, view, movie_uris):
+    """
+    Return (nodes, edges) of a view. With movie URIs only the selected movies and their neighbourhoods
+    are returned, otherwise the whole view. Nodes are unique by id (first occurrence wins).
+    """
+    compiled = VIEWS[view]
+    node_list, edges = [], []
+
+    if movie_uris:
+        # Selected movies in the order of the movie collection
+        selected = [movie for movie in graph_data["movies"] if movie.id in movie_uris]
+        node_list += selected
+        for movie in selected:
+            for step in compiled["selected"]:
+                step_nodes, step_edges = step(graph_data, movie.id)
+                node_list += step_nodes
+                edges += step_edges
+    else:
+        for step in compiled["all"]:
+            step_nodes, step_edges = step(graph_data)
+            node_list += step_nodes
+            edges += step_edges
+
+    # Remove duplicates by using a dictionary with node ID as key
+    seen_node_ids = {}
+    for node in node_list:
+        if node.id not in seen_node_ids:
+            seen_node_ids[node.id] = node
+    return list(seen_node_ids.values()), edges
+
+
+# ---- Level of detail: collapse entity types into cluster nodes ----
+def view_node_collections(view):
+    """Node collections shown by the unfiltered view, in the order of its spec."""
+    collections = []
+    for name, *args in VIEW_SPECS[view]["all"]:
+        if name == "collections":
+            collections += args[0]
+        elif name in ("portrayed_by", "bond_actors"):
+            collections.append("actors")
+    return collections
+
+
+def group_by_collection(graph_data, view, nodes):
+    """Dict collection name -> nodes of that collection, in order of first appearance."""
+    preferred = view_node_collections(view)
+    groups = {}
+    for node in nodes:
+        groups.setdefault(graph_data.collection_of(node.id, preferred), []).append(node)
+    return groups
+
+
+def cluster_view(graph_data, view, nodes, edges, expanded, budget=NODE_BUDGET):
+    """
+    Return (nodes, edges) with every collection except the movies collapsed into a cluster node.
+    Collections in expanded are shown node by node as long as the node budget allows, the rest of them
+    stays in a cluster labelled "N more ...". Edges to hidden nodes are redirected to their cluster and
+    merged, the edge label carries the number of merged edges.
+    """
+    groups = group_by_collection(graph_data, view, nodes)
+    visible = list(groups.get("movies", []))
+    cluster_of = {}  # hidden node id -> cluster node id
+    clusters = []
+
+    for collection, members in groups.items():
+        if collection == "movies":
+            continue
+        shown = []
+        if collection in expanded:
+            shown = members[:max(budget - len(visible), 0)]
+            visible += shown
+        hidden = members[len(shown):]
+        if not hidden:
+            continue
+        cluster_id = f"{CLUSTER_PREFIX}{collection}"
+        name = CLUSTER_LABELS.get(collection, collection)
+        clusters.append(
+            Node(id=cluster_id,
+                 label=f"{len(hidden)} more {name}" if shown else f"{len(hidden)} {name}",
+                 title=f"{len(hidden)} {name} (expand the cluster above the graph)",
+                 color='#D9D9D9',
+                 shape='box',
+                 size=20)
+        )
+        for node in hidden:
+            cluster_of[node.id] = cluster_id
+
+    # Redirect edges to hidden nodes and merge duplicates
+    kept_edges = []
+    merged = {}  # (source, label, target) -> number of edges
+    for edge in edges:
+        source = cluster_of.get(edge.source, edge.source)
+        target = cluster_of.get(edge.to, edge.to)
+        if source == edge.source and target == edge.to:
+            kept_edges.append(edge)
+        else:
+            key = (source, edge.label, target)
+            merged[key] = merged.get(key, 0) + 1
+    cluster_edges = [
+        Edge(source=source, label=f"{label} ({count})" if count > 1 else label, target=target)
+        for (source, label, target), count in merged.items()
+    ]
+    return visible + clusters, kept_edges + cluster_edges
+
+
+def needs_clusters(nodes, movie_uris):
+    """Level-of-detail mode applies to unfiltered views above the node budget."""
+    return not movie_uris and len(nodes) > NODE_BUDGET
+
+
+@lru_cache(maxsize=VIEW_CACHE_SIZE)
+def view_clusters(graph_key, view):
+    """
+    Return [(collection, number of nodes)] of the collections that are collapsed in the unfiltered view,
+    or an empty list if the view fits into the node budget.
+    """
+    graph_data = create_rdf_graph(graph_key)
+    nodes, _ = run_view(graph_data, view, frozenset())
+    if not needs_clusters(nodes, frozenset()):
+        return []
+    groups = group_by_collection(graph_data, view, nodes)
+    return [(collection, len(members)) for collection, members in groups.items() if collection != "movies"]
+
+
+# ---- Attach precomputed coordinates ----
+def with_positions(nodes, edges):
+    """
+    Return copies of the nodes with x/y from force_layout. The nodes of the GraphIndex are shared
+    between views and sessions, so they are copied instead of mutated.
+    """
+    positions = force_layout([node.id for node in nodes], [(edge.source, edge.to) for edge in edges])
+    positioned = []
+    for node in nodes:
+        node = copy.copy(node)
+        node.x, node.y = positions[node.id]
+        positioned.append(node)
+    return positioned
+
+
+@lru_cache(maxsize=VIEW_CACHE_SIZE)
+def view_graph(graph_key, view, movie_uris, expanded=frozenset()):
+    """
+    Memoized run_view with laid-out nodes for (graph key, view, frozenset of movie URIs, frozenset of
+    expanded clusters). Large unfiltered views are clustered (see cluster_view).
+    Returns tuples, since the cached node and edge objects are shared between reruns and sessions.
+    """
+    graph_data = create_rdf_graph(graph_key)
+    nodes, edges = run_view(graph_data, view, frozenset(movie_uris))
+    if needs_clusters(nodes, movie_uris):
+        nodes, edges = cluster_view(graph_data, view, nodes, edges, expanded)
+    return tuple(with_positions(nodes, edges)), tuple(edges)
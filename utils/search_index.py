@@ -0,0 +1,193 @@
+# search_index.py
+
+import bisect
+import heapq
+import unicodedata
+from collections import Counter, defaultdict
+import streamlit as st
+
+"""
+Global entity search of the sidebar.
+All movies, characters, actors, villains, vehicles, songs and locations of the knowledge store are indexed once
+per process under their normalized names (lower case, without accents and punctuation); movies also under
+their German title, songs also under their performer. A query is answered from three structures instead of filtering DataFrames:
+    - tokens: inverted index token -> entity ids
+    - sorted_tokens: sorted token list, prefix matches by binary search (the last query word is a prefix)
+    - trigrams: trigram -> token ids, fallback for misspelled words (e.g. "goldfingr", "skyfal")
+"""
+
+# Entity kinds, in the order they are ranked, and the page each one is shown on
+SEARCH_KINDS = {
+    "movie": ":clapper: Movie Collection",
+    "character": ":busts_in_silhouette: Recurring Characters",
+    "actor": ":busts_in_silhouette: Recurring Characters",
+    "villain": ":camera: Image Collection",
+    "vehicle": ":camera: Image Collection",
+    "song": ":clapper: Movie Collection",
+    "location": ":earth_africa: Film Locations",
+}
+KIND_ORDER = {kind: i for i, kind in enumerate(SEARCH_KINDS)}
+SEARCH_LIMIT = 20
+TRIGRAM_SIMILARITY = 0.4  # minimum Jaccard similarity of the trigram sets for a fuzzy token match
+
+
+# ---- Normalization ----
+def normalize(text):
+    """'Sean Connery', 'Im Angesicht des Todes', 'Schloß' -> 'sean connery', 'im angesicht des todes', 'schloss'"""
+    text = unicodedata.normalize("NFKD", str(text).casefold())
+    text = "".join(c if c.isalnum() else " " for c in text if not unicodedata.combining(c))
+    return " ".join(text.split())
+
+
+def trigrams(token):
+    padded = f"  {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def films_text(films, limit=3):
+    films = list(dict.fromkeys(films))
+    text = ", ".join(films[:limit])
+    return text + (f" (+{len(films) - limit})" if len(films) > limit else "")
+
+
+# ---- Search index ----
+class SearchIndex:
+    """
+    Inverted, prefix and trigram index over the entities.
+        - entities: list of dicts with kind, name, detail and page (the id of an entity is its position)
+        - names: normalized names (and aliases) per entity, used for ranking
+    """
+
+    def __init__(self, entities):
+        self.entities = []
+        self.names = []
+        self.tokens = defaultdict(set)
+        for kind, name, aliases, detail in entities:
+            entity_id = len(self.entities)
+            self.entities.append({"kind": kind, "name": name, "detail": detail, "page": SEARCH_KINDS[kind]})
+            names = list(dict.fromkeys(n for n in map(normalize, [name, *aliases]) if n))
+            self.names.append(names)
+            for normalized in names:
+                for token in normalized.split():
+                    self.tokens[token].add(entity_id)
+
+        self.sorted_tokens = sorted(self.tokens)
+        self.trigrams = defaultdict(list)
+        for token_id, token in enumerate(self.sorted_tokens):
+            for trigram in trigrams(token):
+                self.trigrams[trigram].append(token_id)
+
+    # ---- Token lookups ----
+    def prefix_tokens(self, prefix):
+        start = bisect.bisect_left(self.sorted_tokens, prefix)
+        end = bisect.bisect_left(self.sorted_tokens, prefix + "\uffff")
+        return self.sorted_tokens[start:end]
+
+    def similar_tokens(self, token):
+        query = trigrams(token)
+        hits = Counter(token_id for trigram in query for token_id in self.trigrams.get(trigram, ()))
+        similar = []
+        for token_id, shared in hits.items():
+            candidate = self.sorted_tokens[token_id]
+            if shared / (len(query) + len(trigrams(candidate)) - shared) >= TRIGRAM_SIMILARITY:
+                similar.append(candidate)
+        return similar
+
+    def matches(self, token, prefix):
+        """Entity ids for one query word: exact (or prefix) matches, misspellings if there are none."""
+        tokens = self.prefix_tokens(token) if prefix else ([token] if token in self.tokens else [])
+        if not tokens and len(token) >= 3:
+            tokens = self.similar_tokens(token)
+        return set().union(*(self.tokens[t] for t in tokens))
+
+    # ---- Query ----
+    def rank(self, entity_id, query):
+        """Exact name first, then names starting with the query, then by kind and name length."""
+        names = self.names[entity_id]
+        entity = self.entities[entity_id]
+        if query in names:
+            match = 0
+        elif any(n.startswith(query) for n in names):
+            match = 1
+        else:
+            match = 2
+        return match, KIND_ORDER[entity["kind"]], len(entity["name"]), entity["name"]
+
+    def search(self, query, limit=SEARCH_LIMIT):
+        """Entities whose names contain all words of the query (the last one as prefix), best matches first."""
+        words = normalize(query).split()
+        if not words:
+            return []
+
+        result = None
+        for i, word in enumerate(words):
+            ids = self.matches(word, prefix=i == len(words) - 1)
+            result = ids if result is None else result & ids
+            if not result:
+                return []
+        query = " ".join(words)
+        return [self.entities[i] for i in heapq.nsmallest(limit, result, key=lambda i: self.rank(i, query))]
+
+
+# ---- Entities of the knowledge store ----
+def store_entities(store):
+    """(kind, name, aliases, detail) of all searchable entities."""
+    movies = store.movies
+    for title, row in movies.iterrows():
+        aliases = [row['Movie_de']] if isinstance(row['Movie_de'], str) else []
+        yield "movie", title, aliases, f"{row['Year']} · {row['Movie_de']}"
+
+    for song, group in movies.dropna(subset=['song']).groupby('song', sort=False):
+        performer = group['performer'].iloc[0]
+        yield "song", song, [performer] if isinstance(performer, str) else [], f"{performer} · {films_text(group['Movie'])}"
+
+    for name, positions in store.by_character.items():
+        yield "character", name, [], films_text(store.characters['movie'].iloc[positions].astype(str))
+
+    for name, tables in store.by_actor.items():
+        films = [str(m) for table, positions in tables.items()
+                 for m in store.rows(table, positions)['Movie' if table == 'movies' else 'movie']]
+        role = "Bond actor · " if 'movies' in tables else ""
+        yield "actor", name, [], role + films_text(films)
+
+    for villain, group in store.villains.groupby('Villain', sort=False):
+        yield "villain", villain, [], f"{group['Portrayed by'].iloc[0]} · {films_text(group['movie'].astype(str))}"
+
+    for name, positions in store.by_vehicle.items():
+        yield "vehicle", name, [], films_text(store.vehicles['movie'].iloc[positions].astype(str))
+
+    for name, positions in store.by_location.items():
+        yield "location", name, [], films_text(store.locations['movie'].iloc[positions].astype(str))
+
+
+@st.cache_resource
+def build_search_index():
+    """Search index of the process, built from the knowledge store on the first query."""
+    from utils.knowledge_store import get_knowledge_store
+
+    return SearchIndex(list(store_entities(get_knowledge_store())))
+
+
+# ---- Sidebar search box ----
+def open_page(page):
+    st.session_state["page_select"] = page
+
+
+def show_search_box():
+    """Search field of the sidebar; each hit links to the page that shows the entity."""
+    query = st.sidebar.text_input("Search", placeholder="Movie, character, actor, location ...")
+    if not query.strip():
+        return
+
+    results = build_search_index().search(query)
+    if not results:
+        st.sidebar.caption("No matches.")
+        return
+    for i, entity in enumerate(results):
+        st.sidebar.button(
+            f"**{entity['name']}** ({entity['kind']})  \n{entity['detail']}",
+            key=f"search_result_{i}",
+            on_click=open_page,
+            args=(entity["page"],),
+            width="stretch"
+        )
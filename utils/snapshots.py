@@ -0,0 +1,168 @@
+# snapshots.py
+
+import hashlib
+from functools import lru_cache
+from pathlib import Path
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:  # pyarrow is optional, the loaders fall back to the CSV files
+    pa = None
+    feather = None
+
+"""
+Helper functions to convert the CSV datasets of the app into typed, columnar Arrow snapshots.
+The snapshots are built once by data_pipeline/s_build_columnar_snapshots.py and memory-mapped by the loaders
+in utils/data_loader.py. Movie and actor columns are stored as categoricals, coordinates as float32.
+Each snapshot stores the size and SHA-1 of its CSV source; if pyarrow is not installed or a snapshot is missing
+or outdated, the original CSV file is read instead. The SHA-1 of a CSV is computed once per process and file
+version (size, mtime), and a size mismatch marks a snapshot as outdated without reading the CSV at all.
+Snapshots are converted with zero-copy where possible: numeric columns stay views on the memory map and text
+columns stay Arrow-backed (string[pyarrow]) instead of being copied into Python objects.
+"""
+
+SNAPSHOT_DIR = Path("data/snapshots")
+
+# ---- Registry of all datasets loaded by the app ----
+DATASETS = {
+    "movies": {
+        "csv": "data/jamesbond_with_id.csv",
+        "sep": ";",
+        "categorical": ["Movie", "Bond"],
+    },
+    "german_titles": {
+        "csv": "extract_knowledge/movie_title_german/movie_title_en_de.csv",
+        "sep": ",",
+        "categorical": ["title_en"],
+    },
+    "posters": {
+        "csv": "extract_knowledge/movie_posters/movie_poster_url.csv",
+        "sep": ",",
+        "categorical": ["title"],
+    },
+    "geo_locations": {
+        "csv": "extract_knowledge/geocoded_locations/all_movies_geocoded.csv",
+        "sep": ",",
+        "categorical": ["movie"],
+        "float32": ["lat", "lon"],
+    },
+    "characters": {
+        "csv": "extract_knowledge/characters/all_movie_characters_with_image.csv",
+        "sep": ";",
+        "categorical": ["movie", "actor"],
+    },
+    "vehicles": {
+        "csv": "extract_knowledge/vehicles/all_movie_vehicles_with_image.csv",
+        "sep": ";",
+        "categorical": ["movie"],
+    },
+    "bond_girls": {
+        "csv": "extract_knowledge/bond_girls/bond_girls_with_images.csv",
+        "sep": ";",
+        "categorical": ["movie", "actress"],
+    },
+    "songs": {
+        "csv": "extract_knowledge/songs/all_movie_songs.csv",
+        "sep": ";",
+        "categorical": ["movie"],
+    },
+    "villains": {
+        "csv": "extract_knowledge/villains/all_villains_with_images.csv",
+        "sep": ";",
+        "categorical": ["Film", "Portrayed by"],
+    },
+}
+
+
+# ---- Apply the column types of a dataset ----
+def apply_dtypes(df, name):
+    """Cast movie/actor columns to categoricals and coordinates to float32."""
+    spec = DATASETS[name]
+    for col in spec.get("categorical", []):
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+    for col in spec.get("float32", []):
+        if col in df.columns:
+            df[col] = df[col].astype("float32")
+    return df
+
+
+# ---- Content hash of a CSV source ----
+@lru_cache(maxsize=64)
+def file_version_hash(csv_path, size, mtime_ns):
+    with open(csv_path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def source_hash(csv_path):
+    """SHA-1 of a CSV file, hashed again only if its size or modification time changed."""
+    stat = Path(csv_path).stat()
+    return file_version_hash(str(Path(csv_path).resolve()), stat.st_size, stat.st_mtime_ns)
+
+
+# ---- Arrow table -> DataFrame ----
+def arrow_types(arrow_type):
+    if pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type):
+        return pd.StringDtype("pyarrow")
+    return None
+
+
+def table_to_pandas(table):
+    """DataFrame over an Arrow table: numeric columns without copy, text columns as string[pyarrow]."""
+    return table.to_pandas(types_mapper=arrow_types, split_blocks=True)
+
+
+# ---- Path of the Arrow snapshot for a dataset ----
+def snapshot_path(name, base_dir=None):
+    path = SNAPSHOT_DIR / f"{name}.arrow"
+    return Path(base_dir) / path if base_dir else path
+
+
+# ---- Build one snapshot ----
+def build_snapshot(name, base_dir=None):
+    """Read the CSV of a dataset, apply the column types and write an uncompressed Arrow IPC file."""
+    if feather is None:
+        raise ImportError("pyarrow is required to build the columnar snapshots.")
+
+    spec = DATASETS[name]
+    csv_path = Path(base_dir) / spec["csv"] if base_dir else Path(spec["csv"])
+    df = apply_dtypes(pd.read_csv(csv_path, sep=spec["sep"], encoding="utf-8"), name)
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    metadata = dict(table.schema.metadata or {})
+    metadata[b"source_sha1"] = source_hash(csv_path).encode()
+    metadata[b"source_size"] = str(csv_path.stat().st_size).encode()
+    table = table.replace_schema_metadata(metadata)
+
+    output_file = snapshot_path(name, base_dir)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    # Uncompressed, so the file can be memory-mapped without decoding
+    feather.write_feather(table, output_file, compression="uncompressed")
+    return output_file
+
+
+# ---- Read a dataset (snapshot if available, CSV otherwise) ----
+def read_dataset(name, base_dir=None):
+    """
+    Return the dataset as DataFrame. The Arrow snapshot is memory-mapped if it exists and was built from the
+    current content of its CSV source; otherwise the CSV is parsed and typed on the fly.
+    Raises FileNotFoundError if neither the snapshot nor the CSV exists.
+    """
+    spec = DATASETS[name]
+    csv_path = Path(base_dir) / spec["csv"] if base_dir else Path(spec["csv"])
+    arrow_path = snapshot_path(name, base_dir)
+
+    if feather is not None and arrow_path.exists():
+        table = feather.read_table(arrow_path, memory_map=True)
+        metadata = table.schema.metadata or {}
+        if not csv_path.exists():
+            return table_to_pandas(table)
+        # A different size means a different source, without reading the CSV
+        if metadata.get(b"source_size", b"").decode() == str(csv_path.stat().st_size):
+            if metadata.get(b"source_sha1", b"").decode() == source_hash(csv_path):
+                return table_to_pandas(table)
+
+    df = pd.read_csv(csv_path, sep=spec["sep"], encoding="utf-8")
+    return apply_dtypes(df, name)
@@ -0,0 +1,114 @@
+# warmup.py
+
+import threading
+import time
+import streamlit as st
+
+"""
+Background cache warm-up, started once per server process by app.py at the end of the first script run,
+so the first page is rendered before the warm-up competes with it for the GIL and the import lock.
+A daemon thread calls the cached loaders and helpers of every page with the same arguments as the pages do,
+so the first visitor after a deploy or restart hits filled caches instead of paying for the computation.
+The thread pauses STEP_PAUSE seconds between the steps and downloads images with few workers, so reruns
+of the visitor's page are not held up.
+The pages read their tables from the materialized views of utils/page_views.py (written by the data pipeline,
+computed from the knowledge store of utils/knowledge_store.py if missing). The knowledge graph itself is persisted as binary snapshot
+(utils/kg_snapshot.py), the image thumbnails in the disk cache of utils/image_cache.py.
+"""
+
+STEP_PAUSE = 1.0  # seconds between two warm-up steps, leaves the GIL to the script runs of the visitors
+IMAGE_WORKERS = 2  # parallel thumbnail downloads of the warm-up
+
+
+# ---- Warm-up steps, one per page (in order of the page navigation) ----
+def warm_movie_page():
+    from utils.movie_overview import get_movie_overview
+
+    get_movie_overview()
+
+
+def warm_rdf_page():
+    from utils.data_loader import knowledge_graph_key
+    from utils.rdf_graph import get_movies_with_titles
+    from utils.rdf_views import view_graph
+    from pages.rdf_page import DEFAULT_MOVIES
+
+    graph_key = knowledge_graph_key()
+    default_uris = [movie[0] for movie in get_movies_with_titles(graph_key) if movie[3] in DEFAULT_MOVIES]
+    # Default view and selection of the page, then the unfiltered overview
+    view_graph(graph_key, "Movie overview", frozenset(default_uris), frozenset())
+    view_graph(graph_key, "Movie overview", frozenset(), frozenset())
+
+
+def warm_characters_page():
+    from utils.page_views import load_page_view
+    from utils.character_analysis import build_character_appearances, scatterplot_spec
+
+    appearances = build_character_appearances(load_page_view("characters"))
+    scatterplot_spec(appearances, 3)  # default of the "Minimum appearances" slider
+
+
+def warm_image_gallery_page():
+    from utils.image_gallery import (generate_vehicle_image_overview, generate_bond_girls_image_overview,
+                                     generate_villains_image_overview)
+
+    generate_vehicle_image_overview()
+    generate_bond_girls_image_overview()
+    generate_villains_image_overview()
+
+
+def warm_map_page():
+    from utils.page_views import load_page_view
+    from utils.location_index import build_location_index
+
+    build_location_index(load_page_view("locations")).view("Region")  # default zoom level of the page
+
+
+def warm_image_cache():
+    from concurrent.futures import ThreadPoolExecutor
+    from utils.data_loader import load_vehicle_data, load_bond_girls_data, load_villains_data, load_poster_urls
+    from utils.image_cache import cached_image_path, CARD_WIDTH, THUMBNAIL_WIDTH
+    from utils.page_views import load_page_view
+
+    # Card images of the gallery and movie pages, thumbnails of the movie table and the character details
+    card_urls = (list(load_vehicle_data()['image_url']) + list(load_bond_girls_data()['image_url'])
+                 + list(load_villains_data()['image_url']) + list(load_poster_urls()['poster_url']))
+    jobs = [(url, CARD_WIDTH) for url in card_urls]
+    jobs += [(url, THUMBNAIL_WIDTH) for url in load_poster_urls()['poster_url']]
+    jobs += [(url, THUMBNAIL_WIDTH) for url in load_page_view("characters")['image_url'].dropna().unique()]
+    with ThreadPoolExecutor(max_workers=IMAGE_WORKERS) as pool:
+        list(pool.map(lambda job: cached_image_path(*job), jobs))
+
+
+WARMUP_STEPS = {
+    "movie collection": warm_movie_page,
+    "rdf graph": warm_rdf_page,
+    "recurring characters": warm_characters_page,
+    "image collection": warm_image_gallery_page,
+    "film locations": warm_map_page,
+    "image thumbnails": warm_image_cache,
+}
+
+
+# ---- Run all steps ----
+def warm_up_caches():
+    """Run every warm-up step; a failing step is reported and skipped, the page computes it on demand."""
+    start = time.perf_counter()
+    for name, step in WARMUP_STEPS.items():
+        time.sleep(STEP_PAUSE)
+        step_start = time.perf_counter()
+        try:
+            step()
+        except Exception as e:
+            print(f"[warm-up] {name} failed: {e}")
+            continue
+        print(f"[warm-up] {name}: {time.perf_counter() - step_start:.2f}s")
+    print(f"[warm-up] done in {time.perf_counter() - start:.2f}s")
+
+
+# ---- Start once per server process ----
+@st.cache_resource
+def start_cache_warmup():
+    thread = threading.Thread(target=warm_up_caches, name="cache-warmup", daemon=True)
+    thread.start()
+    return thread